@@ -2,8 +2,8 @@
 
 from pydantic_settings import BaseSettings
 from pydantic import Field
+from functools import lru_cache
 from typing import Optional
-import os
 
 
 class Settings(BaseSettings):
@@ -24,12 +24,38 @@ class Settings(BaseSettings):
         default=100,
         description="Maximum upload file size in MB"
     )
+    ffmpeg_threads: int = Field(
+        default=0,
+        ge=0,
+        le=64,
+        description="Threads per FFmpeg/FFprobe process (0 divides the CPUs among parallel transcriptions)"
+    )
+    whisper_model: str = Field(
+        default="whisper-1",
+        description="OpenAI transcription model (whisper-1, gpt-4o-transcribe, gpt-4o-mini-transcribe)"
+    )
     
     # OpenAI Configuration
     openai_api_key: Optional[str] = Field(
         default=None,
         description="OpenAI API key for LangGraph LLM"
     )
+    openai_latency_optimized: bool = Field(
+        default=False,
+        description="Use OpenAI's priority (low-latency) service tier for chat models"
+    )
+    openai_max_concurrency: int = Field(
+        default=8,
+        description="Maximum simultaneous chat requests to OpenAI per process"
+    )
+    openai_requests_per_minute: int = Field(
+        default=0,
+        description="Chat requests per minute budget per process (0 disables rate limiting)"
+    )
+    skip_cleaning_threshold: int = Field(
+        default=2000,
+        description="Transcripts shorter than this many characters skip the cleaning LLM pass"
+    )
     
     # Application Configuration
     app_name: str = Field(
@@ -40,6 +66,10 @@ class Settings(BaseSettings):
         default=True,
         description="Debug mode"
     )
+    log_format: str = Field(
+        default="text",
+        description="Log output format: 'text' or 'json'"
+    )
     
     # Chroma Cloud Configuration
     chroma_api_key: Optional[str] = Field(
@@ -61,6 +91,11 @@ class Settings(BaseSettings):
         description="OpenAI embedding model"
     )
     
+    embedding_cache_path: str = Field(
+        default="./data/embedding_cache.db",
+        description="SQLite file that persists embeddings across restarts (empty keeps them in memory only)"
+    )
+    
     # RAG Configuration
     rag_top_k: int = Field(
         default=5,
@@ -74,15 +109,30 @@ class Settings(BaseSettings):
         default=200,
         description="Overlap between chunks"
     )
+    rag_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse answers for near-duplicate questions"
+    )
+    rag_cache_ttl_seconds: int = Field(
+        default=3600,
+        description="How long a cached answer stays valid"
+    )
     
     class Config:
         env_file = ".env"
         case_sensitive = False
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings, parsed from the environment once per process.
+    
+    Returns:
+        Cached Settings instance
+    """
+    return Settings()
+
 
-# Ensure required directories exist
-os.makedirs(settings.upload_dir, exist_ok=True)
-os.makedirs(os.path.dirname(settings.database_url.replace("sqlite:///", "")), exist_ok=True)
+# Global settings instance (same object as get_settings())
+settings = get_settings()
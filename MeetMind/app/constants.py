@@ -8,6 +8,12 @@ HTTP_TIMEOUT_LONG = 60.0
 # Chroma Cloud API
 CHROMA_API_BASE_URL = "https://api.trychroma.com"
 CHROMA_API_VERSION = "v1"
+CHROMA_ADD_BATCH_SIZE = 100  # Records per /add request
+CHROMA_ADD_MAX_CONCURRENCY = 4  # /add requests in flight per indexed meeting
+CHROMA_CONNECT_RETRIES = 3  # Transport-level retries of failed connection attempts
+CHROMA_THROTTLE_RETRIES = 3  # Retries of 429/503 responses
+CHROMA_BACKOFF_BASE_SECONDS = 0.5  # Doubled per attempt when Retry-After is absent
+CHROMA_BACKOFF_MAX_SECONDS = 10.0
 
 # Document Types
 DOC_TYPE_TRANSCRIPT = "transcript"
@@ -20,11 +26,56 @@ DOC_TYPE_KEY_POINT = "key_point"
 MODEL_GPT_4O_MINI = "gpt-4o-mini"
 MODEL_WHISPER = "whisper-1"
 MODEL_EMBEDDING = "text-embedding-3-small"
+EMBEDDING_BATCH_SIZE = 64  # Texts per embeddings API request
+EMBEDDING_MAX_CONCURRENCY = 4  # Embeddings requests in flight per indexed meeting
+
+# OpenAI service tier used when settings.openai_latency_optimized is enabled
+OPENAI_PRIORITY_SERVICE_TIER = "priority"
+
+# Retries per chat request; the SDK backs off exponentially and honors Retry-After
+OPENAI_MAX_RETRIES = 5
+WHISPER_TIMEOUT_SECONDS = 600.0  # Upload plus transcription of one 25 MB file
 
 # HTTP Connection Limits
 HTTP_MAX_KEEPALIVE = 5
 HTTP_MAX_CONNECTIONS = 10
+OPENAI_HTTP_MAX_KEEPALIVE = 50
+OPENAI_HTTP_MAX_CONNECTIONS = 100
+
+# Accepted Audio Uploads
+ALLOWED_AUDIO_EXTENSIONS = frozenset({".wav", ".mp3", ".webm", ".m4a", ".ogg"})
+ALLOWED_AUDIO_MIME_TYPES = frozenset({
+    "audio/wav", "audio/wave", "audio/x-wav",
+    "audio/mpeg", "audio/mp3",
+    "audio/webm",
+    "audio/mp4", "audio/x-m4a",
+    "audio/ogg"
+})
+
+# Meeting Processing Status
+MEETING_STATUS_PENDING = "pending"
+MEETING_STATUS_TRANSCRIBING = "transcribing"
+MEETING_STATUS_ANALYZING = "analyzing"
+MEETING_STATUS_COMPLETED = "completed"
+MEETING_STATUS_FAILED = "failed"
+# Unfinished meetings older than this are assumed lost (background task died
+# in a restart or crash) and no longer count as duplicates of a re-upload
+MEETING_PROCESSING_TIMEOUT_SECONDS = 3600
 
 # Context Snippet Settings
 MAX_SNIPPET_LENGTH = 200
 MAX_CONTEXT_SNIPPETS = 3
+MAX_CONTEXT_TOKENS = 6000  # Token budget for retrieved context sent to the LLM
+
+# Semantic Answer Cache
+EMBEDDING_CACHE_SIZE = 4096  # Embeddings kept in memory per process (query and document text)
+QA_CACHE_MAX_DISTANCE = 0.08  # Cosine distance; equivalent to similarity > 0.92
+
+# Near-Duplicate Search Result Cache
+SEARCH_CACHE_MIN_SIMILARITY = 0.95  # Cosine similarity that reuses a stored result
+SEARCH_CACHE_TTL_SECONDS = 300
+SEARCH_CACHE_ENTRIES_PER_USER = 32  # Scanned linearly on every search, so kept small
+SEARCH_CACHE_MAX_USERS = 1024
+
+# Request Logging
+SLOW_REQUEST_SECONDS = 0.5  # Successful requests slower than this are logged at INFO
@@ -1,17 +1,45 @@
 """Database setup and session management"""
 
-from sqlalchemy import create_engine
+import orjson
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from app.config import settings
+from app.config import get_settings
+
+settings = get_settings()
+
+_is_sqlite = settings.database_url.startswith("sqlite")
+
+
+def json_serializer(value) -> str:
+    """Encode JSON columns with orjson; SQLAlchemy expects a str"""
+    return orjson.dumps(value).decode()
+
 
 # Create SQLAlchemy engine
 engine = create_engine(
     settings.database_url,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {},
-    echo=settings.debug
+    connect_args={"check_same_thread": False} if _is_sqlite else {},
+    echo=settings.debug,
+    json_serializer=json_serializer,
+    json_deserializer=orjson.loads
 )
 
+
+if _is_sqlite:
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Use WAL so readers are not blocked by writers, enforce foreign keys, and tune the page cache"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA foreign_keys=ON")  # Off by default; needed for ON DELETE CASCADE
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-65536")  # 64 MB
+        cursor.close()
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -33,7 +61,51 @@ def get_db() -> Session:
         db.close()
 
 
-def init_db():
-    """Initialize database by creating all tables"""
+def get_session_factory() -> sessionmaker:
+    """
+    Dependency function to get the session factory for background tasks.
+    
+    Background work outlives the request, so it opens its own session
+    instead of reusing the request-scoped one from get_db.
+    
+    Returns:
+        sessionmaker bound to the application engine
+    """
+    return SessionLocal
+
+
+# Meeting columns added after the first release, with the DDL used to add them
+# to an existing table. Rows that predate background processing were analyzed
+# during the upload request, so they are backfilled as completed.
+MEETING_COLUMN_UPGRADES = {
+    "status": "VARCHAR(20) NOT NULL DEFAULT 'completed'",
+    "error": "TEXT",
+    "audio_hash": "VARCHAR(32)",
+}
+
+
+def init_db(bind: Engine = None):
+    """
+    Initialize database by creating all tables.
+    
+    create_all only creates missing tables, so columns and indexes added to
+    an existing meetings table since it was created are added here as well.
+    
+    Args:
+        bind: Engine to initialize (default: the application engine)
+    """
     from app.models import meeting  # Import models to register them
-    Base.metadata.create_all(bind=engine)
+    bind = bind if bind is not None else engine
+    Base.metadata.create_all(bind=bind)
+    
+    existing = {column["name"] for column in inspect(bind).get_columns("meetings")}
+    missing = [name for name in MEETING_COLUMN_UPGRADES if name not in existing]
+    if missing:
+        with bind.begin() as connection:
+            for name in missing:
+                connection.execute(text(
+                    f"ALTER TABLE meetings ADD COLUMN {name} {MEETING_COLUMN_UPGRADES[name]}"
+                ))
+    
+    for index in meeting.Meeting.__table__.indexes:
+        index.create(bind=bind, checkfirst=True)
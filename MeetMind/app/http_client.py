@@ -0,0 +1,74 @@
+"""Shared HTTP clients for OpenAI and Chroma Cloud requests"""
+
+from typing import Optional
+import httpx
+
+from app.constants import (
+    CHROMA_CONNECT_RETRIES,
+    HTTP_TIMEOUT_MEDIUM,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE,
+    OPENAI_HTTP_MAX_CONNECTIONS,
+    OPENAI_HTTP_MAX_KEEPALIVE
+)
+
+_openai_async_client: Optional[httpx.AsyncClient] = None
+_chroma_async_client: Optional[httpx.AsyncClient] = None
+
+
+def get_openai_async_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide async HTTP client used by every OpenAI chat and embeddings model.
+
+    HTTP/2 lets concurrent LLM calls multiplex over one pooled connection
+    instead of each paying its own TCP and TLS handshake.
+
+    Returns:
+        Shared httpx.AsyncClient
+    """
+    global _openai_async_client
+    if _openai_async_client is None or _openai_async_client.is_closed:
+        _openai_async_client = httpx.AsyncClient(
+            http2=True,
+            timeout=HTTP_TIMEOUT_MEDIUM,
+            limits=httpx.Limits(
+                max_connections=OPENAI_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=OPENAI_HTTP_MAX_KEEPALIVE
+            )
+        )
+    return _openai_async_client
+
+
+def get_chroma_async_client() -> httpx.AsyncClient:
+    """
+    Get the process-wide async HTTP client used for Chroma Cloud requests.
+    
+    Failed connection attempts are retried by the transport itself; throttled
+    responses are retried by VectorStoreService.
+    
+    Returns:
+        Shared httpx.AsyncClient
+    """
+    global _chroma_async_client
+    if _chroma_async_client is None or _chroma_async_client.is_closed:
+        _chroma_async_client = httpx.AsyncClient(
+            timeout=HTTP_TIMEOUT_MEDIUM,
+            transport=httpx.AsyncHTTPTransport(
+                retries=CHROMA_CONNECT_RETRIES,
+                limits=httpx.Limits(
+                    max_connections=HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=HTTP_MAX_KEEPALIVE
+                )
+            )
+        )
+    return _chroma_async_client
+
+
+async def close_http_clients() -> None:
+    """Close the shared clients on application shutdown"""
+    global _openai_async_client, _chroma_async_client
+    for client in (_openai_async_client, _chroma_async_client):
+        if client is not None:
+            await client.aclose()
+    _openai_async_client = None
+    _chroma_async_client = None
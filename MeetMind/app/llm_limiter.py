@@ -0,0 +1,92 @@
+"""Process-wide throttle for outgoing OpenAI chat requests"""
+
+import asyncio
+import time
+from typing import Optional
+
+from app.config import get_settings
+
+settings = get_settings()
+
+
+class LLMRequestLimiter:
+    """
+    Caps in-flight chat requests and spaces them to a requests-per-minute budget.
+    
+    Used as ``async with limiter:`` around each LLM call. Bursts beyond the
+    concurrency cap or the RPM token bucket wait here instead of turning into
+    429 responses and SDK retry back-off.
+    """
+    
+    def __init__(self, max_concurrency: int, requests_per_minute: int = 0):
+        """
+        Initialize the limiter.
+        
+        Args:
+            max_concurrency: Maximum simultaneous requests
+            requests_per_minute: Sustained request budget (0 disables rate limiting)
+        """
+        self.max_concurrency = max_concurrency
+        self.requests_per_minute = requests_per_minute
+        self._tokens = float(requests_per_minute)
+        self._updated = time.monotonic()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._rate_lock: Optional[asyncio.Lock] = None
+    
+    def _bind_loop(self) -> None:
+        """Create the asyncio primitives for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._rate_lock = asyncio.Lock()
+    
+    async def _wait_for_token(self) -> None:
+        """Take one request from the token bucket, sleeping until one is available"""
+        async with self._rate_lock:
+            now = time.monotonic()
+            refill = (now - self._updated) * self.requests_per_minute / 60
+            self._tokens = min(float(self.requests_per_minute), self._tokens + refill)
+            self._updated = now
+            
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            
+            await asyncio.sleep((1 - self._tokens) * 60 / self.requests_per_minute)
+            self._tokens = 0.0
+            self._updated = time.monotonic()
+    
+    async def __aenter__(self) -> "LLMRequestLimiter":
+        self._bind_loop()
+        await self._semaphore.acquire()
+        try:
+            if self.requests_per_minute > 0:
+                await self._wait_for_token()
+        except BaseException:
+            self._semaphore.release()
+            raise
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self._semaphore.release()
+
+
+_llm_limiter: Optional[LLMRequestLimiter] = None
+
+
+def get_llm_limiter() -> LLMRequestLimiter:
+    """
+    Get the limiter shared by every chat model in the process.
+    
+    Returns:
+        Shared LLMRequestLimiter configured from settings
+    """
+    global _llm_limiter
+    if _llm_limiter is None:
+        _llm_limiter = LLMRequestLimiter(
+            settings.openai_max_concurrency,
+            settings.openai_requests_per_minute
+        )
+    return _llm_limiter
@@ -2,7 +2,46 @@
 
 import logging
 import sys
-from app.config import settings
+from contextvars import ContextVar
+import orjson
+from app.config import get_settings
+
+settings = get_settings()
+
+# Request ID bound by the timing middleware for the duration of each request
+request_id_var: ContextVar[str] = ContextVar("request_id", default="-")
+
+# Attributes present on every LogRecord; anything else was passed via `extra`
+_RESERVED_ATTRS = frozenset(
+    logging.LogRecord("", 0, "", 0, "", (), None).__dict__
+) | {"message", "asctime", "request_id"}
+
+
+class RequestIdFilter(logging.Filter):
+    """Inject the current request ID into every log record"""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """Render log records as single-line JSON objects"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "request_id": getattr(record, "request_id", "-"),
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS:
+                payload[key] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(payload, default=str).decode()
 
 
 def setup_logger(name: str) -> logging.Logger:
@@ -26,12 +65,16 @@ def setup_logger(name: str) -> logging.Logger:
     
     # Console handler
     handler = logging.StreamHandler(sys.stdout)
+    handler.addFilter(RequestIdFilter())
     
-    # Formatter with timestamp, name, level, and message
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    if settings.log_format == "json":
+        formatter = JsonFormatter()
+    else:
+        # Formatter with timestamp, name, level, request ID and message
+        formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
     handler.setFormatter(formatter)
     
     logger.addHandler(handler)
@@ -1,25 +1,97 @@
 """FastAPI application with improved configuration and middleware"""
 
+import asyncio
+import logging
+import os
 import time
+import uuid
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from app.config import settings
+from app.config import get_settings
+from app.constants import SLOW_REQUEST_SECONDS
+from app.exceptions import VectorStoreError, EmbeddingError, CollectionError
 from app.database import init_db
-from app.routers import meetings_router
-from app.routers import rag
-from app.logger import setup_logger
+from app.logger import setup_logger, request_id_var
+from app.http_client import close_http_clients
+
+settings = get_settings()
+
+# Settings read on hot paths, bound once
+_APP_NAME = settings.app_name
+_DEBUG = settings.debug
 
 logger = setup_logger(__name__)
 
+# Routers are imported lazily on startup; guards against double registration
+_routers_registered = False
+
+
+def register_routers(app: FastAPI) -> None:
+    """
+    Import and register API routers.
+    
+    Router modules transitively pull in SQLAlchemy models, LangGraph and the
+    OpenAI/Chroma clients, so they are imported on startup rather than when
+    this module is imported.
+    
+    Args:
+        app: FastAPI application to register routers on
+    """
+    global _routers_registered
+    if _routers_registered:
+        return
+    
+    from app.routers import meetings_router
+    from app.routers import rag
+    
+    app.include_router(meetings_router)
+    app.include_router(rag.router)
+    _routers_registered = True
+    
+    logger.info("Routers registered: meetings, rag")
+
+
+def warm_schemas(app: FastAPI) -> None:
+    """
+    Build the OpenAPI document and response-model JSON schemas up front.
+    
+    Otherwise the first request to each endpoint (and to /docs) pays for
+    schema generation.
+    
+    Args:
+        app: FastAPI application with routers registered
+    """
+    from app.schemas.meeting import (
+        MeetingUploadResponse,
+        MeetingDetailResponse,
+        UserMeetingsResponse
+    )
+    from app.schemas.rag import QueryResponse
+    
+    app.openapi()
+    for model in (MeetingUploadResponse, MeetingDetailResponse, UserMeetingsResponse, QueryResponse):
+        model.model_json_schema()
+    
+    logger.debug("OpenAPI and response schemas generated")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events"""
     logger.info(f"Starting {settings.app_name}...")
     logger.info(f"Debug mode: {settings.debug}")
+    
+    # Ensure required directories exist
+    os.makedirs(settings.upload_dir, exist_ok=True)
+    if settings.database_url.startswith("sqlite:///"):
+        db_dir = os.path.dirname(settings.database_url.replace("sqlite:///", "", 1))
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+    
     logger.info("Initializing database...")
     
     try:
@@ -29,73 +101,170 @@ async def lifespan(app: FastAPI):
         logger.error(f"Database initialization failed: {e}", exc_info=True)
         raise
     
+    register_routers(app)
+    warm_schemas(app)
+    
+    # Build the RAG service once so its HTTP clients stay warm across requests
+    try:
+        from app.services.rag_service import RAGService
+        app.state.rag_service = RAGService()
+    except Exception as e:
+        logger.warning(f"RAG service not available: {e}")
+        app.state.rag_service = None
+    
+    # tiktoken downloads its BPE file on first use; do it now, not in the first /query
+    if app.state.rag_service is not None:
+        try:
+            from app.services.rag_service import _get_encoding
+            await asyncio.to_thread(_get_encoding)
+        except Exception as e:
+            logger.warning(f"Tokenizer preload failed; it will load on the first query: {e}")
+    
     yield
     
     logger.info(f"Shutting down {settings.app_name}...")
+    await close_http_clients()
 
 
 # Create FastAPI application
 app = FastAPI(
-    title=settings.app_name,
+    title=_APP_NAME,
     description="AI-powered meeting assistant backend with RAG capabilities",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
-allowed_origins = ["*"] if settings.debug else [
+allowed_origins = frozenset({"*"}) if _DEBUG else frozenset({
     "http://localhost:3000",
     "http://localhost:5173",
     "http://localhost:8080"
-]
+})
+
+
+class OriginGatedCORSMiddleware:
+    """
+    Pure ASGI wrapper that only routes browser requests through CORSMiddleware.
+    
+    Requests without an Origin header (health probes, server-to-server calls)
+    never need CORS headers, so they go straight to the application.
+    """
+    
+    def __init__(self, app: ASGIApp, **cors_options):
+        self.app = app
+        self.cors_app = CORSMiddleware(app, **cors_options)
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http":
+            for name, _ in scope["headers"]:
+                if name == b"origin":
+                    await self.cors_app(scope, receive, send)
+                    return
+        await self.app(scope, receive, send)
+
 
 app.add_middleware(
-    CORSMiddleware,
+    OriginGatedCORSMiddleware,
     allow_origins=allowed_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-logger.info(f"CORS configured with origins: {allowed_origins}")
+logger.info(f"CORS configured with origins: {sorted(allowed_origins)}")
+
+
+# Probe endpoints that bypass request logging and timing entirely
+_SKIP_PATHS = frozenset({"/health", "/"})
 
 
 # Request logging middleware
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    """Log all HTTP requests with timing"""
-    start_time = time.time()
+class TimingMiddleware:
+    """Pure ASGI middleware that logs requests and stamps X-Process-Time"""
     
-    # Log request
-    logger.info(f"→ {request.method} {request.url.path}")
+    def __init__(self, app: ASGIApp):
+        self.app = app
     
-    try:
-        response = await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["path"] in _SKIP_PATHS:
+            await self.app(scope, receive, send)
+            return
         
-        # Calculate processing time
-        process_time = time.time() - start_time
+        method = scope["method"]
+        path = scope["path"]
+        start = time.perf_counter()
+        status_code = None
+        token = request_id_var.set(uuid.uuid4().hex)
         
-        # Log response
-        logger.info(
-            f"← {request.method} {request.url.path} - "
-            f"Status: {response.status_code} - "
-            f"Time: {process_time:.3f}s"
-        )
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append(
+                    (b"x-process-time", f"{(time.perf_counter() - start):.3f}".encode())
+                )
+                message["headers"] = headers
+            await send(message)
         
-        # Add timing header
-        response.headers["X-Process-Time"] = f"{process_time:.3f}"
-        
-        return response
-    
-    except Exception as e:
-        process_time = time.time() - start_time
-        logger.error(
-            f"✗ {request.method} {request.url.path} - "
-            f"Error: {str(e)} - "
-            f"Time: {process_time:.3f}s",
-            exc_info=True
-        )
-        raise
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            process_time = time.perf_counter() - start
+            logger.error(
+                "✗ %s %s - Error: %s - Time: %.3fs",
+                method, path, e, process_time,
+                extra={"method": method, "path": path, "ms": process_time * 1000},
+                exc_info=True
+            )
+            raise
+        else:
+            # Log response; only errors and slow requests are logged at INFO
+            process_time = time.perf_counter() - start
+            level = (
+                logging.INFO
+                if status_code is None or status_code >= 400 or process_time > SLOW_REQUEST_SECONDS
+                else logging.DEBUG
+            )
+            logger.log(
+                level,
+                "← %s %s - Status: %s - Time: %.3fs",
+                method, path, status_code, process_time,
+                extra={
+                    "method": method,
+                    "path": path,
+                    "status": status_code,
+                    "ms": process_time * 1000
+                }
+            )
+        finally:
+            request_id_var.reset(token)
+
+
+app.add_middleware(TimingMiddleware)
+
+
+# Service errors mapped to (status_code, detail); shared by every router
+_SERVICE_ERROR_RESPONSES = {
+    EmbeddingError: (503, "Embedding service unavailable. Please try again later."),
+    VectorStoreError: (503, "Vector store unavailable. Please try again later."),
+    CollectionError: (503, "Vector store unavailable. Please try again later."),
+}
+
+
+async def service_exception_handler(request: Request, exc: Exception):
+    """Translate upstream service failures into their HTTP responses"""
+    # Starlette also routes subclasses here, so use the closest mapped base class
+    status_code, detail = next(
+        _SERVICE_ERROR_RESPONSES[cls] for cls in type(exc).__mro__ if cls in _SERVICE_ERROR_RESPONSES
+    )
+    logger.error(f"{type(exc).__name__} in {request.method} {request.url.path}: {exc}")
+    return ORJSONResponse(status_code=status_code, content={"detail": detail})
+
+
+for _exc_class in _SERVICE_ERROR_RESPONSES:
+    app.add_exception_handler(_exc_class, service_exception_handler)
 
 
 # Global exception handler
@@ -106,7 +275,7 @@ async def global_exception_handler(request: Request, exc: Exception):
         f"Unhandled exception in {request.method} {request.url.path}: {exc}",
         exc_info=True
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "detail": "Internal server error",
@@ -115,34 +284,32 @@ async def global_exception_handler(request: Request, exc: Exception):
     )
 
 
-# Include routers
-app.include_router(meetings_router)
-app.include_router(rag.router)
-
-logger.info("Routers registered: meetings, rag")
+# Static probe payloads, built once at import
+_ROOT_RESPONSE = {
+    "message": f"Welcome to {_APP_NAME}",
+    "version": "1.0.0",
+    "status": "running",
+    "endpoints": {
+        "health": "/health",
+        "docs": "/docs",
+        "meetings": "/meetings",
+        "query": "/query"
+    }
+}
+_HEALTH_RESPONSE = {
+    "status": "healthy",
+    "service": _APP_NAME,
+    "version": "1.0.0"
+}
 
 
 @app.get("/")
 def root():
     """Root endpoint"""
-    return {
-        "message": f"Welcome to {settings.app_name}",
-        "version": "1.0.0",
-        "status": "running",
-        "endpoints": {
-            "health": "/health",
-            "docs": "/docs",
-            "meetings": "/meetings",
-            "query": "/query"
-        }
-    }
+    return _ROOT_RESPONSE
 
 
 @app.get("/health")
 def health_check():
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "service": settings.app_name,
-        "version": "1.0.0"
-    }
+    return _HEALTH_RESPONSE
@@ -1,17 +1,28 @@
 """SQLAlchemy ORM models for users and meetings"""
 
-from sqlalchemy import Column, String, Text, ForeignKey, DateTime, Index
-from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy import Column, String, Text, ForeignKey, DateTime, Index, JSON
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, JSONB
 from sqlalchemy.orm import relationship
-from datetime import datetime
-import uuid
+from sqlalchemy.sql import func
+from typing import List
+import uuid_utils
 
 from app.database import Base
+from app.constants import MEETING_STATUS_PENDING
 
 
 def generate_uuid():
-    """Generate UUID as string for compatibility with SQLite"""
-    return str(uuid.uuid4())
+    """
+    Generate a time-ordered UUIDv7 as a 32-character hex string.
+    
+    New keys sort after existing ones, so primary-key inserts append to the
+    rightmost B-tree leaf instead of scattering across the index.
+    """
+    return uuid_utils.uuid7().hex
+
+
+# Native JSON lists; JSONB on PostgreSQL so they can be queried server-side
+JSONList = JSON().with_variant(JSONB(), "postgresql")
 
 
 class User(Base):
@@ -20,10 +31,15 @@ class User(Base):
     __tablename__ = "users"
     
     id = Column(String(36), primary_key=True, default=generate_uuid)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     
-    # Relationship to meetings
-    meetings = relationship("Meeting", back_populates="user", cascade="all, delete-orphan")
+    # Relationship to meetings; the database cascades deletes, so they are not loaded first
+    meetings = relationship(
+        "Meeting",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True
+    )
     
     def __repr__(self):
         return f"<User(id={self.id})>"
@@ -34,23 +50,43 @@ class Meeting(Base):
     
     __tablename__ = "meetings"
     
-    id = Column(String(36), primary_key=True, default=generate_uuid)
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=False)
+    id = Column(String(32), primary_key=True, default=generate_uuid)
+    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     audio_filename = Column(String(255), nullable=False)
     transcript = Column(Text, nullable=True)
     summary = Column(Text, nullable=True)
-    decisions = Column(Text, nullable=True)  # JSON stored as text
-    action_items = Column(Text, nullable=True)  # JSON stored as text
-    key_points = Column(Text, nullable=True)  # JSON stored as text
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    decisions = Column(JSONList, nullable=True)
+    action_items = Column(JSONList, nullable=True)
+    key_points = Column(JSONList, nullable=True)
+    status = Column(String(20), nullable=False, default=MEETING_STATUS_PENDING)  # Background processing phase
+    error = Column(Text, nullable=True)  # Failure reason when status is "failed"
+    audio_hash = Column(String(32), nullable=True)  # BLAKE2b-128 of the uploaded audio
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     
     # Relationship to user
     user = relationship("User", back_populates="meetings")
     
-    # Index for faster user queries
+    # Serves the per-user listing (filter on user_id, newest first) from one index range scan
     __table_args__ = (
-        Index('idx_meetings_user_id', 'user_id'),
+        Index('idx_meetings_user_created', 'user_id', 'created_at'),
+        # Finds re-uploads of the same audio by the same user
+        Index('idx_meetings_user_audio_hash', 'user_id', 'audio_hash'),
     )
     
+    @property
+    def decisions_list(self) -> List[str]:
+        """Decisions, or an empty list if unset"""
+        return self.decisions or []
+    
+    @property
+    def action_items_list(self) -> List[str]:
+        """Action items, or an empty list if unset"""
+        return self.action_items or []
+    
+    @property
+    def key_points_list(self) -> List[str]:
+        """Key points, or an empty list if unset"""
+        return self.key_points or []
+    
     def __repr__(self):
         return f"<Meeting(id={self.id}, user_id={self.user_id}, filename={self.audio_filename})>"
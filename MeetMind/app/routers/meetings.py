@@ -1,11 +1,11 @@
 """API routes for meeting operations"""
 
-from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException
-from sqlalchemy.orm import Session
-from typing import List
-import json
+from fastapi import APIRouter, BackgroundTasks, Depends, UploadFile, File, Form, HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, sessionmaker
+from typing import Iterator, List
 
-from app.database import get_db
+from app.database import get_db, get_session_factory
 from app.schemas.meeting import (
     MeetingUploadResponse,
     MeetingDetailResponse,
@@ -16,42 +16,53 @@ from app.services.meeting_service import MeetingService
 
 router = APIRouter(prefix="/meetings", tags=["meetings"])
 
+# Transcripts are streamed in 64 KiB pieces
+TRANSCRIPT_CHUNK_SIZE = 64 * 1024
 
-@router.post("/upload", response_model=MeetingUploadResponse)
+
+@router.post("/upload", response_model=MeetingUploadResponse, status_code=202)
 async def upload_meeting(
+    background_tasks: BackgroundTasks,
     user_id: str = Form(..., description="User identifier"),
     audio_file: UploadFile = File(..., description="Audio file to process"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    session_factory: sessionmaker = Depends(get_session_factory)
 ):
     """
-    Upload and process a meeting audio file.
+    Upload a meeting audio file for processing.
     
-    This endpoint:
-    1. Validates and saves the audio file
-    2. Transcribes it using Whisper
-    3. Analyzes it with LangGraph
-    4. Stores results in the database
+    This endpoint validates and saves the audio file, records a pending
+    meeting and returns immediately. Re-uploading identical audio returns
+    the existing meeting and its current status. A background task then:
+    1. Transcribes it using Whisper
+    2. Analyzes it with LangGraph
+    3. Stores results in the database
+    
+    Poll GET /meetings/{meeting_id} until status is "completed" or "failed".
     
     Args:
+        background_tasks: Tasks run after the response is sent
         user_id: Unique identifier for the user
         audio_file: Audio file (wav, mp3, webm, m4a, ogg)
         db: Database session
+        session_factory: Session factory for the background task
         
     Returns:
-        Complete meeting analysis including transcript, summary, decisions, action items, and key points
+        Meeting ID and its initial processing status
     """
     meeting_service = MeetingService()
-    meeting = await meeting_service.process_meeting(db, user_id, audio_file)
+    meeting, audio_path = await meeting_service.create_meeting(db, user_id, audio_file)
+    
+    # audio_path is None when the same audio was already uploaded
+    if audio_path is not None:
+        background_tasks.add_task(
+            meeting_service.process_meeting, session_factory, meeting.id, user_id, audio_path
+        )
     
-    return MeetingUploadResponse(
+    return MeetingUploadResponse.model_construct(
         meeting_id=meeting.id,
         user_id=meeting.user_id,
-        status="completed",
-        transcript=meeting.transcript,
-        summary=meeting.summary,
-        decisions=json.loads(meeting.decisions) if meeting.decisions else [],
-        action_items=json.loads(meeting.action_items) if meeting.action_items else [],
-        key_points=json.loads(meeting.key_points) if meeting.key_points else [],
+        status=meeting.status,
         created_at=meeting.created_at
     )
 
@@ -74,17 +85,19 @@ def get_user_meetings(
     meeting_service = MeetingService()
     meetings = meeting_service.get_user_meetings(db, user_id)
     
+    # Rows come straight from the database, so validation can be skipped
     meeting_items = [
-        MeetingListItem(
+        MeetingListItem.model_construct(
             meeting_id=m.id,
             audio_filename=m.audio_filename,
+            status=m.status,
             summary=m.summary or "",
             created_at=m.created_at
         )
         for m in meetings
     ]
     
-    return UserMeetingsResponse(
+    return UserMeetingsResponse.model_construct(
         user_id=user_id,
         meetings=meeting_items,
         total=len(meeting_items)
@@ -95,30 +108,71 @@ def get_user_meetings(
 def get_meeting_detail(
     meeting_id: str,
     user_id: str,
+    include_transcript: bool = False,
     db: Session = Depends(get_db)
 ):
     """
     Get detailed information about a specific meeting.
     
+    The transcript can be megabytes long, so it is omitted unless requested;
+    use GET /meetings/{meeting_id}/transcript to stream it instead.
+    
     Args:
         meeting_id: Meeting identifier
         user_id: User identifier (for authorization)
+        include_transcript: Include the full transcript in the response
         db: Database session
         
     Returns:
         Complete meeting details
     """
     meeting_service = MeetingService()
-    meeting = meeting_service.get_meeting_by_id(db, meeting_id, user_id)
+    meeting = meeting_service.get_meeting_by_id(
+        db, meeting_id, user_id, load_transcript=include_transcript
+    )
     
-    return MeetingDetailResponse(
+    return MeetingDetailResponse.model_construct(
         meeting_id=meeting.id,
         user_id=meeting.user_id,
         audio_filename=meeting.audio_filename,
-        transcript=meeting.transcript or "",
+        status=meeting.status,
+        error=meeting.error,
+        transcript=(meeting.transcript or "") if include_transcript else None,
         summary=meeting.summary or "",
-        decisions=json.loads(meeting.decisions) if meeting.decisions else [],
-        action_items=json.loads(meeting.action_items) if meeting.action_items else [],
-        key_points=json.loads(meeting.key_points) if meeting.key_points else [],
+        decisions=meeting.decisions_list,
+        action_items=meeting.action_items_list,
+        key_points=meeting.key_points_list,
         created_at=meeting.created_at
     )
+
+
+def _iter_transcript(transcript: str) -> Iterator[bytes]:
+    """Yield a transcript as UTF-8 encoded chunks"""
+    for start in range(0, len(transcript), TRANSCRIPT_CHUNK_SIZE):
+        yield transcript[start:start + TRANSCRIPT_CHUNK_SIZE].encode("utf-8")
+
+
+@router.get("/{meeting_id}/transcript")
+def get_meeting_transcript(
+    meeting_id: str,
+    user_id: str,
+    db: Session = Depends(get_db)
+):
+    """
+    Stream the full transcript of a meeting as plain text.
+    
+    Args:
+        meeting_id: Meeting identifier
+        user_id: User identifier (for authorization)
+        db: Database session
+        
+    Returns:
+        Streaming plain-text response with the transcript
+    """
+    meeting_service = MeetingService()
+    meeting = meeting_service.get_meeting_by_id(db, meeting_id, user_id)
+    
+    return StreamingResponse(
+        _iter_transcript(meeting.transcript or ""),
+        media_type="text/plain; charset=utf-8"
+    )
@@ -1,35 +1,42 @@
 """RAG query API endpoints with improved error handling"""
 
-from fastapi import APIRouter, HTTPException, Depends
+from typing import AsyncIterator
+from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.responses import StreamingResponse
 
 from app.schemas.rag import QueryRequest, QueryResponse
 from app.services.rag_service import RAGService
-from app.exceptions import VectorStoreError, EmbeddingError
+from app.exceptions import VectorStoreError, EmbeddingError, CollectionError
 from app.logger import setup_logger
 
 logger = setup_logger(__name__)
 router = APIRouter(prefix="/query", tags=["rag"])
 
-# Singleton RAG service instance
-_rag_service_instance = None
 
-
-def get_rag_service() -> RAGService:
+def get_rag_service(request: Request) -> RAGService:
     """
-    Get or create RAG service instance (dependency injection).
+    Get the RAG service created at application startup (dependency injection).
+    
+    Args:
+        request: Incoming request, used to reach application state
     
     Returns:
         RAGService instance
+        
+    Raises:
+        HTTPException: If the RAG service could not be initialized
     """
-    global _rag_service_instance
-    if _rag_service_instance is None:
-        logger.info("Creating RAG service instance")
-        _rag_service_instance = RAGService()
-    return _rag_service_instance
+    rag_service = getattr(request.app.state, "rag_service", None)
+    if rag_service is None:
+        raise HTTPException(
+            status_code=503,
+            detail="RAG service unavailable. Check vector store configuration."
+        )
+    return rag_service
 
 
 @router.post("/", response_model=QueryResponse)
-def query_meetings(
+async def query_meetings(
     request: QueryRequest,
     rag_service: RAGService = Depends(get_rag_service)
 ):
@@ -64,16 +71,13 @@ def query_meetings(
     """
     logger.info(f"Received query request from user {request.user_id}")
     
+    # Embedding/vector store failures are re-raised and mapped to 503 by the app-level handlers
     try:
-        result = rag_service.query_meetings(
+        result = await rag_service.query_meetings(
             user_id=request.user_id,
             query=request.query,
             top_k=request.top_k
         )
-        
-        logger.info(f"Query completed successfully for user {request.user_id}")
-        return QueryResponse(**result)
-    
     except ValueError as e:
         # Invalid input parameters
         logger.warning(f"Invalid input from user {request.user_id}: {e}")
@@ -81,25 +85,74 @@ def query_meetings(
             status_code=400,
             detail=f"Invalid request: {str(e)}"
         )
-    
-    except EmbeddingError as e:
-        # Embedding generation failed
-        logger.error(f"Embedding error for user {request.user_id}: {e}")
+    except (EmbeddingError, VectorStoreError, CollectionError):
+        raise
+    except Exception as e:
+        # Unexpected error; answered here so the response still passes
+        # through the CORS and timing middleware
+        logger.error(
+            f"Unexpected error for user {request.user_id}: {e}",
+            exc_info=True
+        )
         raise HTTPException(
-            status_code=503,
-            detail="Embedding service unavailable. Please try again later."
+            status_code=500,
+            detail="Internal server error. Please try again later."
         )
     
-    except VectorStoreError as e:
-        # Vector store operation failed
-        logger.error(f"Vector store error for user {request.user_id}: {e}")
+    logger.info(f"Query completed successfully for user {request.user_id}")
+    return QueryResponse(**result)
+
+
+async def _prepend(first_event: str, events: AsyncIterator[str]) -> AsyncIterator[str]:
+    """Re-attach an already consumed first event to the rest of the stream"""
+    yield first_event
+    async for event in events:
+        yield event
+
+
+@router.post("/stream")
+async def query_meetings_stream(
+    request: QueryRequest,
+    rag_service: RAGService = Depends(get_rag_service)
+):
+    """
+    Query user's meeting data and stream the answer as server-sent events.
+    
+    Same retrieval as ``POST /query/``, but answer tokens are sent as they are
+    generated (``event: token``), followed by a final ``event: sources`` with
+    the source meeting IDs and context snippets.
+    
+    Args:
+        request: Query request with user_id, query, and optional top_k
+        rag_service: Injected RAG service instance
+        
+    Returns:
+        text/event-stream response
+        
+    Raises:
+        HTTPException: 400 for invalid input; retrieval failures map to 503
+    """
+    logger.info(f"Received streaming query request from user {request.user_id}")
+    
+    events = rag_service.query_meetings_stream(
+        user_id=request.user_id,
+        query=request.query,
+        top_k=request.top_k
+    )
+    
+    # Pull the first event here so validation and retrieval errors still
+    # produce a proper status code instead of a broken stream
+    try:
+        first_event = await events.__anext__()
+    except ValueError as e:
+        logger.warning(f"Invalid input from user {request.user_id}: {e}")
         raise HTTPException(
-            status_code=503,
-            detail="Vector store unavailable. Please try again later."
+            status_code=400,
+            detail=f"Invalid request: {str(e)}"
         )
-    
+    except (EmbeddingError, VectorStoreError, CollectionError):
+        raise
     except Exception as e:
-        # Unexpected error
         logger.error(
             f"Unexpected error for user {request.user_id}: {e}",
             exc_info=True
@@ -108,3 +161,9 @@ def query_meetings(
             status_code=500,
             detail="Internal server error. Please try again later."
         )
+    
+    return StreamingResponse(
+        _prepend(first_event, events),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
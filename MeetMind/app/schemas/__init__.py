@@ -1,15 +1,5 @@
-"""Schemas package"""
+"""Schemas package
 
-from app.schemas.meeting import (
-    MeetingUploadResponse,
-    MeetingDetailResponse,
-    UserMeetingsResponse,
-    MeetingListItem
-)
-
-__all__ = [
-    "MeetingUploadResponse",
-    "MeetingDetailResponse",
-    "UserMeetingsResponse",
-    "MeetingListItem"
-]
+Schemas are imported from their modules directly (e.g. app.schemas.meeting)
+so that importing the package does not build every Pydantic model.
+"""
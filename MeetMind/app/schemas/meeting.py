@@ -5,18 +5,20 @@ from typing import List, Optional
 from datetime import datetime
 
 
+# server_default=func.now() is UTC; SQLite stores it without an offset
+CREATED_AT_DESCRIPTION = (
+    "Meeting creation timestamp in UTC (timezone-aware on PostgreSQL; "
+    "naive on SQLite, which stores no offset)"
+)
+
+
 class MeetingUploadResponse(BaseModel):
-    """Response schema for meeting upload endpoint"""
+    """Response schema for meeting upload endpoint (processing continues in the background)"""
     
     meeting_id: str = Field(..., description="Unique meeting identifier")
     user_id: str = Field(..., description="User identifier")
-    status: str = Field(default="completed", description="Processing status")
-    transcript: str = Field(..., description="Full meeting transcript")
-    summary: str = Field(..., description="Meeting summary")
-    decisions: List[str] = Field(default_factory=list, description="Decisions made in meeting")
-    action_items: List[str] = Field(default_factory=list, description="Action items identified")
-    key_points: List[str] = Field(default_factory=list, description="Key discussion points")
-    created_at: datetime = Field(..., description="Meeting creation timestamp")
+    status: str = Field(default="pending", description="Processing status")
+    created_at: datetime = Field(..., description=CREATED_AT_DESCRIPTION)
     
     class Config:
         from_attributes = True
@@ -28,12 +30,17 @@ class MeetingDetailResponse(BaseModel):
     meeting_id: str = Field(..., description="Unique meeting identifier")
     user_id: str = Field(..., description="User identifier")
     audio_filename: str = Field(..., description="Original audio filename")
-    transcript: str = Field(..., description="Full meeting transcript")
+    status: str = Field(..., description="Processing status: pending, transcribing, analyzing, completed or failed")
+    error: Optional[str] = Field(default=None, description="Failure reason when status is failed")
+    transcript: Optional[str] = Field(
+        default=None,
+        description="Full meeting transcript (only when include_transcript=true)"
+    )
     summary: str = Field(..., description="Meeting summary")
     decisions: List[str] = Field(default_factory=list, description="Decisions made in meeting")
     action_items: List[str] = Field(default_factory=list, description="Action items identified")
     key_points: List[str] = Field(default_factory=list, description="Key discussion points")
-    created_at: datetime = Field(..., description="Meeting creation timestamp")
+    created_at: datetime = Field(..., description=CREATED_AT_DESCRIPTION)
     
     class Config:
         from_attributes = True
@@ -44,8 +51,9 @@ class MeetingListItem(BaseModel):
     
     meeting_id: str = Field(..., description="Unique meeting identifier")
     audio_filename: str = Field(..., description="Original audio filename")
+    status: str = Field(..., description="Processing status")
     summary: str = Field(..., description="Meeting summary")
-    created_at: datetime = Field(..., description="Meeting creation timestamp")
+    created_at: datetime = Field(..., description=CREATED_AT_DESCRIPTION)
     
     class Config:
         from_attributes = True
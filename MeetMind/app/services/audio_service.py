@@ -1,41 +1,93 @@
 """Audio file handling service"""
 
+import asyncio
 import os
 import uuid
-from typing import Tuple
+from typing import Any, Optional, Tuple
 from fastapi import UploadFile, HTTPException
-from app.config import settings
+from app.config import get_settings
+from app.constants import ALLOWED_AUDIO_EXTENSIONS, ALLOWED_AUDIO_MIME_TYPES
+
+settings = get_settings()
 
 
 class AudioService:
     """Service for handling audio file operations"""
     
-    ALLOWED_EXTENSIONS = {".wav", ".mp3", ".webm", ".m4a", ".ogg"}
-    ALLOWED_MIME_TYPES = {
-        "audio/wav", "audio/wave", "audio/x-wav",
-        "audio/mpeg", "audio/mp3",
-        "audio/webm",
-        "audio/mp4", "audio/x-m4a",
-        "audio/ogg"
-    }
+    ALLOWED_EXTENSIONS: frozenset[str] = ALLOWED_AUDIO_EXTENSIONS
+    ALLOWED_MIME_TYPES: frozenset[str] = ALLOWED_AUDIO_MIME_TYPES
+    _ALLOWED_EXTENSIONS_DISPLAY = ", ".join(sorted(ALLOWED_EXTENSIONS))
+    
+    # Uploads are streamed to disk in 1 MiB chunks
+    UPLOAD_CHUNK_SIZE = 1 << 20
+    
+    # Leading bytes needed to recognize every supported container
+    SIGNATURE_BYTES = 12
+    
+    @staticmethod
+    def _get_extension(filename: str) -> str:
+        """
+        Get the lowercased extension (including the dot) of a filename.
+        
+        Args:
+            filename: Original filename
+            
+        Returns:
+            Extension such as ".mp3", or "" if the name has none
+        """
+        _, dot, ext = filename.rpartition(".")
+        return f".{ext}".lower() if dot else ""
+    
+    @staticmethod
+    def _has_audio_signature(header: bytes, file_ext: str) -> bool:
+        """
+        Check the leading bytes of a file against its extension's container format.
+        
+        Args:
+            header: First SIGNATURE_BYTES bytes of the file
+            file_ext: Lowercased extension including the dot
+            
+        Returns:
+            True if the header matches the expected format
+        """
+        if file_ext == ".wav":
+            return header[:4] == b"RIFF" and header[8:12] == b"WAVE"
+        if file_ext == ".mp3":
+            # ID3 tag, or a bare MPEG frame sync (11 set bits)
+            return header[:3] == b"ID3" or (
+                len(header) >= 2 and header[0] == 0xFF and header[1] & 0xE0 == 0xE0
+            )
+        if file_ext == ".webm":
+            return header[:4] == b"\x1a\x45\xdf\xa3"  # EBML
+        if file_ext == ".m4a":
+            return header[4:8] == b"ftyp"
+        if file_ext == ".ogg":
+            return header[:4] == b"OggS"
+        return False
     
     @staticmethod
-    def validate_audio_file(file: UploadFile) -> None:
+    def validate_audio_file(file: UploadFile) -> str:
         """
-        Validate audio file type and size.
+        Validate audio file type, size and format signature.
+        
+        Runs before anything is written to disk, so oversized or mislabeled
+        uploads are rejected without any further I/O.
         
         Args:
             file: Uploaded file to validate
             
+        Returns:
+            Validated file extension, reusable by save_audio_file
+            
         Raises:
             HTTPException: If file is invalid
         """
         # Check file extension
-        file_ext = os.path.splitext(file.filename)[1].lower()
+        file_ext = AudioService._get_extension(file.filename)
         if file_ext not in AudioService.ALLOWED_EXTENSIONS:
             raise HTTPException(
                 status_code=400,
-                detail=f"Invalid file type. Allowed: {', '.join(AudioService.ALLOWED_EXTENSIONS)}"
+                detail=f"Invalid file type. Allowed: {AudioService._ALLOWED_EXTENSIONS_DISPLAY}"
             )
         
         # Check MIME type if available
@@ -44,14 +96,38 @@ class AudioService:
                 status_code=400,
                 detail=f"Invalid content type: {file.content_type}"
             )
+        
+        # Check size when the multipart parser already knows it
+        if file.size is not None and file.size > settings.max_upload_size_mb * 1024 * 1024:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File too large. Maximum size: {settings.max_upload_size_mb}MB"
+            )
+        
+        # Check the container signature; the upload is rewound for save_audio_file
+        header = file.file.read(AudioService.SIGNATURE_BYTES)
+        file.file.seek(0)
+        if not AudioService._has_audio_signature(header, file_ext):
+            raise HTTPException(
+                status_code=400,
+                detail=f"File content is not valid {file_ext[1:]} audio"
+            )
+        
+        return file_ext
     
     @staticmethod
-    async def save_audio_file(file: UploadFile) -> Tuple[str, str]:
+    async def save_audio_file(
+        file: UploadFile,
+        file_ext: Optional[str] = None,
+        digest: Optional[Any] = None
+    ) -> Tuple[str, str]:
         """
         Save uploaded audio file to disk.
         
         Args:
             file: Uploaded audio file
+            file_ext: Extension returned by validate_audio_file (derived if omitted)
+            digest: hashlib object updated with the content as it is written
             
         Returns:
             Tuple of (file_path, original_filename)
@@ -59,31 +135,43 @@ class AudioService:
         Raises:
             HTTPException: If file save fails
         """
+        # Generate unique filename
+        if file_ext is None:
+            file_ext = AudioService._get_extension(file.filename)
+        unique_filename = f"{uuid.uuid4()}{file_ext}"
+        file_path = os.path.join(settings.upload_dir, unique_filename)
+        max_bytes = settings.max_upload_size_mb * 1024 * 1024
+        
+        def write_chunk(buffer, chunk: bytes) -> None:
+            buffer.write(chunk)
+            if digest is not None:
+                digest.update(chunk)
+        
         try:
-            # Generate unique filename
-            file_ext = os.path.splitext(file.filename)[1].lower()
-            unique_filename = f"{uuid.uuid4()}{file_ext}"
-            file_path = os.path.join(settings.upload_dir, unique_filename)
-            
-            # Save file
-            with open(file_path, "wb") as buffer:
-                content = await file.read()
-                
-                # Check file size
-                size_mb = len(content) / (1024 * 1024)
-                if size_mb > settings.max_upload_size_mb:
-                    raise HTTPException(
-                        status_code=413,
-                        detail=f"File too large. Maximum size: {settings.max_upload_size_mb}MB"
-                    )
-                
-                buffer.write(content)
+            # Stream to disk in chunks, bailing out as soon as the limit is exceeded.
+            # File I/O (and hashing) runs in a worker thread so a large upload
+            # never blocks the event loop.
+            written = 0
+            buffer = await asyncio.to_thread(open, file_path, "wb")
+            try:
+                while chunk := await file.read(AudioService.UPLOAD_CHUNK_SIZE):
+                    written += len(chunk)
+                    if written > max_bytes:
+                        raise HTTPException(
+                            status_code=413,
+                            detail=f"File too large. Maximum size: {settings.max_upload_size_mb}MB"
+                        )
+                    await asyncio.to_thread(write_chunk, buffer, chunk)
+            finally:
+                await asyncio.to_thread(buffer.close)
             
             return file_path, file.filename
             
         except HTTPException:
+            await asyncio.to_thread(AudioService.delete_audio_file, file_path)
             raise
         except Exception as e:
+            await asyncio.to_thread(AudioService.delete_audio_file, file_path)
             raise HTTPException(
                 status_code=500,
                 detail=f"Failed to save audio file: {str(e)}"
@@ -0,0 +1,312 @@
+"""Content-addressed cache of OpenAI embeddings"""
+
+import asyncio
+import hashlib
+import os
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from app.config import get_settings
+from app.constants import EMBEDDING_CACHE_SIZE
+from app.logger import setup_logger
+
+settings = get_settings()
+
+logger = setup_logger(__name__)
+
+
+class EmbeddingCache:
+    """
+    In-memory LRU in front of an optional SQLite table of embeddings.
+    
+    Entries are keyed by sha256(model|text), so identical texts (repeated
+    questions, recurring action items) are embedded once per model. Vectors
+    are held in memory as float32 arrays (4 bytes per value instead of a
+    32-byte Python float in a list) and persisted as the same float32 bytes.
+    OpenAI embeddings are float32 to begin with, so nothing is lost.
+    
+    Async callers use the a* methods, which check memory inline and run
+    SQLite reads and writes in a worker thread.
+    """
+    
+    def __init__(
+        self,
+        model: str,
+        path: Optional[str] = None,
+        max_memory_items: int = EMBEDDING_CACHE_SIZE
+    ):
+        """
+        Initialize the cache.
+        
+        Args:
+            model: Embedding model name, part of every key
+            path: SQLite file for persistence (memory only if empty)
+            max_memory_items: Entries kept in the in-memory LRU
+        """
+        self.model = model
+        self.path = path
+        self.max_memory_items = max_memory_items
+        self._memory: "OrderedDict[str, array]" = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()  # Guards the in-memory LRU; never held during I/O
+        self._db_lock = threading.Lock()  # Serializes use of the SQLite connection
+    
+    def _key(self, text: str) -> str:
+        """Cache key for a text under this model"""
+        return hashlib.sha256(f"{self.model}|{text}".encode("utf-8")).hexdigest()
+    
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """
+        Open the SQLite store on first use.
+        
+        Returns:
+            Connection, or None when persistence is disabled or unavailable
+        """
+        if self._db is None and self.path:
+            try:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                db = sqlite3.connect(self.path, check_same_thread=False)
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vec BLOB NOT NULL)")
+                self._db = db
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding cache persistence disabled ({self.path}): {e}")
+                self.path = None
+        return self._db
+    
+    def _remember(self, key: str, vector: array) -> None:
+        """Insert into the in-memory LRU, evicting the oldest entry if full"""
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.max_memory_items:
+            self._memory.popitem(last=False)
+    
+    def get_many(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Look up embeddings for texts.
+        
+        Args:
+            texts: Texts to look up
+        
+        Returns:
+            Embedding (a fresh list) or None for each text, in order
+        """
+        return [
+            vector.tolist() if vector is not None else None
+            for vector in self._lookup(texts)
+        ]
+    
+    def get_many_arrays(self, texts: List[str]) -> List[Optional[array]]:
+        """
+        Look up embeddings for texts as float32 arrays.
+        
+        Args:
+            texts: Texts to look up
+        
+        Returns:
+            Embedding (a fresh array('f')) or None for each text, in order
+        """
+        return [
+            vector[:] if vector is not None else None
+            for vector in self._lookup(texts)
+        ]
+    
+    async def aget_many(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Async get_many: SQLite reads run in a worker thread, not on the event loop.
+        
+        Args:
+            texts: Texts to look up
+        
+        Returns:
+            Embedding (a fresh list) or None for each text, in order
+        """
+        return [
+            vector.tolist() if vector is not None else None
+            for vector in await self._alookup(texts)
+        ]
+    
+    async def aget_many_arrays(self, texts: List[str]) -> List[Optional[array]]:
+        """
+        Async get_many_arrays: SQLite reads run in a worker thread, not on the event loop.
+        
+        Args:
+            texts: Texts to look up
+        
+        Returns:
+            Embedding (a fresh array('f')) or None for each text, in order
+        """
+        return [
+            vector[:] if vector is not None else None
+            for vector in await self._alookup(texts)
+        ]
+    
+    def _lookup(self, texts: List[str]) -> List[Optional[array]]:
+        """
+        Find the cached float32 vectors for texts.
+        
+        Args:
+            texts: Texts to look up
+        
+        Returns:
+            The cached array (not a copy) or None for each text, in order
+        """
+        results, missing = self._lookup_memory(texts)
+        if missing:
+            self._load_persisted(missing, results)
+        return results
+    
+    async def _alookup(self, texts: List[str]) -> List[Optional[array]]:
+        """
+        Find the cached float32 vectors for texts without blocking the event loop.
+        
+        The in-memory LRU is checked inline; only misses go to SQLite, in a
+        worker thread.
+        
+        Args:
+            texts: Texts to look up
+        
+        Returns:
+            The cached array (not a copy) or None for each text, in order
+        """
+        results, missing = self._lookup_memory(texts)
+        if missing and self.path:
+            await asyncio.to_thread(self._load_persisted, missing, results)
+        return results
+    
+    def _lookup_memory(self, texts: List[str]) -> Tuple[List[Optional[array]], Dict[str, List[int]]]:
+        """
+        Check the in-memory LRU.
+        
+        Args:
+            texts: Texts to look up
+        
+        Returns:
+            Tuple of (cached array or None per text, positions of each missing key)
+        """
+        keys = [self._key(text) for text in texts]
+        results: List[Optional[array]] = [None] * len(texts)
+        missing: Dict[str, List[int]] = {}
+        
+        with self._lock:
+            for i, key in enumerate(keys):
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    results[i] = vector
+                else:
+                    missing.setdefault(key, []).append(i)
+        
+        return results, missing
+    
+    def _load_persisted(self, missing: Dict[str, List[int]], results: List[Optional[array]]) -> None:
+        """
+        Fill results from SQLite for keys missing from memory (blocking I/O).
+        
+        Args:
+            missing: Positions in results of each key to load
+            results: Lookup results, updated in place
+        """
+        with self._db_lock:
+            db = self._connect()
+            if db is None:
+                return
+            try:
+                placeholders = ",".join("?" * len(missing))
+                rows = db.execute(
+                    f"SELECT key, vec FROM embeddings WHERE key IN ({placeholders})",
+                    list(missing)
+                ).fetchall()
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding cache read failed: {e}")
+                return
+        
+        with self._lock:
+            for key, blob in rows:
+                vector = array("f")
+                vector.frombytes(blob)
+                self._remember(key, vector)
+                for i in missing[key]:
+                    results[i] = vector
+    
+    def set_many(self, texts: List[str], vectors: List[Sequence[float]]) -> None:
+        """
+        Store embeddings for texts.
+        
+        Args:
+            texts: Embedded texts
+            vectors: Embeddings aligned with texts
+        """
+        self._persist(self._remember_many(texts, vectors))
+    
+    async def aset_many(self, texts: List[str], vectors: List[Sequence[float]]) -> None:
+        """
+        Async set_many: the SQLite write runs in a worker thread, not on the event loop.
+        
+        Args:
+            texts: Embedded texts
+            vectors: Embeddings aligned with texts
+        """
+        entries = self._remember_many(texts, vectors)
+        if self.path:
+            await asyncio.to_thread(self._persist, entries)
+    
+    def _remember_many(self, texts: List[str], vectors: List[Sequence[float]]) -> Dict[str, array]:
+        """
+        Add embeddings to the in-memory LRU.
+        
+        Args:
+            texts: Embedded texts
+            vectors: Embeddings aligned with texts
+        
+        Returns:
+            Float32 vectors by cache key
+        """
+        entries = {self._key(text): array("f", vector) for text, vector in zip(texts, vectors)}
+        
+        with self._lock:
+            for key, vector in entries.items():
+                self._remember(key, vector)
+        
+        return entries
+    
+    def _persist(self, entries: Dict[str, array]) -> None:
+        """
+        Write entries to SQLite (blocking I/O).
+        
+        Args:
+            entries: Float32 vectors by cache key
+        """
+        with self._db_lock:
+            db = self._connect()
+            if db is None:
+                return
+            try:
+                with db:
+                    db.executemany(
+                        "INSERT OR REPLACE INTO embeddings (key, vec) VALUES (?, ?)",
+                        [(key, vector.tobytes()) for key, vector in entries.items()]
+                    )
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding cache write failed: {e}")
+
+
+_embedding_cache: Optional[EmbeddingCache] = None
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """
+    Get the embedding cache shared by every VectorStoreService in the process.
+    
+    Returns:
+        Shared EmbeddingCache configured from settings
+    """
+    global _embedding_cache
+    if _embedding_cache is None:
+        _embedding_cache = EmbeddingCache(settings.embedding_model, settings.embedding_cache_path)
+    return _embedding_cache
@@ -1,12 +1,18 @@
 """LangGraph service for AI-powered meeting analysis"""
 
+from functools import cached_property
 from typing import TypedDict, List, Dict, Any
-from langgraph.graph import StateGraph, END
+from langgraph.graph import StateGraph, START, END
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from fastapi import HTTPException
-from app.config import settings
-import json
+from app.config import get_settings
+from app.constants import OPENAI_PRIORITY_SERVICE_TIER, OPENAI_MAX_RETRIES
+from app.http_client import get_openai_async_client
+from app.llm_limiter import get_llm_limiter
+import orjson
+
+settings = get_settings()
 
 
 class MeetingState(TypedDict):
@@ -23,6 +29,43 @@ class MeetingState(TypedDict):
 class LangGraphService:
     """Service for processing meeting transcripts using LangGraph"""
     
+    # Prompt templates are parsed once at import, not per node invocation
+    CLEAN_PROMPT = ChatPromptTemplate.from_messages([
+        ("system", "You are a transcript editor. Clean the following meeting transcript by removing filler words (um, uh, like), fixing grammar, and improving readability. Preserve all important content and context."),
+        ("user", "{transcript}")
+    ])
+    
+    # Topic detection and extraction share an identical prefix (system message,
+    # then the cleaned transcript) and differ only in the trailing task message,
+    # so OpenAI's prompt cache can reuse the transcript tokens on the second call
+    ANALYST_SYSTEM_MESSAGE = (
+        "You are a meeting analyst. You will be given a meeting transcript, "
+        "followed by a task. Base your answer only on the transcript and follow "
+        "the task's output format exactly."
+    )
+    
+    TOPICS_PROMPT = ChatPromptTemplate.from_messages([
+        ("system", ANALYST_SYSTEM_MESSAGE),
+        ("user", "Transcript:\n{transcript}"),
+        ("user", "Task: Identify the main topics discussed in this meeting. Return ONLY a JSON object of the form {{\"topics\": [\"topic\", ...]}} where topics is an array of short strings, nothing else.")
+    ])
+    
+    EXTRACT_PROMPT = ChatPromptTemplate.from_messages([
+        ("system", ANALYST_SYSTEM_MESSAGE),
+        ("user", "Transcript:\n{transcript}"),
+        ("user", "Topics: {topics}\n\n"
+                 "Task: Analyze this meeting and return ONLY a JSON object with these fields: "
+                 "\"summary\": a concise, professional summary in 2-4 sentences focusing on the main purpose, key discussions, and outcomes; "
+                 "\"decisions\": an array of strings, one per decision that was made (empty array if none); "
+                 "\"action_items\": an array of strings, one per action item, task, or follow-up, naming who is responsible within the string if mentioned (empty array if none); "
+                 "\"key_points\": an array of strings with the 3-5 most important discussion points and insights. "
+                 "Every array element must be a plain string, not an object. "
+                 "Format: {{\"summary\": \"...\", \"decisions\": [\"...\"], \"action_items\": [\"...\"], \"key_points\": [\"...\"]}}")
+    ])
+    
+    # Strict JSON mode: replies are always a single parseable JSON object
+    JSON_RESPONSE_FORMAT = {"type": "json_object"}
+    
     def __init__(self):
         """Initialize LangGraph service with LLM"""
         if not settings.openai_api_key:
@@ -33,207 +76,166 @@ class LangGraphService:
             model="gpt-4o-mini",  # Faster and cheaper than gpt-3.5-turbo
             temperature=0.2,  # Lower temperature for more consistent results
             api_key=settings.openai_api_key,
-            max_tokens=2000  # Limit response length for speed
+            max_tokens=2000,  # Limit response length for speed
+            service_tier=OPENAI_PRIORITY_SERVICE_TIER if settings.openai_latency_optimized else None,
+            max_retries=OPENAI_MAX_RETRIES,
+            http_async_client=get_openai_async_client()
         )
     
-    def clean_transcript(self, state: MeetingState) -> MeetingState:
+    async def clean_transcript(self, transcript: str) -> str:
         """
-        Node 1: Clean transcript by removing filler words and fixing grammar.
+        Step 1: Clean transcript by removing filler words and fixing grammar.
         
         Args:
-            state: Current meeting state
+            transcript: Raw meeting transcript
             
         Returns:
-            Updated state with cleaned transcript
+            Cleaned transcript
         """
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", "You are a transcript editor. Clean the following meeting transcript by removing filler words (um, uh, like), fixing grammar, and improving readability. Preserve all important content and context."),
-            ("user", "{transcript}")
-        ])
-        
-        chain = prompt | self.llm
-        response = chain.invoke({"transcript": state["transcript"]})
+        chain = self.CLEAN_PROMPT | self.llm
+        async with get_llm_limiter():
+            response = await chain.ainvoke({"transcript": transcript})
         
-        state["cleaned_transcript"] = response.content.strip()
-        return state
+        return response.content.strip()
     
-    def detect_topics(self, state: MeetingState) -> MeetingState:
-        """
-        Node 2: Detect main topics discussed in the meeting.
-        
-        Args:
-            state: Current meeting state
-            
-        Returns:
-            Updated state with detected topics
+    def should_clean(self, transcript: str) -> bool:
         """
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", "You are a meeting analyst. Identify the main topics discussed in this meeting. Return ONLY a JSON array of topic strings, nothing else."),
-            ("user", "{transcript}")
-        ])
-        
-        chain = prompt | self.llm
-        response = chain.invoke({"transcript": state["cleaned_transcript"]})
-        
-        try:
-            topics = json.loads(response.content.strip())
-            if not isinstance(topics, list):
-                topics = [response.content.strip()]
-        except json.JSONDecodeError:
-            # Fallback: split by newlines or commas
-            topics = [t.strip() for t in response.content.strip().split('\n') if t.strip()]
+        Decide whether a transcript gets the cleaning pass.
         
-        state["topics"] = topics
-        return state
-    
-    def generate_summary(self, state: MeetingState) -> MeetingState:
-        """
-        Node 3: Generate concise meeting summary.
+        Short transcripts go straight to topic detection; a cleaning pass
+        costs a full LLM round trip and adds little on a few hundred words.
         
         Args:
-            state: Current meeting state
+            transcript: Raw meeting transcript
             
         Returns:
-            Updated state with summary
+            True if the transcript should be cleaned first
         """
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", "You are a meeting summarizer. Create a concise, professional summary of this meeting in 2-4 sentences. Focus on the main purpose, key discussions, and outcomes."),
-            ("user", "Topics: {topics}\n\nTranscript: {transcript}")
-        ])
-        
-        chain = prompt | self.llm
-        response = chain.invoke({
-            "topics": ", ".join(state["topics"]),
-            "transcript": state["cleaned_transcript"]
-        })
-        
-        state["summary"] = response.content.strip()
-        return state
+        return len(transcript) >= settings.skip_cleaning_threshold
     
-    def extract_decisions(self, state: MeetingState) -> MeetingState:
+    async def detect_topics(self, transcript: str) -> List[str]:
         """
-        Node 4: Extract decisions made during the meeting.
+        Step 2: Detect main topics discussed in the meeting.
         
         Args:
-            state: Current meeting state
+            transcript: Cleaned meeting transcript
             
         Returns:
-            Updated state with decisions
+            Detected topics
         """
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", "You are a meeting analyst. Extract all decisions that were made during this meeting. Return ONLY a JSON array of decision strings. If no decisions were made, return an empty array []."),
-            ("user", "Topics: {topics}\n\nTranscript: {transcript}")
-        ])
-        
-        chain = prompt | self.llm
-        response = chain.invoke({
-            "topics": ", ".join(state["topics"]),
-            "transcript": state["cleaned_transcript"]
-        })
+        chain = self.TOPICS_PROMPT | self.llm.bind(response_format=self.JSON_RESPONSE_FORMAT)
+        async with get_llm_limiter():
+            response = await chain.ainvoke({"transcript": transcript})
         
-        try:
-            decisions = json.loads(response.content.strip())
-            if not isinstance(decisions, list):
-                decisions = []
-        except json.JSONDecodeError:
-            decisions = [d.strip() for d in response.content.strip().split('\n') if d.strip() and d.strip() != "[]"]
-        
-        state["decisions"] = decisions
-        return state
+        return self._as_strings(orjson.loads(response.content).get("topics", []))
     
-    def extract_action_items(self, state: MeetingState) -> MeetingState:
+    async def extract_all(self, transcript: str, topics: List[str]) -> Dict[str, Any]:
         """
-        Node 5: Extract action items and tasks from the meeting.
+        Step 3: Generate the summary and extract decisions, action items and
+        key points in a single LLM call.
+        
+        The cleaned transcript is sent once instead of once per field, and the
+        model is put in JSON mode so the reply parses as a single object.
         
         Args:
-            state: Current meeting state
+            transcript: Cleaned meeting transcript
+            topics: Topics from detect_topics
             
         Returns:
-            Updated state with action items
+            Dictionary with summary, decisions, action_items, and key_points
         """
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", "You are a meeting analyst. Extract all action items, tasks, and follow-ups mentioned in this meeting. Include who is responsible if mentioned. Return ONLY a JSON array of action item strings. If no action items exist, return an empty array []."),
-            ("user", "Topics: {topics}\n\nTranscript: {transcript}")
-        ])
-        
-        chain = prompt | self.llm
-        response = chain.invoke({
-            "topics": ", ".join(state["topics"]),
-            "transcript": state["cleaned_transcript"]
-        })
+        chain = self.EXTRACT_PROMPT | self.llm.bind(response_format=self.JSON_RESPONSE_FORMAT)
+        async with get_llm_limiter():
+            response = await chain.ainvoke({
+                "topics": ", ".join(topics),
+                "transcript": transcript
+            })
         
-        try:
-            action_items = json.loads(response.content.strip())
-            if not isinstance(action_items, list):
-                action_items = []
-        except json.JSONDecodeError:
-            action_items = [a.strip() for a in response.content.strip().split('\n') if a.strip() and a.strip() != "[]"]
+        result = orjson.loads(response.content)
         
-        state["action_items"] = action_items
-        return state
+        analysis: Dict[str, Any] = {"summary": str(result.get("summary", "")).strip()}
+        for field in ("decisions", "action_items", "key_points"):
+            analysis[field] = self._as_strings(result.get(field, []))
+        return analysis
     
-    def extract_key_points(self, state: MeetingState) -> MeetingState:
+    @staticmethod
+    def _as_strings(items: Any) -> List[str]:
         """
-        Node 6: Extract key discussion points from the meeting.
+        Normalize a JSON array from the model to a list of non-empty strings.
+        
+        JSON mode guarantees valid JSON, not element types, while indexing and
+        the List[str] response schemas need plain strings. Objects such as
+        {"task": ..., "owner": ...} are flattened to their values.
         
         Args:
-            state: Current meeting state
+            items: Parsed field value from the model's reply
             
         Returns:
-            Updated state with key points
+            String items, with nested arrays, nulls and blanks dropped
         """
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", "You are a meeting analyst. Extract the most important discussion points and insights from this meeting. Return ONLY a JSON array of key point strings (3-5 points)."),
-            ("user", "Topics: {topics}\n\nTranscript: {transcript}")
-        ])
-        
-        chain = prompt | self.llm
-        response = chain.invoke({
-            "topics": ", ".join(state["topics"]),
-            "transcript": state["cleaned_transcript"]
-        })
+        if not isinstance(items, list):
+            return []
         
-        try:
-            key_points = json.loads(response.content.strip())
-            if not isinstance(key_points, list):
-                key_points = []
-        except json.JSONDecodeError:
-            key_points = [k.strip() for k in response.content.strip().split('\n') if k.strip() and k.strip() != "[]"]
-        
-        state["key_points"] = key_points
-        return state
+        strings = []
+        for item in items:
+            if isinstance(item, dict):
+                item = " - ".join(str(v).strip() for v in item.values() if v is not None and str(v).strip())
+            elif item is None or isinstance(item, list):
+                continue
+            text = str(item).strip()
+            if text:
+                strings.append(text)
+        return strings
+    
+    @cached_property
+    def graph(self) -> StateGraph:
+        """Compiled pipeline graph, built on first access and reused; build_graph() makes a fresh one"""
+        return self.build_graph()
     
     def build_graph(self) -> StateGraph:
         """
-        Build the LangGraph workflow.
+        Build the same pipeline as a LangGraph workflow.
+        
+        process_transcript calls the steps directly; the graph is only for
+        tracing and visualization tools that expect a compiled LangGraph.
         
         Returns:
             Compiled StateGraph
         """
+        async def clean_node(state: MeetingState) -> Dict[str, Any]:
+            return {"cleaned_transcript": await self.clean_transcript(state["transcript"])}
+        
+        async def topics_node(state: MeetingState) -> Dict[str, Any]:
+            return {"topics": await self.detect_topics(state["cleaned_transcript"])}
+        
+        async def extract_node(state: MeetingState) -> Dict[str, Any]:
+            return await self.extract_all(state["cleaned_transcript"], state["topics"])
+        
         workflow = StateGraph(MeetingState)
         
         # Add nodes
-        workflow.add_node("clean_transcript", self.clean_transcript)
-        workflow.add_node("detect_topics", self.detect_topics)
-        workflow.add_node("generate_summary", self.generate_summary)
-        workflow.add_node("extract_decisions", self.extract_decisions)
-        workflow.add_node("extract_action_items", self.extract_action_items)
-        workflow.add_node("extract_key_points", self.extract_key_points)
+        workflow.add_node("clean_transcript", clean_node)
+        workflow.add_node("detect_topics", topics_node)
+        workflow.add_node("extract_all", extract_node)
         
-        # Define edges - Sequential execution to avoid concurrent state updates
-        workflow.set_entry_point("clean_transcript")
+        # Define edges - short transcripts bypass cleaning
+        workflow.add_conditional_edges(
+            START,
+            lambda state: "clean_transcript" if self.should_clean(state["transcript"]) else "detect_topics",
+            ["clean_transcript", "detect_topics"]
+        )
         workflow.add_edge("clean_transcript", "detect_topics")
-        workflow.add_edge("detect_topics", "generate_summary")
-        workflow.add_edge("generate_summary", "extract_decisions")
-        workflow.add_edge("extract_decisions", "extract_action_items")
-        workflow.add_edge("extract_action_items", "extract_key_points")
-        workflow.add_edge("extract_key_points", END)
+        workflow.add_edge("detect_topics", "extract_all")
+        workflow.add_edge("extract_all", END)
         
         return workflow.compile()
     
-    def process_transcript(self, transcript: str) -> Dict[str, Any]:
+    async def process_transcript(self, transcript: str) -> Dict[str, Any]:
         """
-        Process meeting transcript through LangGraph workflow.
+        Analyze a meeting transcript: clean, detect topics, extract insights.
+        
+        The pipeline is linear, so the steps are awaited in order directly
+        rather than dispatched through a state graph.
         
         Args:
             transcript: Raw meeting transcript
@@ -247,29 +249,13 @@ class LangGraphService:
         try:
             print("🤖 AI analysis...")
             
-            # Initialize state
-            initial_state: MeetingState = {
-                "transcript": transcript,
-                "cleaned_transcript": "",
-                "topics": [],
-                "summary": "",
-                "decisions": [],
-                "action_items": [],
-                "key_points": []
-            }
-            
-            # Build and run graph
-            graph = self.build_graph()
-            final_state = graph.invoke(initial_state)
+            cleaned = await self.clean_transcript(transcript) if self.should_clean(transcript) else transcript
+            topics = await self.detect_topics(cleaned)
+            analysis = await self.extract_all(cleaned, topics)
             
             print("  ✓ Analysis complete")
             
-            return {
-                "summary": final_state.get("summary", ""),
-                "decisions": final_state.get("decisions", []),
-                "action_items": final_state.get("action_items", []),
-                "key_points": final_state.get("key_points", [])
-            }
+            return analysis
             
         except Exception as e:
             raise HTTPException(
@@ -1,11 +1,22 @@
 """Meeting service for orchestrating the complete workflow"""
 
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update, or_, Row
+from sqlalchemy.orm import Session, sessionmaker, defer
 from fastapi import HTTPException, UploadFile
-from typing import Dict, Any
-import json
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Optional, Tuple
+import asyncio
+import hashlib
 
 from app.models.meeting import User, Meeting
+from app.constants import (
+    MEETING_STATUS_PENDING,
+    MEETING_STATUS_TRANSCRIBING,
+    MEETING_STATUS_ANALYZING,
+    MEETING_STATUS_COMPLETED,
+    MEETING_STATUS_FAILED,
+    MEETING_PROCESSING_TIMEOUT_SECONDS
+)
 from app.services.audio_service import AudioService
 from app.services.whisper_service import WhisperService
 from app.services.langgraph_service import LangGraphService
@@ -47,14 +58,18 @@ class MeetingService:
             db.refresh(user)
         return user
     
-    async def process_meeting(
+    async def create_meeting(
         self,
         db: Session,
         user_id: str,
         audio_file: UploadFile
-    ) -> Meeting:
+    ) -> Tuple[Meeting, str]:
         """
-        Complete workflow: Audio → Whisper → LangGraph → Database.
+        Validate and store an upload and record a pending meeting for it.
+        
+        Transcription and analysis happen later in process_meeting, so the
+        upload request returns as soon as the file is on disk. Re-uploads of
+        audio this user already submitted return the existing meeting instead.
         
         Args:
             db: Database session
@@ -62,97 +77,309 @@ class MeetingService:
             audio_file: Uploaded audio file
             
         Returns:
-            Created Meeting object with all analysis
+            Tuple of (Meeting object, saved audio path); the path is None when
+            an existing meeting was reused and nothing needs processing
             
         Raises:
-            HTTPException: If any step fails
+            HTTPException: If the file is invalid or the meeting cannot be recorded
         """
-        audio_path = None
+        print(f"Processing meeting for user: {user_id}")
+        file_ext = self.audio_service.validate_audio_file(audio_file)
+        digest = hashlib.blake2b(digest_size=16)
+        audio_path, original_filename = await self.audio_service.save_audio_file(
+            audio_file, file_ext, digest
+        )
+        audio_hash = digest.hexdigest()
         
         try:
-            # Step 1: Validate and save audio file
-            print(f"Processing meeting for user: {user_id}")
-            self.audio_service.validate_audio_file(audio_file)
-            audio_path, original_filename = await self.audio_service.save_audio_file(audio_file)
+            existing = await asyncio.to_thread(self._find_duplicate, db, user_id, audio_hash)
+            if existing is not None:
+                print(f"Duplicate upload of meeting {existing.id}, skipping processing")
+                self.audio_service.delete_audio_file(audio_path)
+                return existing, None
             
-            # Step 2: Transcribe with Whisper
-            transcript = self.whisper_service.transcribe_audio(audio_path)
+            meeting = await asyncio.to_thread(
+                self._create_pending_meeting, db, user_id, original_filename, audio_hash
+            )
+        except Exception as e:
+            db.rollback()
+            self.audio_service.delete_audio_file(audio_path)
+            raise HTTPException(
+                status_code=500,
+                detail=f"Failed to process meeting: {str(e)}"
+            )
+        
+        return meeting, audio_path
+    
+    async def process_meeting(
+        self,
+        session_factory: sessionmaker,
+        meeting_id: str,
+        user_id: str,
+        audio_path: str
+    ) -> None:
+        """
+        Background workflow: Audio → Whisper → LangGraph → Database.
+        
+        Runs after the upload response has been sent, so it opens its own
+        database session and records progress and failures in the meeting's
+        status column instead of raising.
+        
+        Args:
+            session_factory: Factory for the task's own database session
+            meeting_id: Meeting identifier from create_meeting
+            user_id: User identifier
+            audio_path: Path of the saved audio file
+        """
+        db = session_factory()
+        
+        try:
+            # Blocking database steps run in worker threads so the
+            # event loop keeps serving other requests
             
-            # Step 3: Process with LangGraph
-            analysis = self.langgraph_service.process_transcript(transcript)
+            # Step 1: Transcribe with Whisper
+            await asyncio.to_thread(self._set_status, db, meeting_id, MEETING_STATUS_TRANSCRIBING)
+            transcript = await self.whisper_service.transcribe_audio(audio_path)
             
-            # Step 4: Get or create user
-            user = self.get_or_create_user(db, user_id)
+            # Step 2: Process with LangGraph
+            await asyncio.to_thread(self._set_status, db, meeting_id, MEETING_STATUS_ANALYZING)
+            analysis = await self.langgraph_service.process_transcript(transcript)
             
-            # Step 5: Save to database
-            meeting = Meeting(
-                user_id=user_id,
-                audio_filename=original_filename,
-                transcript=transcript,
-                summary=analysis["summary"],
-                decisions=json.dumps(analysis["decisions"]),
-                action_items=json.dumps(analysis["action_items"]),
-                key_points=json.dumps(analysis["key_points"])
+            # Steps 3-4: Save results and index for RAG concurrently;
+            # indexing only needs the meeting ID
+            meeting, indexed = await asyncio.gather(
+                asyncio.to_thread(self._save_meeting, db, meeting_id, transcript, analysis),
+                self._index_meeting(user_id, meeting_id, transcript, analysis),
+                return_exceptions=True
             )
             
-            db.add(meeting)
-            db.commit()
-            db.refresh(meeting)
+            if isinstance(meeting, BaseException):
+                # Don't leave vectors behind for a meeting that was never saved
+                if indexed is True:
+                    await self.vector_store.delete_meeting(user_id, meeting_id)
+                raise meeting
             
             print(f"Meeting created successfully: {meeting.id}")
             
-            # Step 6: Index in vector store for RAG (if available)
-            if self.vector_store:
-                try:
-                    self.vector_store.index_meeting(
-                        user_id=user_id,
-                        meeting_id=meeting.id,
-                        transcript=transcript,
-                        summary=analysis["summary"],
-                        decisions=analysis["decisions"],
-                        action_items=analysis["action_items"],
-                        key_points=analysis["key_points"]
-                    )
-                    print(f"✓ Meeting indexed in vector store")
-                except Exception as e:
-                    # Log error but don't fail the upload
-                    print(f"⚠ Vector store indexing failed: {e}")
-            
-            return meeting
-            
-        except HTTPException:
-            raise
         except Exception as e:
             db.rollback()
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to process meeting: {str(e)}"
-            )
+            error = getattr(e, "detail", None) or str(e)
+            print(f"✗ Meeting processing failed for {meeting_id}: {error}")
+            try:
+                await asyncio.to_thread(
+                    self._set_status, db, meeting_id, MEETING_STATUS_FAILED, error
+                )
+            except Exception as status_error:
+                db.rollback()
+                print(f"⚠ Could not record failure for {meeting_id}: {status_error}")
         finally:
-            # Cleanup: Delete temporary audio file
-            if audio_path:
-                self.audio_service.delete_audio_file(audio_path)
+            # Cleanup: close the session and delete the temporary audio
+            # file in a worker thread, like the other blocking steps
+            await asyncio.to_thread(db.close)
+            await asyncio.to_thread(self.audio_service.delete_audio_file, audio_path)
     
-    def get_user_meetings(self, db: Session, user_id: str) -> list[Meeting]:
+    async def _index_meeting(
+        self,
+        user_id: str,
+        meeting_id: str,
+        transcript: str,
+        analysis: Dict[str, Any]
+    ) -> bool:
+        """
+        Index a meeting in the vector store for RAG (if available).
+        
+        Failures are reported but never fail the upload.
+        
+        Args:
+            user_id: User identifier
+            meeting_id: Meeting identifier
+            transcript: Full transcript
+            analysis: LangGraph analysis results
+            
+        Returns:
+            True if the meeting was indexed
+        """
+        if not self.vector_store:
+            return False
+        
+        try:
+            await self.vector_store.index_meeting(
+                user_id=user_id,
+                meeting_id=meeting_id,
+                transcript=transcript,
+                summary=analysis["summary"],
+                decisions=analysis["decisions"],
+                action_items=analysis["action_items"],
+                key_points=analysis["key_points"]
+            )
+            print(f"✓ Meeting indexed in vector store")
+            return True
+        except Exception as e:
+            # Log error but don't fail the upload
+            print(f"⚠ Vector store indexing failed: {e}")
+            return False
+    
+    def _find_duplicate(self, db: Session, user_id: str, audio_hash: str) -> Optional[Meeting]:
+        """
+        Find a meeting this user already uploaded with identical audio.
+        
+        Failed meetings are ignored so the same file can be retried, as are
+        meetings still unfinished after MEETING_PROCESSING_TIMEOUT_SECONDS:
+        background tasks don't survive a restart, so such a meeting will
+        never complete and the re-upload has to be processed again.
+        
+        Args:
+            db: Database session
+            user_id: User identifier
+            audio_hash: Hex digest of the uploaded audio
+            
+        Returns:
+            Existing Meeting object, or None
+        """
+        # created_at is UTC; SQLite stores it without an offset and compares
+        # the bound value the same way
+        stale_before = datetime.now(timezone.utc) - timedelta(seconds=MEETING_PROCESSING_TIMEOUT_SECONDS)
+        return db.execute(
+            select(Meeting)
+            .options(defer(Meeting.transcript))
+            .where(
+                Meeting.user_id == user_id,
+                Meeting.audio_hash == audio_hash,
+                or_(
+                    Meeting.status == MEETING_STATUS_COMPLETED,
+                    Meeting.status.in_([
+                        MEETING_STATUS_PENDING,
+                        MEETING_STATUS_TRANSCRIBING,
+                        MEETING_STATUS_ANALYZING
+                    ]) & (Meeting.created_at >= stale_before)
+                )
+            )
+            .limit(1)
+        ).scalar_one_or_none()
+    
+    def _create_pending_meeting(
+        self,
+        db: Session,
+        user_id: str,
+        original_filename: str,
+        audio_hash: Optional[str] = None
+    ) -> Meeting:
+        """
+        Insert a meeting that is waiting to be processed, creating the user if needed.
+        
+        Args:
+            db: Database session
+            user_id: User identifier
+            original_filename: Uploaded file name
+            audio_hash: Hex digest of the uploaded audio
+            
+        Returns:
+            Saved Meeting object with status "pending"
+        """
+        self.get_or_create_user(db, user_id)
+        
+        meeting = Meeting(
+            user_id=user_id,
+            audio_filename=original_filename,
+            status=MEETING_STATUS_PENDING,
+            audio_hash=audio_hash
+        )
+        
+        db.add(meeting)
+        db.commit()
+        db.refresh(meeting)
+        return meeting
+    
+    def _set_status(
+        self,
+        db: Session,
+        meeting_id: str,
+        status: str,
+        error: Optional[str] = None
+    ) -> None:
+        """
+        Record the processing phase of a meeting.
+        
+        Args:
+            db: Database session
+            meeting_id: Meeting identifier
+            status: New processing status
+            error: Failure reason (only for MEETING_STATUS_FAILED)
+        """
+        db.execute(
+            update(Meeting)
+            .where(Meeting.id == meeting_id)
+            .values(status=status, error=error)
+        )
+        db.commit()
+    
+    def _save_meeting(
+        self,
+        db: Session,
+        meeting_id: str,
+        transcript: str,
+        analysis: Dict[str, Any]
+    ) -> Meeting:
+        """
+        Store the transcript and analysis on a pending meeting and mark it completed.
+        
+        Args:
+            db: Database session
+            meeting_id: Meeting identifier
+            transcript: Full transcript
+            analysis: LangGraph analysis results
+            
+        Returns:
+            Saved Meeting object
+        """
+        meeting = db.get(Meeting, meeting_id)
+        meeting.transcript = transcript
+        meeting.summary = analysis["summary"]
+        meeting.decisions = analysis["decisions"]
+        meeting.action_items = analysis["action_items"]
+        meeting.key_points = analysis["key_points"]
+        meeting.status = MEETING_STATUS_COMPLETED
+        meeting.error = None
+        
+        db.commit()
+        db.refresh(meeting)
+        return meeting
+    
+    def get_user_meetings(self, db: Session, user_id: str) -> list[Row]:
         """
         Get all meetings for a specific user.
         
+        Only the columns needed for listing are selected, so transcripts and
+        JSON analysis columns are never read from the database. Meetings are
+        listed newest first.
+        
         Args:
             db: Database session
             user_id: User identifier
             
         Returns:
-            List of Meeting objects
+            List of rows with id, audio_filename, status, summary and created_at
         """
-        return db.query(Meeting).filter(
-            Meeting.user_id == user_id
-        ).order_by(Meeting.created_at.desc()).all()
+        return db.execute(
+            select(
+                Meeting.id,
+                Meeting.audio_filename,
+                Meeting.status,
+                Meeting.summary,
+                Meeting.created_at
+            )
+            .where(Meeting.user_id == user_id)
+            # created_at has one-second resolution on SQLite; UUIDv7 IDs are
+            # time-ordered, so they keep same-second meetings newest first
+            .order_by(Meeting.created_at.desc(), Meeting.id.desc())
+        ).all()
     
     def get_meeting_by_id(
         self,
         db: Session,
         meeting_id: str,
-        user_id: str
+        user_id: str,
+        load_transcript: bool = True
     ) -> Meeting:
         """
         Get specific meeting by ID with user validation.
@@ -161,6 +388,7 @@ class MeetingService:
             db: Database session
             meeting_id: Meeting identifier
             user_id: User identifier for authorization
+            load_transcript: Load the transcript column eagerly (deferred otherwise)
             
         Returns:
             Meeting object
@@ -168,7 +396,10 @@ class MeetingService:
         Raises:
             HTTPException: If meeting not found or unauthorized
         """
-        meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
+        query = db.query(Meeting).filter(Meeting.id == meeting_id)
+        if not load_transcript:
+            query = query.options(defer(Meeting.transcript))
+        meeting = query.first()
         
         if not meeting:
             raise HTTPException(
@@ -1,21 +1,59 @@
 """RAG service with improved error handling and logging"""
 
-from typing import Dict, Any, List, Optional
+import asyncio
+import json
+from functools import lru_cache
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
+import tiktoken
 
 from app.services.vector_store_service import VectorStoreService
-from app.config import settings
-from app.constants import MODEL_GPT_4O_MINI, MAX_SNIPPET_LENGTH, MAX_CONTEXT_SNIPPETS
+from app.services.semantic_cache import SemanticCache
+from app.config import get_settings
+from app.constants import (
+    MODEL_GPT_4O_MINI,
+    MAX_SNIPPET_LENGTH,
+    MAX_CONTEXT_SNIPPETS,
+    MAX_CONTEXT_TOKENS,
+    OPENAI_PRIORITY_SERVICE_TIER,
+    OPENAI_MAX_RETRIES
+)
 from app.logger import setup_logger
+from app.http_client import get_openai_async_client
+from app.llm_limiter import get_llm_limiter
 from app.exceptions import VectorStoreError, EmbeddingError
 
+settings = get_settings()
+
 logger = setup_logger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _get_encoding() -> tiktoken.Encoding:
+    """Tokenizer for the answer model, loaded once per process"""
+    return tiktoken.encoding_for_model(MODEL_GPT_4O_MINI)
+
+
+NO_CONTEXT_ANSWER = "I don't have any meeting data to answer this question. Please upload some meetings first."
+
+
 class RAGService:
     """Service for querying meeting data using Retrieval Augmented Generation"""
     
+    ANSWER_PROMPT = ChatPromptTemplate.from_messages([
+        ("system", """You are a meeting assistant that answers questions ONLY using the provided meeting context.
+
+Rules:
+- Answer ONLY based on the context provided
+- If the context doesn't contain the answer, say "I don't have information about that in your meetings"
+- Be concise and specific
+- Cite the type of information you're using (transcript, decision, action item, summary, key point)
+- Do not make assumptions or add information not in the context
+- If multiple meetings are relevant, mention that"""),
+        ("user", "Context from meetings:\n{context}\n\nQuestion: {query}")
+    ])
+    
     def __init__(self):
         """Initialize RAG service with vector store and LLM"""
         logger.info("Initializing RAGService")
@@ -31,16 +69,22 @@ class RAGService:
                 model=MODEL_GPT_4O_MINI,
                 temperature=0,  # Deterministic answers
                 api_key=settings.openai_api_key,
-                max_tokens=1000
+                max_tokens=1000,
+                service_tier=OPENAI_PRIORITY_SERVICE_TIER if settings.openai_latency_optimized else None,
+                max_retries=OPENAI_MAX_RETRIES,
+                http_async_client=get_openai_async_client()
             )
             logger.info(f"Initialized LLM with model: {MODEL_GPT_4O_MINI}")
         except Exception as e:
             logger.error(f"Failed to initialize LLM: {e}")
             raise
         
+        # Answers to near-duplicate questions are served from the cache
+        self.cache = SemanticCache(self.vector_store) if settings.rag_cache_enabled else None
+        
         logger.info("RAGService initialized successfully")
     
-    def query_meetings(
+    async def query_meetings(
         self,
         user_id: str,
         query: str,
@@ -61,43 +105,30 @@ class RAGService:
             ValueError: If inputs are invalid
             VectorStoreError: If vector store operations fail
         """
-        # Validate inputs
-        if not user_id or not user_id.strip():
-            raise ValueError("user_id is required and cannot be empty")
-        if not query or not query.strip():
-            raise ValueError("query is required and cannot be empty")
+        self._validate_query(user_id, query)
         
         logger.info(f"Processing query for user {user_id}: '{query[:100]}...'")
         
         try:
-            # Retrieve relevant context from vector store
-            context_docs = self.vector_store.search(user_id, query, top_k)
+            query_embedding, cached, context_docs = await self._retrieve(user_id, query, top_k)
+            
+            if cached is not None:
+                return cached
             
             if not context_docs:
                 logger.info(f"No context found for user {user_id}")
                 return {
-                    "answer": "I don't have any meeting data to answer this question. Please upload some meetings first.",
+                    "answer": NO_CONTEXT_ANSWER,
                     "sources": [],
                     "context_used": []
                 }
             
-            logger.info(f"Retrieved {len(context_docs)} context documents")
-            
-            # Build context string
-            context = self._build_context(context_docs)
+            # Build context string, source IDs and snippets for transparency
+            context, source_meetings, context_used = self._prepare_context(context_docs)
             
             # Generate answer using LLM
             logger.debug("Generating answer with LLM")
-            answer = self._generate_answer(context, query)
-            
-            # Extract source meeting IDs
-            source_meetings = list(set([
-                doc['metadata']['meeting_id'] 
-                for doc in context_docs
-            ]))
-            
-            # Format context snippets for transparency
-            context_used = self._format_context_snippets(context_docs)
+            answer = await self._generate_answer(context, query)
             
             logger.info(
                 f"Query completed successfully. "
@@ -105,12 +136,17 @@ class RAGService:
                 f"answer length: {len(answer)} chars"
             )
             
-            return {
+            result = {
                 "answer": answer,
                 "sources": source_meetings,
                 "context_used": context_used
             }
             
+            if self.cache is not None:
+                await self.cache.store(user_id, query, query_embedding, result, top_k)
+            
+            return result
+            
         except (VectorStoreError, EmbeddingError) as e:
             logger.error(f"Vector store/embedding error: {e}")
             raise
@@ -118,83 +154,222 @@ class RAGService:
             logger.error(f"Unexpected error in query_meetings: {e}", exc_info=True)
             raise
     
-    def _build_context(self, context_docs: List[Dict]) -> str:
+    async def query_meetings_stream(
+        self,
+        user_id: str,
+        query: str,
+        top_k: Optional[int] = None
+    ) -> AsyncIterator[str]:
         """
-        Build context string from retrieved documents.
+        Query user's meetings and stream the answer as server-sent events.
+        
+        Emits one ``token`` event per LLM chunk as it arrives, then a
+        ``sources`` event carrying the source meeting IDs and context
+        snippets. Input validation and retrieval happen before the first
+        event, so their errors surface before any response is sent.
         
         Args:
-            context_docs: List of retrieved documents
+            user_id: User identifier
+            query: User's question
+            top_k: Number of context chunks to retrieve
             
-        Returns:
-            Formatted context string
+        Yields:
+            SSE-formatted event strings
+            
+        Raises:
+            ValueError: If inputs are invalid
+            VectorStoreError: If vector store operations fail
         """
-        context_parts = []
-        for doc in context_docs:
-            doc_type = doc['metadata'].get('type', 'unknown')
-            content = doc['content']
-            context_parts.append(f"[{doc_type}] {content}")
+        self._validate_query(user_id, query)
         
-        context = "\n\n".join(context_parts)
-        logger.debug(f"Built context with {len(context)} characters")
-        return context
+        logger.info(f"Processing streaming query for user {user_id}: '{query[:100]}...'")
+        
+        query_embedding, cached, context_docs = await self._retrieve(user_id, query, top_k)
+        
+        if cached is not None:
+            yield self._sse("token", {"content": cached["answer"]})
+            yield self._sse("sources", {
+                "sources": cached["sources"],
+                "context_used": cached["context_used"]
+            })
+            return
+        
+        if not context_docs:
+            logger.info(f"No context found for user {user_id}")
+            yield self._sse("token", {"content": NO_CONTEXT_ANSWER})
+            yield self._sse("sources", {"sources": [], "context_used": []})
+            return
+        
+        context, source_meetings, context_used = self._prepare_context(context_docs)
+        chain = self.ANSWER_PROMPT | self.llm
+        answer_parts = []
+        
+        try:
+            async with get_llm_limiter():
+                async for chunk in chain.astream({"context": context, "query": query}):
+                    if chunk.content:
+                        answer_parts.append(chunk.content)
+                        yield self._sse("token", {"content": chunk.content})
+        except Exception as e:
+            # Headers are already sent, so report the failure in-band
+            logger.error(f"LLM streaming failed: {e}")
+            yield self._sse("error", {"detail": "Failed to generate answer"})
+            return
+        
+        result = {
+            "answer": "".join(answer_parts),
+            "sources": source_meetings,
+            "context_used": context_used
+        }
+        yield self._sse("sources", {
+            "sources": result["sources"],
+            "context_used": result["context_used"]
+        })
+        
+        if self.cache is not None:
+            await self.cache.store(user_id, query, query_embedding, result, top_k)
+        
+        logger.info(f"Streaming query completed for user {user_id}")
     
-    def _generate_answer(self, context: str, query: str) -> str:
+    def _validate_query(self, user_id: str, query: str) -> None:
         """
-        Generate answer using LLM with strict grounding.
+        Validate query inputs.
         
         Args:
-            context: Context string from retrieved documents
+            user_id: User identifier
+            query: User's question
+            
+        Raises:
+            ValueError: If either value is empty
+        """
+        if not user_id or not user_id.strip():
+            raise ValueError("user_id is required and cannot be empty")
+        if not query or not query.strip():
+            raise ValueError("query is required and cannot be empty")
+    
+    async def _retrieve(
+        self,
+        user_id: str,
+        query: str,
+        top_k: Optional[int]
+    ) -> Tuple[List[float], Optional[Dict[str, Any]], List[Dict]]:
+        """
+        Embed the query once and use it for the cache lookup and the search.
+        
+        The user's collection is looked up while the query is embedded.
+        
+        Args:
+            user_id: User identifier
             query: User's question
+            top_k: Number of context chunks to retrieve
             
         Returns:
-            Generated answer
+            Tuple of (query_embedding, cached_result, context_docs); context_docs
+            is empty when the answer came from the cache
         """
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", """You are a meeting assistant that answers questions ONLY using the provided meeting context.
-
-Rules:
-- Answer ONLY based on the context provided
-- If the context doesn't contain the answer, say "I don't have information about that in your meetings"
-- Be concise and specific
-- Cite the type of information you're using (transcript, decision, action item, summary, key point)
-- Do not make assumptions or add information not in the context
-- If multiple meetings are relevant, mention that"""),
-            ("user", "Context from meetings:\n{context}\n\nQuestion: {query}")
-        ])
+        query_embedding, collection_id = await asyncio.gather(
+            self.vector_store.embed_query(query),
+            self.vector_store.get_collection_id(user_id)
+        )
         
-        try:
-            chain = prompt | self.llm
-            response = chain.invoke({"context": context, "query": query})
-            return response.content
-        except Exception as e:
-            logger.error(f"LLM generation failed: {e}")
-            raise RuntimeError(f"Failed to generate answer: {str(e)}") from e
+        if self.cache is not None:
+            cached = await self.cache.lookup(user_id, query_embedding, top_k)
+            if cached is not None:
+                return query_embedding, cached, []
+        
+        if collection_id is None:
+            return query_embedding, None, []
+        
+        # Retrieve relevant context from vector store
+        context_docs = await self.vector_store.search_by_embedding(
+            user_id, query_embedding, top_k, collection_id
+        )
+        if context_docs:
+            logger.info(f"Retrieved {len(context_docs)} context documents")
+        return query_embedding, None, context_docs
+    
+    @staticmethod
+    def _sse(event: str, data: Dict[str, Any]) -> str:
+        """Format one server-sent event with a JSON payload"""
+        return f"event: {event}\ndata: {json.dumps(data)}\n\n"
     
-    def _format_context_snippets(self, context_docs: List[Dict]) -> List[Dict]:
+    def _prepare_context(self, context_docs: List[Dict]) -> Tuple[str, List[str], List[Dict]]:
         """
-        Format context snippets for response transparency.
+        Build the LLM context, source list and response snippets in one pass.
+        
+        Documents are added to the context most relevant first until
+        MAX_CONTEXT_TOKENS is reached; the document that crosses the budget
+        is cut at a token boundary and later ones only contribute sources and
+        snippets, which keeps prefill cost bounded regardless of top_k.
         
         Args:
-            context_docs: List of context documents
+            context_docs: List of retrieved documents
             
         Returns:
-            List of formatted context snippets
+            Tuple of (context string, distinct source meeting IDs in
+            relevance order, top MAX_CONTEXT_SNIPPETS formatted snippets)
         """
+        encoding = _get_encoding()
+        budget = MAX_CONTEXT_TOKENS
+        context_parts = []
+        sources = {}
         context_used = []
         
-        # Return top N most relevant documents
-        for doc in context_docs[:MAX_CONTEXT_SNIPPETS]:
-            snippet = doc['content']
+        for i, doc in enumerate(sorted(context_docs, key=lambda d: d.get('distance', 0))):
+            metadata = doc['metadata']
+            doc_type = metadata.get('type', 'unknown')
+            content = doc['content']
+            meeting_id = metadata['meeting_id']
             
-            # Truncate long snippets
-            if len(snippet) > MAX_SNIPPET_LENGTH:
-                snippet = snippet[:MAX_SNIPPET_LENGTH] + "..."
+            sources.setdefault(meeting_id, None)
             
-            context_used.append({
-                "type": doc['metadata'].get('type', 'unknown'),
-                "meeting_id": doc['metadata']['meeting_id'],
-                "snippet": snippet,
-                "relevance_score": 1.0 - doc.get('distance', 0)  # Convert distance to score
-            })
+            if budget > 0:
+                part = f"[{doc_type}] {content}"
+                tokens = encoding.encode(part)
+                
+                if len(tokens) > budget:
+                    # Drop a trailing partial character left by the token cut
+                    context_parts.append(encoding.decode(tokens[:budget]).rstrip("\ufffd"))
+                    budget = 0
+                else:
+                    context_parts.append(part)
+                    budget -= len(tokens) + 1  # +1 for the separator
+            
+            # Return top N most relevant documents for transparency
+            if i < MAX_CONTEXT_SNIPPETS:
+                context_used.append({
+                    "type": doc_type,
+                    "meeting_id": meeting_id,
+                    "snippet": (
+                        content if len(content) <= MAX_SNIPPET_LENGTH
+                        else content[:MAX_SNIPPET_LENGTH] + "..."
+                    ),
+                    "relevance_score": 1.0 - doc.get('distance', 0)  # Convert distance to score
+                })
         
-        return context_used
+        context = "\n\n".join(context_parts)
+        logger.debug(
+            f"Built context with {len(context)} characters "
+            f"({len(context_parts)}/{len(context_docs)} docs, {len(sources)} meetings)"
+        )
+        return context, list(sources), context_used
+    
+    async def _generate_answer(self, context: str, query: str) -> str:
+        """
+        Generate answer using LLM with strict grounding.
+        
+        Args:
+            context: Context string from retrieved documents
+            query: User's question
+            
+        Returns:
+            Generated answer
+        """
+        try:
+            chain = self.ANSWER_PROMPT | self.llm
+            async with get_llm_limiter():
+                response = await chain.ainvoke({"context": context, "query": query})
+            return response.content
+        except Exception as e:
+            logger.error(f"LLM generation failed: {e}")
+            raise RuntimeError(f"Failed to generate answer: {str(e)}") from e
@@ -0,0 +1,156 @@
+"""Per-user cache of vector search results for near-duplicate queries"""
+
+import math
+import operator
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.constants import (
+    SEARCH_CACHE_ENTRIES_PER_USER,
+    SEARCH_CACHE_MAX_USERS,
+    SEARCH_CACHE_MIN_SIMILARITY,
+    SEARCH_CACHE_TTL_SECONDS
+)
+
+# (unit-length query embedding, top_k, results, stored at)
+_Entry = Tuple[array, int, List[Dict[str, Any]], float]
+
+
+class SearchResultCache:
+    """
+    Recent (query embedding, results) pairs per user, matched by cosine similarity.
+    
+    A query whose embedding is at least min_similarity to a fresh entry with
+    the same top_k reuses that entry's results instead of querying Chroma.
+    Entries for a user are dropped whenever that user's meetings change.
+    """
+    
+    def __init__(
+        self,
+        min_similarity: float = SEARCH_CACHE_MIN_SIMILARITY,
+        ttl_seconds: float = SEARCH_CACHE_TTL_SECONDS,
+        entries_per_user: int = SEARCH_CACHE_ENTRIES_PER_USER,
+        max_users: int = SEARCH_CACHE_MAX_USERS
+    ):
+        """
+        Initialize the cache.
+        
+        Args:
+            min_similarity: Smallest cosine similarity that counts as a hit
+            ttl_seconds: Entry lifetime
+            entries_per_user: Entries kept per user (LRU)
+            max_users: Users kept (LRU)
+        """
+        self.min_similarity = min_similarity
+        self.ttl_seconds = ttl_seconds
+        self.entries_per_user = entries_per_user
+        self.max_users = max_users
+        self._users: "OrderedDict[str, List[_Entry]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _normalize(embedding: List[float]) -> Optional[array]:
+        """Unit-length float32 copy of an embedding, or None for a zero vector"""
+        norm = math.sqrt(sum(x * x for x in embedding))
+        if norm == 0:
+            return None
+        return array("f", [x / norm for x in embedding])
+    
+    def get(self, user_id: str, query_embedding: List[float], top_k: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Find results stored for a near-duplicate query.
+        
+        Args:
+            user_id: User identifier
+            query_embedding: Embedding of the incoming query
+            top_k: Number of results requested
+        
+        Returns:
+            Cached results, or None on a miss
+        """
+        query = self._normalize(query_embedding)
+        if query is None:
+            return None
+        
+        cutoff = time.monotonic() - self.ttl_seconds
+        
+        with self._lock:
+            entries = self._users.get(user_id)
+            if not entries:
+                return None
+            
+            entries[:] = [entry for entry in entries if entry[3] >= cutoff]
+            best_index, best_similarity = -1, self.min_similarity
+            for i, (vector, entry_top_k, _, _) in enumerate(entries):
+                if entry_top_k != top_k:
+                    continue
+                similarity = sum(map(operator.mul, vector, query))
+                if similarity >= best_similarity:
+                    best_index, best_similarity = i, similarity
+            
+            if best_index < 0:
+                return None
+            
+            # Most recently used entries live at the end
+            entry = entries.pop(best_index)
+            entries.append(entry)
+            self._users.move_to_end(user_id)
+            return list(entry[2])
+    
+    def put(
+        self,
+        user_id: str,
+        query_embedding: List[float],
+        top_k: int,
+        results: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Remember the results of a query.
+        
+        Args:
+            user_id: User identifier
+            query_embedding: Embedding of the query
+            top_k: Number of results requested
+            results: Search results
+        """
+        vector = self._normalize(query_embedding)
+        if vector is None:
+            return
+        
+        with self._lock:
+            entries = self._users.setdefault(user_id, [])
+            self._users.move_to_end(user_id)
+            entries.append((vector, top_k, list(results), time.monotonic()))
+            del entries[:-self.entries_per_user]
+            
+            while len(self._users) > self.max_users:
+                self._users.popitem(last=False)
+    
+    def invalidate(self, user_id: str) -> None:
+        """
+        Drop every cached result for a user.
+        
+        Args:
+            user_id: User whose meetings changed
+        """
+        with self._lock:
+            self._users.pop(user_id, None)
+
+
+_search_result_cache: Optional[SearchResultCache] = None
+
+
+def get_search_result_cache() -> SearchResultCache:
+    """
+    Get the search result cache shared by every VectorStoreService in the process.
+    
+    Returns:
+        Shared SearchResultCache
+    """
+    global _search_result_cache
+    if _search_result_cache is None:
+        _search_result_cache = SearchResultCache()
+    return _search_result_cache
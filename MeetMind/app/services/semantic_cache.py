@@ -0,0 +1,215 @@
+"""Semantic cache for RAG answers keyed by query embedding"""
+
+import json
+import orjson
+import time
+import uuid
+from typing import Dict, Any, List, Optional
+
+from app.services.vector_store_service import VectorStoreService
+from app.config import get_settings
+from app.constants import QA_CACHE_MAX_DISTANCE
+from app.logger import setup_logger
+
+settings = get_settings()
+
+logger = setup_logger(__name__)
+
+
+class SemanticCache:
+    """
+    Cache of answered questions stored in a per-user Chroma collection.
+    
+    Each entry holds the question embedding plus the serialized answer
+    payload. A new question whose embedding is within QA_CACHE_MAX_DISTANCE
+    (cosine) of a fresh entry reuses that answer instead of calling the LLM.
+    Entries are only reused for the same top_k, and the whole collection is
+    dropped whenever the user's meetings change (see invalidate).
+    """
+    
+    def __init__(
+        self,
+        vector_store: VectorStoreService,
+        ttl_seconds: Optional[int] = None,
+        max_distance: float = QA_CACHE_MAX_DISTANCE
+    ):
+        """
+        Initialize the cache on top of an existing vector store.
+        
+        Args:
+            vector_store: Vector store whose HTTP client and credentials are reused
+            ttl_seconds: Entry lifetime (default from settings)
+            max_distance: Largest cosine distance that counts as a hit
+        """
+        self.vector_store = vector_store
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.rag_cache_ttl_seconds
+        self.max_distance = max_distance
+    
+    def _get_collection_name(self, user_id: str) -> str:
+        """Get the cache collection name for a user"""
+        safe_user_id = self.vector_store._sanitize_user_id(user_id)
+        return f"user_{safe_user_id}_qa_cache"
+    
+    async def lookup(
+        self,
+        user_id: str,
+        query_embedding: List[float],
+        top_k: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find a cached answer for a semantically equivalent question.
+        
+        Expired entries found on the way are evicted. Cache failures are
+        logged and treated as a miss so they never fail the query.
+        
+        Args:
+            user_id: User identifier
+            query_embedding: Embedding of the incoming question
+            top_k: Number of context chunks the answer must have used (default from settings)
+        
+        Returns:
+            Cached answer payload, or None on a miss
+        """
+        vs = self.vector_store
+        if top_k is None:
+            top_k = settings.rag_top_k
+        
+        try:
+            collection_name = self._get_collection_name(user_id)
+            collection_id = await vs._find_collection(collection_name)
+            if collection_id is None:
+                return None
+            
+            response = await vs._post_to_collection(
+                collection_name,
+                collection_id,
+                "query",
+                {
+                    "query_embeddings": [query_embedding],
+                    "n_results": 1,
+                    "where": {"top_k": top_k},
+                    "include": ["metadatas", "distances"]
+                }
+            )
+            if response.status_code != 200:
+                return None
+            
+            results = orjson.loads(response.content)
+            if not results.get("ids") or not results["ids"][0]:
+                return None
+            
+            metadata = results["metadatas"][0][0]
+            distance = results["distances"][0][0]
+            cutoff = time.time() - self.ttl_seconds
+            
+            if metadata.get("ts", 0) < cutoff:
+                await self._evict_expired(collection_name, collection_id, cutoff)
+                return None
+            
+            if distance >= self.max_distance:
+                return None
+            
+            logger.info(f"Semantic cache hit for user {user_id} (distance={distance:.4f})")
+            return json.loads(metadata["payload"])
+        
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup failed for user {user_id}: {e}")
+            return None
+    
+    async def store(
+        self,
+        user_id: str,
+        query: str,
+        query_embedding: List[float],
+        result: Dict[str, Any],
+        top_k: Optional[int] = None
+    ) -> None:
+        """
+        Save an answer for later near-duplicate questions.
+        
+        Args:
+            user_id: User identifier
+            query: Question that was answered
+            query_embedding: Embedding of the question
+            result: Answer payload (answer, sources, context_used)
+            top_k: Number of context chunks the answer was built from (default from settings)
+        """
+        vs = self.vector_store
+        if top_k is None:
+            top_k = settings.rag_top_k
+        
+        try:
+            collection_name = self._get_collection_name(user_id)
+            collection_id = await vs._get_or_create_collection(
+                collection_name,
+                metadata={"hnsw:space": "cosine"}
+            )
+            response = await vs._post_to_collection(
+                collection_name,
+                collection_id,
+                "add",
+                {
+                    "ids": [uuid.uuid4().hex],
+                    "embeddings": [query_embedding],
+                    "documents": [query],
+                    "metadatas": [{
+                        "ts": time.time(),
+                        "top_k": top_k,
+                        "payload": json.dumps(result)
+                    }]
+                }
+            )
+            if response.status_code not in [200, 201]:
+                logger.warning(f"Semantic cache store returned status {response.status_code}")
+        except Exception as e:
+            logger.warning(f"Semantic cache store failed for user {user_id}: {e}")
+    
+    async def invalidate(self, user_id: str) -> None:
+        """
+        Drop every cached answer for a user.
+        
+        Called when the user's meetings are indexed or deleted, since cached
+        answers may cite meetings that changed or no longer exist. Failures
+        are logged; the TTL still bounds how long a stale answer can live.
+        
+        Args:
+            user_id: User identifier
+        """
+        vs = self.vector_store
+        
+        try:
+            collection_name = self._get_collection_name(user_id)
+            collection_id = await vs._find_collection(collection_name)
+            if collection_id is None:
+                return
+            
+            response = await vs._post_to_collection(
+                collection_name,
+                collection_id,
+                "delete",
+                {"where": {"ts": {"$gte": 0}}}
+            )
+            if response.status_code not in [200, 201]:
+                logger.warning(f"Semantic cache invalidate returned status {response.status_code}")
+        except Exception as e:
+            logger.warning(f"Semantic cache invalidate failed for user {user_id}: {e}")
+    
+    async def _evict_expired(self, collection_name: str, collection_id: str, cutoff: float) -> None:
+        """
+        Delete entries written before cutoff.
+        
+        Args:
+            collection_name: Cache collection name
+            collection_id: Cache collection ID
+            cutoff: Unix timestamp; older entries are removed
+        """
+        response = await self.vector_store._post_to_collection(
+            collection_name,
+            collection_id,
+            "delete",
+            {"where": {"ts": {"$lt": cutoff}}}
+        )
+        if response.status_code not in [200, 201]:
+            logger.warning(f"Semantic cache eviction returned status {response.status_code}")
+        else:
+            logger.debug("Evicted expired semantic cache entries")
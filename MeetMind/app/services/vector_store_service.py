@@ -1,18 +1,47 @@
 """Vector store service with improved error handling and performance"""
 
+import asyncio
 import httpx
+import orjson
+from array import array
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 from langchain_openai import OpenAIEmbeddings
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
-from app.config import settings
+from app.config import get_settings
 from app.constants import *
 from app.logger import setup_logger
 from app.exceptions import VectorStoreError, CollectionError, EmbeddingError
+from app.http_client import get_chroma_async_client, get_openai_async_client
+from app.services.embedding_cache import get_embedding_cache
+from app.services.search_result_cache import get_search_result_cache
+
+settings = get_settings()
 
 logger = setup_logger(__name__)
 
+# Collection name -> ID, shared by every VectorStoreService in the process.
+# IDs never change while a collection exists, so only a 404 evicts an entry.
+_collection_ids: Dict[str, str] = {}
+
+
+def _json_default(obj: Any) -> Any:
+    """orjson fallback that writes float32 embedding arrays as JSON lists"""
+    if isinstance(obj, array):
+        return obj.tolist()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+@lru_cache(maxsize=1)
+def _get_text_splitter() -> RecursiveCharacterTextSplitter:
+    """Transcript splitter built from settings once per process"""
+    return RecursiveCharacterTextSplitter(
+        chunk_size=settings.rag_chunk_size,
+        chunk_overlap=settings.rag_chunk_overlap,
+        separators=["\n\n", "\n", ". ", " ", ""]
+    )
+
 
 class VectorStoreService:
     """Service for managing Chroma Cloud vector store with user isolation"""
@@ -33,44 +62,42 @@ class VectorStoreService:
             "X-Chroma-Database": settings.chroma_database
         }
         
-        # Persistent HTTP client with connection pooling
-        self.http_client = httpx.Client(
-            timeout=HTTP_TIMEOUT_MEDIUM,
-            limits=httpx.Limits(
-                max_keepalive_connections=HTTP_MAX_KEEPALIVE,
-                max_connections=HTTP_MAX_CONNECTIONS
-            )
-        )
+        # Application-wide async HTTP client, so Chroma round trips never
+        # block the event loop and connections are pooled across requests
+        self.http_client = get_chroma_async_client()
+        self._collection_id_cache = _collection_ids
         
         # Initialize OpenAI embeddings
         try:
+            # Chunks come from the text splitter and are far below the model's
+            # context limit, so raw texts are sent as-is in batched requests
+            # instead of being tokenized client-side first. Requests go through
+            # the pooled HTTP/2 client shared with the chat models, so a new
+            # service instance does not open its own connections.
             self.embeddings = OpenAIEmbeddings(
                 model=settings.embedding_model,
-                openai_api_key=settings.openai_api_key
+                openai_api_key=settings.openai_api_key,
+                chunk_size=EMBEDDING_BATCH_SIZE,
+                check_embedding_ctx_length=False,
+                max_retries=OPENAI_MAX_RETRIES,
+                http_async_client=get_openai_async_client()
             )
             logger.info(f"Initialized embeddings with model: {settings.embedding_model}")
         except Exception as e:
             logger.error(f"Failed to initialize embeddings: {e}")
             raise EmbeddingError(f"Embedding initialization failed: {str(e)}") from e
         
-        # Text splitter for chunking transcripts
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=settings.rag_chunk_size,
-            chunk_overlap=settings.rag_chunk_overlap,
-            separators=["\n\n", "\n", ". ", " ", ""]
-        )
+        # Text splitter for chunking transcripts; stateless, so shared
+        self.text_splitter = _get_text_splitter()
+        
+        # Embeddings of previously seen texts, shared across service instances
+        self.embedding_cache = get_embedding_cache()
+        
+        # Results of recent searches, reused for near-duplicate queries
+        self.search_cache = get_search_result_cache()
         
         logger.info("VectorStoreService initialized successfully")
     
-    def __del__(self):
-        """Cleanup HTTP client on destruction"""
-        if hasattr(self, 'http_client'):
-            try:
-                self.http_client.close()
-                logger.debug("HTTP client closed")
-            except Exception as e:
-                logger.warning(f"Error closing HTTP client: {e}")
-    
     def _sanitize_user_id(self, user_id: str) -> str:
         """
         Sanitize user ID for collection name.
@@ -103,18 +130,155 @@ class VectorStoreService:
         safe_user_id = self._sanitize_user_id(user_id)
         return f"user_{safe_user_id}_meetings"
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(httpx.HTTPError)
-    )
-    def _get_or_create_collection(self, collection_name: str) -> str:
+    async def _send_with_backoff(self, method: str, url: str, **kwargs) -> httpx.Response:
         """
-        Get or create a collection with retry logic.
+        Send a Chroma request, retrying throttled responses.
+        
+        429 and 503 responses are retried up to CHROMA_THROTTLE_RETRIES times,
+        waiting for the server's Retry-After (in seconds) when given and an
+        exponential backoff otherwise. Connection failures are already
+        retried by the client's transport.
+        
+        A json body is serialized once with orjson, which is much faster than
+        httpx's stdlib encoder for embedding-heavy payloads.
+        
+        Args:
+            method: HTTP client method name (get, post)
+            url: Request URL
+            **kwargs: Extra arguments for httpx (json, timeout)
+            
+        Returns:
+            Response of the last attempt
+        """
+        send = getattr(self.http_client, method)
+        if "json" in kwargs:
+            kwargs["content"] = orjson.dumps(kwargs.pop("json"), default=_json_default)
+        for attempt in range(CHROMA_THROTTLE_RETRIES + 1):
+            response = await send(url, headers=self.headers, **kwargs)
+            if response.status_code not in (429, 503) or attempt == CHROMA_THROTTLE_RETRIES:
+                return response
+            
+            try:
+                delay = float(response.headers.get("Retry-After"))
+            except (TypeError, ValueError):
+                delay = CHROMA_BACKOFF_BASE_SECONDS * 2 ** attempt
+            delay = min(max(delay, 0.0), CHROMA_BACKOFF_MAX_SECONDS)
+            
+            logger.warning(f"Chroma returned {response.status_code}; retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+        return response
+    
+    async def _find_collection(self, collection_name: str) -> Optional[str]:
+        """
+        Look up an existing collection by name.
+        
+        Found IDs are cached, so only the first lookup per collection costs a
+        round trip. Missing collections are not cached since they may be
+        created later.
         
         Args:
             collection_name: Name of the collection
             
+        Returns:
+            Collection ID, or None if it doesn't exist
+        """
+        collection_id = self._collection_id_cache.get(collection_name)
+        if collection_id is not None:
+            return collection_id
+        
+        response = await self._send_with_backoff(
+            "get",
+            f"{self.base_url}/api/{CHROMA_API_VERSION}/collections/{collection_name}"
+        )
+        if response.status_code != 200:
+            return None
+        
+        collection_id = orjson.loads(response.content)["id"]
+        self._collection_id_cache[collection_name] = collection_id
+        return collection_id
+    
+    async def _post_to_collection(
+        self,
+        collection_name: str,
+        collection_id: str,
+        action: str,
+        payload: Dict[str, Any],
+        create: bool = False,
+        **kwargs
+    ) -> httpx.Response:
+        """
+        POST to a collection endpoint, recovering once from a stale cached ID.
+        
+        A 404 means the collection was deleted (and possibly recreated)
+        behind our back, so the cached ID is dropped, the name resolved
+        again and the request retried with the new ID.
+        
+        Args:
+            collection_name: Name of the collection
+            collection_id: Collection ID the caller resolved
+            action: Collection endpoint (query, add, delete)
+            payload: JSON body
+            create: Recreate the collection if it no longer exists
+            **kwargs: Extra arguments for httpx (e.g. timeout)
+            
+        Returns:
+            Response of the last attempt
+        """
+        url = f"{self.base_url}/api/{CHROMA_API_VERSION}/collections/{{}}/{action}"
+        response = await self._send_with_backoff(
+            "post", url.format(collection_id), json=payload, **kwargs
+        )
+        if response.status_code != 404:
+            return response
+        
+        logger.warning(f"Collection {collection_name} not found by cached ID {collection_id}; resolving again")
+        self._collection_id_cache.pop(collection_name, None)
+        if create:
+            new_id = await self._get_or_create_collection(collection_name)
+        else:
+            new_id = await self._find_collection(collection_name)
+        if new_id is None or new_id == collection_id:
+            return response
+        
+        return await self._send_with_backoff(
+            "post", url.format(new_id), json=payload, **kwargs
+        )
+    
+    async def get_collection_id(self, user_id: str) -> Optional[str]:
+        """
+        Get the ID of a user's meetings collection.
+        
+        Lookup failures are logged and treated as a missing collection, the
+        same way search treats them.
+        
+        Args:
+            user_id: User identifier
+            
+        Returns:
+            Collection ID, or None if the user has no collection
+        """
+        try:
+            collection_id = await self._find_collection(self._get_collection_name(user_id))
+        except Exception as e:
+            logger.error(f"Collection lookup failed for user {user_id}: {e}")
+            return None
+        
+        if collection_id is None:
+            logger.warning(f"No collection found for user {user_id}")
+        return collection_id
+    
+    async def _get_or_create_collection(
+        self,
+        collection_name: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Get or create a collection.
+        
+        Args:
+            collection_name: Name of the collection
+            metadata: Extra collection metadata used on creation
+            
         Returns:
             Collection ID
             
@@ -123,29 +287,26 @@ class VectorStoreService:
         """
         try:
             # Try to get existing collection
-            response = self.http_client.get(
-                f"{self.base_url}/api/{CHROMA_API_VERSION}/collections/{collection_name}",
-                headers=self.headers
-            )
+            collection_id = await self._find_collection(collection_name)
             
-            if response.status_code == 200:
-                collection_id = response.json()["id"]
+            if collection_id is not None:
                 logger.debug(f"Found existing collection: {collection_name}")
                 return collection_id
             
             # Create new collection
             logger.info(f"Creating new collection: {collection_name}")
-            response = self.http_client.post(
+            response = await self._send_with_backoff(
+                "post",
                 f"{self.base_url}/api/{CHROMA_API_VERSION}/collections",
-                headers=self.headers,
                 json={
                     "name": collection_name,
-                    "metadata": {"user_collection": "true"}
+                    "metadata": {"user_collection": "true", **(metadata or {})}
                 }
             )
             
             if response.status_code in [200, 201]:
-                collection_id = response.json()["id"]
+                collection_id = orjson.loads(response.content)["id"]
+                self._collection_id_cache[collection_name] = collection_id
                 logger.info(f"Created collection: {collection_name} (ID: {collection_id})")
                 return collection_id
             
@@ -160,7 +321,7 @@ class VectorStoreService:
             logger.error(f"Unexpected error in _get_or_create_collection: {e}")
             raise CollectionError(f"Collection operation failed: {str(e)}") from e
     
-    def index_meeting(
+    async def index_meeting(
         self,
         user_id: str,
         meeting_id: str,
@@ -168,11 +329,21 @@ class VectorStoreService:
         summary: str,
         decisions: List[str],
         action_items: List[str],
-        key_points: List[str]
+        key_points: List[str],
+        batch_size: int = EMBEDDING_BATCH_SIZE
     ) -> None:
         """
         Index meeting data in user's Chroma Cloud collection.
         
+        All documents (transcript chunks, summary, decisions, action items and
+        key points) are embedded together, batch_size texts per embeddings
+        request with up to EMBEDDING_MAX_CONCURRENCY requests in flight, and
+        reassembled in document order so embeddings line up with ids and
+        metadata. The collection lookup runs concurrently with embedding, and
+        the documents are then added in CHROMA_ADD_BATCH_SIZE batches. If a
+        batch fails, records already added for the meeting are deleted before
+        the error is raised.
+        
         Args:
             user_id: User identifier
             meeting_id: Meeting identifier
@@ -181,6 +352,7 @@ class VectorStoreService:
             decisions: List of decisions
             action_items: List of action items
             key_points: List of key points
+            batch_size: Number of texts per embeddings API request
             
         Raises:
             VectorStoreError: If indexing fails
@@ -188,9 +360,7 @@ class VectorStoreService:
         logger.info(f"Indexing meeting {meeting_id} for user {user_id}")
         
         try:
-            # Get or create collection
             collection_name = self._get_collection_name(user_id)
-            collection_id = self._get_or_create_collection(collection_name)
             
             # Prepare documents
             documents, metadatas, ids = self._prepare_documents(
@@ -199,31 +369,23 @@ class VectorStoreService:
             
             logger.info(f"Generating embeddings for {len(documents)} documents")
             
-            # Generate embeddings
-            try:
-                embeddings = self.embeddings.embed_documents(documents)
-            except Exception as e:
-                logger.error(f"Embedding generation failed: {e}")
-                raise EmbeddingError(f"Failed to generate embeddings: {str(e)}") from e
+            # Get or create collection while embeddings are generated
+            collection_id, embeddings = await asyncio.gather(
+                self._get_or_create_collection(collection_name),
+                self._embed_documents(documents, batch_size)
+            )
             
             # Add to collection
             logger.debug(f"Adding documents to collection {collection_id}")
-            response = self.http_client.post(
-                f"{self.base_url}/api/{CHROMA_API_VERSION}/collections/{collection_id}/add",
-                headers=self.headers,
-                json={
-                    "ids": ids,
-                    "embeddings": embeddings,
-                    "documents": documents,
-                    "metadatas": metadatas
-                },
-                timeout=HTTP_TIMEOUT_LONG
-            )
-            
-            if response.status_code not in [200, 201]:
-                raise VectorStoreError(
-                    f"Failed to add documents: {response.status_code} - {response.text}"
+            try:
+                await self._add_documents(
+                    collection_name, collection_id, ids, embeddings, documents, metadatas
                 )
+            except Exception:
+                # Batches added before the failure would leave a partial meeting behind
+                await self.delete_meeting(user_id, meeting_id)
+                raise
+            await self._invalidate_caches(user_id)
             
             logger.info(f"Successfully indexed meeting {meeting_id} ({len(documents)} documents)")
             
@@ -234,6 +396,126 @@ class VectorStoreService:
             logger.error(f"Failed to index meeting {meeting_id}: {e}", exc_info=True)
             raise VectorStoreError(f"Indexing failed: {str(e)}") from e
     
+    async def _add_documents(
+        self,
+        collection_name: str,
+        collection_id: str,
+        ids: List[str],
+        embeddings: List[array],
+        documents: List[str],
+        metadatas: List[Dict]
+    ) -> None:
+        """
+        Add records to a collection in bounded, concurrent batches.
+        
+        Large meetings would otherwise go out as one multi-megabyte request
+        that is slow to upload and more likely to time out. When a batch
+        fails, the batches still pending are cancelled and awaited before the
+        error is raised, so none of them lands after the caller cleans up.
+        
+        Args:
+            collection_name: Target collection name
+            collection_id: Target collection ID
+            ids: Record IDs
+            embeddings: Embeddings aligned with ids
+            documents: Document texts aligned with ids
+            metadatas: Metadata aligned with ids
+            
+        Raises:
+            VectorStoreError: If any batch is rejected (message names the batch)
+        """
+        semaphore = asyncio.Semaphore(CHROMA_ADD_MAX_CONCURRENCY)
+        
+        async def add_batch(batch_index: int, start: int) -> None:
+            end = start + CHROMA_ADD_BATCH_SIZE
+            async with semaphore:
+                response = await self._post_to_collection(
+                    collection_name,
+                    collection_id,
+                    "add",
+                    {
+                        "ids": ids[start:end],
+                        "embeddings": embeddings[start:end],
+                        "documents": documents[start:end],
+                        "metadatas": metadatas[start:end]
+                    },
+                    create=True,
+                    timeout=HTTP_TIMEOUT_LONG
+                )
+            
+            if response.status_code not in [200, 201]:
+                raise VectorStoreError(
+                    f"Failed to add documents (batch {batch_index}, records {start}-{min(end, len(ids)) - 1}): "
+                    f"{response.status_code} - {response.text}"
+                )
+        
+        tasks = [
+            asyncio.ensure_future(add_batch(batch_index, start))
+            for batch_index, start in enumerate(range(0, len(ids), CHROMA_ADD_BATCH_SIZE))
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+    
+    async def _embed_documents(self, documents: List[str], batch_size: int) -> List[array]:
+        """
+        Generate embeddings for documents to index.
+        
+        Texts already in the embedding cache (and repeats within the
+        meeting) are not sent again. The remaining batches are requested
+        concurrently (bounded by a semaphore) rather than one after another,
+        so a long meeting costs roughly ceil(batches / EMBEDDING_MAX_CONCURRENCY)
+        round trips.
+        
+        Vectors are held as float32 arrays until they are serialized for
+        /add, instead of one Python float object per dimension.
+        
+        Args:
+            documents: Texts to embed
+            batch_size: Number of texts per embeddings API request
+            
+        Returns:
+            Embeddings (array('f')) in document order
+            
+        Raises:
+            EmbeddingError: If embedding generation fails
+        """
+        semaphore = asyncio.Semaphore(EMBEDDING_MAX_CONCURRENCY)
+        
+        async def embed_batch(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                return await self.embeddings.aembed_documents(batch, chunk_size=batch_size)
+        
+        embeddings = await self.embedding_cache.aget_many_arrays(documents)
+        misses = list(dict.fromkeys(
+            text for text, embedding in zip(documents, embeddings) if embedding is None
+        ))
+        if not misses:
+            return embeddings
+        
+        try:
+            # gather returns results in submission order
+            batches = await asyncio.gather(*(
+                embed_batch(misses[start:start + batch_size])
+                for start in range(0, len(misses), batch_size)
+            ))
+        except Exception as e:
+            logger.error(f"Embedding generation failed: {e}")
+            raise EmbeddingError(f"Failed to generate embeddings: {str(e)}") from e
+        
+        fresh = [array("f", embedding) for batch in batches for embedding in batch]
+        await self.embedding_cache.aset_many(misses, fresh)
+        
+        by_text = dict(zip(misses, fresh))
+        return [
+            embedding if embedding is not None else by_text[text]
+            for text, embedding in zip(documents, embeddings)
+        ]
+    
     def _prepare_documents(
         self,
         meeting_id: str,
@@ -246,6 +528,10 @@ class VectorStoreService:
         """
         Prepare documents for indexing.
         
+        Blank entries are skipped and repeated decisions, action items and
+        key points are indexed once, so they cost neither embedding tokens
+        nor Chroma storage.
+        
         Args:
             meeting_id: Meeting identifier
             transcript: Full transcript
@@ -257,46 +543,83 @@ class VectorStoreService:
         Returns:
             Tuple of (documents, metadatas, ids)
         """
-        documents = []
-        metadatas = []
-        ids = []
-        
-        def add_doc(content: str, doc_type: str, index: Optional[int] = None):
-            """Helper to add a document"""
-            documents.append(content)
-            metadata = {"meeting_id": meeting_id, "type": doc_type}
-            if index is not None:
-                metadata["chunk_index"] = str(index)
-            metadatas.append(metadata)
-            
-            id_suffix = f"_{index}" if index is not None else ""
-            ids.append(f"{meeting_id}_{doc_type}{id_suffix}")
-        
-        # Chunk and add transcript
         transcript_chunks = self.text_splitter.split_text(transcript)
         logger.debug(f"Split transcript into {len(transcript_chunks)} chunks")
-        for i, chunk in enumerate(transcript_chunks):
-            add_doc(chunk, DOC_TYPE_TRANSCRIPT, i)
         
-        # Add summary
-        add_doc(summary, DOC_TYPE_SUMMARY)
+        def unique_entries(items: List[str]) -> List[str]:
+            return list(dict.fromkeys(item.strip() for item in items if item and item.strip()))
+        
+        submitted = len(decisions) + len(action_items) + len(key_points)
+        summaries = [summary] if summary and summary.strip() else []
+        decisions = unique_entries(decisions)
+        action_items = unique_entries(action_items)
+        key_points = unique_entries(key_points)
+        
+        skipped = submitted - len(decisions) - len(action_items) - len(key_points)
+        if skipped:
+            logger.debug(f"Skipped {skipped} blank or duplicate items for meeting {meeting_id}")
+        
+        # Document order: transcript chunks, summary, decisions, action items, key points
+        documents = [*transcript_chunks, *summaries, *decisions, *action_items, *key_points]
+        
+        def section_ids(doc_type: str, count: int) -> List[str]:
+            prefix = f"{meeting_id}_{doc_type}_"
+            return [f"{prefix}{i}" for i in range(count)]
         
-        # Add decisions
-        for i, decision in enumerate(decisions):
-            add_doc(decision, DOC_TYPE_DECISION, i)
+        def section_metadatas(doc_type: str, count: int) -> List[Dict]:
+            return [
+                {"meeting_id": meeting_id, "type": doc_type, "chunk_index": str(i)}
+                for i in range(count)
+            ]
         
-        # Add action items
-        for i, item in enumerate(action_items):
-            add_doc(item, DOC_TYPE_ACTION_ITEM, i)
+        sections = (
+            (DOC_TYPE_DECISION, len(decisions)),
+            (DOC_TYPE_ACTION_ITEM, len(action_items)),
+            (DOC_TYPE_KEY_POINT, len(key_points))
+        )
         
-        # Add key points
-        for i, point in enumerate(key_points):
-            add_doc(point, DOC_TYPE_KEY_POINT, i)
+        ids = section_ids(DOC_TYPE_TRANSCRIPT, len(transcript_chunks))
+        metadatas = section_metadatas(DOC_TYPE_TRANSCRIPT, len(transcript_chunks))
+        if summaries:
+            ids.append(f"{meeting_id}_{DOC_TYPE_SUMMARY}")
+            metadatas.append({"meeting_id": meeting_id, "type": DOC_TYPE_SUMMARY})
+        for doc_type, count in sections:
+            ids.extend(section_ids(doc_type, count))
+            metadatas.extend(section_metadatas(doc_type, count))
         
         logger.debug(f"Prepared {len(documents)} documents for indexing")
         return documents, metadatas, ids
     
-    def search(
+    async def embed_query(self, query: str) -> List[float]:
+        """
+        Generate the embedding for a search query.
+        
+        Results are cached per query text, so a retried or repeated
+        question does not cost another embeddings round trip.
+        
+        Args:
+            query: Search query
+            
+        Returns:
+            Query embedding vector
+            
+        Raises:
+            EmbeddingError: If embedding generation fails
+        """
+        cached = (await self.embedding_cache.aget_many([query]))[0]
+        if cached is not None:
+            return cached
+        
+        try:
+            embedding = await self.embeddings.aembed_query(query)
+        except Exception as e:
+            logger.error(f"Failed to generate query embedding: {e}")
+            raise EmbeddingError(f"Query embedding failed: {str(e)}") from e
+        
+        await self.embedding_cache.aset_many([query], [embedding])
+        return list(embedding)
+    
+    async def search(
         self,
         user_id: str,
         query: str,
@@ -305,48 +628,74 @@ class VectorStoreService:
         """
         Search user's meeting data using similarity search.
         
+        The collection lookup and the query embedding run concurrently.
+        
         Args:
             user_id: User identifier
             query: Search query
             top_k: Number of results to return (default from settings)
             
+        Returns:
+            List of relevant documents with metadata
+            
+        Raises:
+            EmbeddingError: If the query embedding fails
+        """
+        logger.info(f"Searching meetings for user {user_id}, query: '{query[:50]}...'")
+        collection_id, query_embedding = await asyncio.gather(
+            self.get_collection_id(user_id),
+            self.embed_query(query)
+        )
+        if collection_id is None:
+            return []
+        return await self.search_by_embedding(user_id, query_embedding, top_k, collection_id)
+    
+    async def search_by_embedding(
+        self,
+        user_id: str,
+        query_embedding: List[float],
+        top_k: Optional[int] = None,
+        collection_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Search user's meeting data with a precomputed query embedding.
+        
+        Results of a recent query with a near-identical embedding are reused
+        without a Chroma round trip.
+        
+        Args:
+            user_id: User identifier
+            query_embedding: Embedding of the search query
+            top_k: Number of results to return (default from settings)
+            collection_id: User's collection ID, if already known
+            
         Returns:
             List of relevant documents with metadata
         """
         if top_k is None:
             top_k = settings.rag_top_k
         
-        logger.info(f"Searching meetings for user {user_id}, query: '{query[:50]}...', top_k={top_k}")
+        cached = self.search_cache.get(user_id, query_embedding, top_k)
+        if cached is not None:
+            logger.info(f"Search cache hit for user {user_id} ({len(cached)} results)")
+            return cached
         
-        try:
-            collection_name = self._get_collection_name(user_id)
-            
-            # Get collection
-            response = self.http_client.get(
-                f"{self.base_url}/api/{CHROMA_API_VERSION}/collections/{collection_name}",
-                headers=self.headers
-            )
-            
-            if response.status_code != 200:
-                logger.warning(f"No collection found for user {user_id}")
+        if collection_id is None:
+            collection_id = await self.get_collection_id(user_id)
+            if collection_id is None:
                 return []
-            
-            collection_id = response.json()["id"]
-            
-            # Generate query embedding
-            try:
-                query_embedding = self.embeddings.embed_query(query)
-            except Exception as e:
-                logger.error(f"Failed to generate query embedding: {e}")
-                raise EmbeddingError(f"Query embedding failed: {str(e)}") from e
-            
+        
+        try:
             # Search collection
-            response = self.http_client.post(
-                f"{self.base_url}/api/{CHROMA_API_VERSION}/collections/{collection_id}/query",
-                headers=self.headers,
-                json={
+            response = await self._post_to_collection(
+                self._get_collection_name(user_id),
+                collection_id,
+                "query",
+                {
                     "query_embeddings": [query_embedding],
-                    "n_results": top_k
+                    "n_results": top_k,
+                    # Only what _format_search_results reads; never the vectors
+                    "include": ["documents", "metadatas", "distances"]
                 }
             )
             
@@ -354,15 +703,13 @@ class VectorStoreService:
                 logger.error(f"Search failed: {response.status_code} - {response.text}")
                 return []
             
-            results = response.json()
+            results = orjson.loads(response.content)
             documents = self._format_search_results(results)
+            self.search_cache.put(user_id, query_embedding, top_k, documents)
             
             logger.info(f"Found {len(documents)} results for user {user_id}")
             return documents
             
-        except EmbeddingError:
-            # Re-raise embedding errors
-            raise
         except Exception as e:
             logger.error(f"Search error for user {user_id}: {e}", exc_info=True)
             return []  # Return empty results on error
@@ -387,7 +734,21 @@ class VectorStoreService:
                 })
         return documents
     
-    def delete_meeting(self, user_id: str, meeting_id: str) -> None:
+    async def _invalidate_caches(self, user_id: str) -> None:
+        """
+        Drop cached search results and cached answers for a user.
+        
+        Args:
+            user_id: User identifier
+        """
+        self.search_cache.invalidate(user_id)
+        
+        if settings.rag_cache_enabled:
+            # Imported here because semantic_cache builds on this module
+            from app.services.semantic_cache import SemanticCache
+            await SemanticCache(self).invalidate(user_id)
+    
+    async def delete_meeting(self, user_id: str, meeting_id: str) -> None:
         """
         Delete all data for a specific meeting.
         
@@ -398,30 +759,20 @@ class VectorStoreService:
         logger.info(f"Deleting meeting {meeting_id} for user {user_id}")
         
         try:
-            collection_name = self._get_collection_name(user_id)
-            
-            # Get collection
-            response = self.http_client.get(
-                f"{self.base_url}/api/{CHROMA_API_VERSION}/collections/{collection_name}",
-                headers=self.headers
-            )
-            
-            if response.status_code != 200:
-                logger.warning(f"No collection found for user {user_id}")
+            collection_id = await self.get_collection_id(user_id)
+            if collection_id is None:
                 return
             
-            collection_id = response.json()["id"]
-            
             # Delete documents with matching meeting_id
-            response = self.http_client.post(
-                f"{self.base_url}/api/{CHROMA_API_VERSION}/collections/{collection_id}/delete",
-                headers=self.headers,
-                json={
-                    "where": {"meeting_id": meeting_id}
-                }
+            response = await self._post_to_collection(
+                self._get_collection_name(user_id),
+                collection_id,
+                "delete",
+                {"where": {"meeting_id": meeting_id}}
             )
             
             if response.status_code in [200, 201]:
+                await self._invalidate_caches(user_id)
                 logger.info(f"Successfully deleted meeting {meeting_id}")
             else:
                 logger.warning(f"Delete operation returned status {response.status_code}")
@@ -1,15 +1,35 @@
-"""Whisper speech-to-text service using OpenAI API with FFmpeg chunking and parallel processing"""
+"""Whisper speech-to-text service using OpenAI API with FFmpeg chunking and concurrent uploads"""
 
+import math
+import mimetypes
 import os
+import re
+import shutil
 import subprocess
 import tempfile
 import asyncio
+import httpx
 from pathlib import Path
-from typing import List, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from openai import OpenAI
+from contextlib import aclosing
+from functools import lru_cache
+from typing import AsyncIterator, List, Optional, Tuple
+from openai import AsyncOpenAI
 from fastapi import HTTPException
-from app.config import settings
+from app.config import get_settings
+from app.constants import OPENAI_MAX_RETRIES, WHISPER_TIMEOUT_SECONDS
+from app.http_client import get_openai_async_client
+
+settings = get_settings()
+
+
+@lru_cache(maxsize=1)
+def _get_client(http_client: httpx.AsyncClient) -> AsyncOpenAI:
+    """Whisper API client, rebuilt only if the shared HTTP client is replaced"""
+    return AsyncOpenAI(
+        api_key=settings.openai_api_key,
+        max_retries=OPENAI_MAX_RETRIES,
+        http_client=http_client
+    )
 
 
 class WhisperService:
@@ -23,24 +43,56 @@ class WhisperService:
     
     # Chunk settings
     CHUNK_DURATION_SECONDS = 600  # 10 minutes
-    OVERLAP_SECONDS = 10  # 10 seconds overlap between chunks
+    CHUNK_SIZE_HEADROOM = 0.9  # Target share of MAX_FILE_SIZE; leaves room for VBR peaks
+    
+    # Silence-aware cut points
+    SILENCE_NOISE_DB = -30  # Quieter than this counts as silence
+    SILENCE_MIN_SECONDS = 0.3  # Shortest pause that counts as a gap between words
+    SILENCE_SEARCH_SECONDS = 20  # How far before each cut mark to look for a pause
     
     # Parallel processing
     MAX_PARALLEL_TRANSCRIPTIONS = 3  # Process up to 3 chunks simultaneously
+    CHUNK_SCAN_INTERVAL_SECONDS = 0.25  # How often to look for finished chunks while splitting
+    
+    # Result of the first FFmpeg availability check
+    _ffmpeg_available: Optional[bool] = None
+    
+    @classmethod
+    def _ffmpeg_threads(cls) -> int:
+        """
+        Threads each FFmpeg/FFprobe process may use.
+        
+        FFmpeg defaults to one thread per core, which oversubscribes the CPU
+        when several processes run alongside parallel transcriptions.
+        
+        Returns:
+            settings.ffmpeg_threads if set, else the CPU count divided by
+            MAX_PARALLEL_TRANSCRIPTIONS (at least 1)
+        """
+        if settings.ffmpeg_threads:
+            return settings.ffmpeg_threads
+        return max(1, (os.cpu_count() or 4) // cls.MAX_PARALLEL_TRANSCRIPTIONS)
     
     @classmethod
     def check_ffmpeg_available(cls) -> bool:
-        """Check if FFmpeg is available on the system."""
-        try:
-            subprocess.run(
-                ["ffmpeg", "-version"],
-                capture_output=True,
-                check=True,
-                timeout=5
-            )
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-            return False
+        """
+        Check if FFmpeg is available on the system.
+        
+        The answer cannot change while the process runs, so `ffmpeg -version`
+        is spawned only on the first call.
+        """
+        if cls._ffmpeg_available is None:
+            try:
+                subprocess.run(
+                    ["ffmpeg", "-version"],
+                    capture_output=True,
+                    check=True,
+                    timeout=5
+                )
+                cls._ffmpeg_available = True
+            except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+                cls._ffmpeg_available = False
+        return cls._ffmpeg_available
     
     @classmethod
     def get_audio_duration(cls, file_path: str) -> float:
@@ -57,6 +109,7 @@ class WhisperService:
             result = subprocess.run(
                 [
                     "ffprobe",
+                    "-threads", str(cls._ffmpeg_threads()),
                     "-v", "error",
                     "-show_entries", "format=duration",
                     "-of", "default=noprint_wrappers=1:nokey=1",
@@ -124,187 +177,354 @@ class WhisperService:
             )
     
     @classmethod
-    def split_audio_with_ffmpeg(cls, input_path: str, duration_seconds: float) -> List[str]:
+    def _chunk_duration(cls, file_size: int, duration_seconds: float) -> int:
         """
-        Split audio file into chunks using FFmpeg with overlap.
+        Longest chunk duration that keeps stream-copied chunks under the API limit.
+        
+        With -c copy a chunk's size is its duration times the input bitrate,
+        so high-bitrate input (WAV, FLAC, 320 kbps MP3) needs shorter chunks.
+        The average bitrate is taken from the file size and duration.
+        
+        Args:
+            file_size: Input size in bytes
+            duration_seconds: Input duration in seconds
+            
+        Returns:
+            Chunk duration in whole seconds, at most CHUNK_DURATION_SECONDS
+        """
+        bytes_per_second = file_size / max(duration_seconds, 1.0)
+        max_seconds = int(cls.MAX_FILE_SIZE * cls.CHUNK_SIZE_HEADROOM / bytes_per_second)
+        return max(1, min(cls.CHUNK_DURATION_SECONDS, max_seconds))
+    
+    @classmethod
+    async def _find_silence_cut(cls, input_path: str, window_start: float, window: float) -> float:
+        """
+        Pick a cut point inside a pause near the end of a search window.
+        
+        Only the window is decoded: -ss before -i seeks the input, and
+        silencedetect timestamps then start at zero.
         
         Args:
             input_path: Path to original audio file
-            duration_seconds: Total duration in seconds
+            window_start: Start of the search window in seconds
+            window: Length of the search window in seconds
             
         Returns:
-            List of paths to audio chunk files
+            Middle of the last pause in the window, or the window end if there is none
+            
+        Raises:
+            RuntimeError: If FFmpeg fails
         """
-        print(f"⚡ Splitting into chunks (10s overlap)...")
+        process = await asyncio.create_subprocess_exec(
+            "ffmpeg",
+            "-hide_banner",
+            "-nostats",
+            "-threads", str(cls._ffmpeg_threads()),
+            "-ss", f"{window_start:.3f}",
+            "-t", f"{window:.3f}",
+            "-i", input_path,
+            "-vn",
+            "-af", f"silencedetect=noise={cls.SILENCE_NOISE_DB}dB:d={cls.SILENCE_MIN_SECONDS}",
+            "-f", "null", "-",
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        _, stderr = await process.communicate()
+        if process.returncode != 0:
+            raise RuntimeError(f"silencedetect exited with code {process.returncode}")
         
-        # Calculate number of chunks needed
-        effective_chunk_duration = cls.CHUNK_DURATION_SECONDS - cls.OVERLAP_SECONDS
-        num_chunks = max(1, int((duration_seconds - cls.OVERLAP_SECONDS) / effective_chunk_duration) + 1)
+        log = stderr.decode(errors="replace")
+        window_end = window_start + window
+        starts = [float(m) for m in re.findall(r"silence_start: (-?[\d.]+)", log)]
+        ends = re.findall(r"silence_end: ([\d.]+) \| silence_duration: ([\d.]+)", log)
         
-        print(f"  {num_chunks} chunks × {cls.CHUNK_DURATION_SECONDS / 60:.0f}min each")
+        # A pause still running when the window ends makes the window end itself quiet
+        if len(starts) > len(ends):
+            return window_end
+        if ends:
+            end, pause = map(float, ends[-1])
+            return min(window_start + end - pause / 2, window_end)
+        return window_end
+    
+    @classmethod
+    async def find_silence_cuts(
+        cls,
+        input_path: str,
+        duration_seconds: float,
+        segment_seconds: int
+    ) -> Optional[List[float]]:
+        """
+        Choose chunk boundaries that fall in pauses instead of mid-word.
         
-        chunk_paths = []
-        suffix = Path(input_path).suffix
+        Cut marks are spaced segment_seconds minus the search window apart,
+        and each cut lands somewhere in the window before its mark, so no
+        chunk is longer than segment_seconds. The windows are independent
+        and are probed concurrently.
         
-        for i in range(num_chunks):
-            # Calculate start time with overlap
-            if i == 0:
-                start_time = 0
-            else:
-                start_time = i * effective_chunk_duration
+        Args:
+            input_path: Path to original audio file
+            duration_seconds: Total duration in seconds
+            segment_seconds: Longest allowed chunk in seconds
             
-            # Calculate duration for this chunk
-            remaining_duration = duration_seconds - start_time
-            chunk_duration = min(cls.CHUNK_DURATION_SECONDS, remaining_duration)
+        Returns:
+            Increasing cut points in seconds, or None if detection failed
+            and fixed-length chunks should be used instead
+        """
+        window = min(cls.SILENCE_SEARCH_SECONDS, segment_seconds / 2)
+        interval = segment_seconds - window
+        marks = []
+        mark = interval
+        while mark < duration_seconds:
+            marks.append(mark)
+            mark += interval
+        
+        semaphore = asyncio.Semaphore(cls.MAX_PARALLEL_TRANSCRIPTIONS)
+        
+        async def find_cut(mark: float) -> float:
+            async with semaphore:
+                return await cls._find_silence_cut(input_path, mark - window, window)
+        
+        try:
+            cuts = await asyncio.gather(*(find_cut(mark) for mark in marks))
+        except Exception as e:
+            print(f"⚠️  Silence detection failed, using fixed-length chunks: {str(e)}")
+            return None
+        
+        print(f"🔇 Found {len(cuts)} cut points in pauses")
+        return list(cuts)
+    
+    @classmethod
+    async def split_audio_with_ffmpeg(
+        cls,
+        input_path: str,
+        duration_seconds: float,
+        chunk_dir: str,
+        cut_points: Optional[List[float]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Split audio file into chunks with a single FFmpeg segment pass.
+        
+        The segment muxer demuxes the input once and writes every chunk,
+        instead of one FFmpeg process (and container parse) per chunk.
+        Chunks are CHUNK_DURATION_SECONDS long, or shorter when the file's
+        average bitrate would make that exceed the API size limit. Each
+        chunk is yielded as soon as it is complete (the muxer opens chunk
+        N+1 only after closing chunk N), so uploads start while the rest of
+        the file is still being split.
+        
+        Args:
+            input_path: Path to original audio file
+            duration_seconds: Total duration in seconds
+            chunk_dir: Empty directory to write chunks into
+            cut_points: Explicit boundaries in seconds (from find_silence_cuts);
+                fixed-length chunks when omitted
             
-            # Create temporary file for chunk
-            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
-                chunk_path = tmp_file.name
+        Yields:
+            Paths of finished chunk files, in playback order
             
-            try:
-                # Use FFmpeg to extract chunk (fast codec copy)
-                subprocess.run(
-                    [
-                        "ffmpeg",
-                        "-i", input_path,
-                        "-ss", str(start_time),
-                        "-t", str(chunk_duration),
-                        "-c", "copy",  # Copy codec (fast, no re-encoding)
-                        "-y",  # Overwrite output file
-                        "-loglevel", "error",  # Only show errors
-                        chunk_path  # Output file
-                    ],
-                    capture_output=True,
-                    check=True,
-                    timeout=60
-                )
-                
-                chunk_size = os.path.getsize(chunk_path)
-                
-                # Validate chunk size
-                if chunk_size > cls.MAX_FILE_SIZE:
-                    # Clean up chunks created so far
-                    for path in chunk_paths:
-                        try:
-                            os.remove(path)
-                        except:
-                            pass
-                    os.remove(chunk_path)
-                    
-                    raise HTTPException(
-                        status_code=413,
-                        detail=f"Chunk {i+1} too large ({chunk_size / (1024 * 1024):.1f}MB). "
-                               f"Re-encode at lower bitrate."
-                    )
+        Raises:
+            HTTPException: If FFmpeg fails or a chunk exceeds the API limit
+        """
+        if cut_points:
+            expected_chunks = len(cut_points) + 1
+            segment_args = ["-segment_times", ",".join(f"{t:.3f}" for t in cut_points)]
+            print(f"⚡ Splitting into {expected_chunks} chunks at pauses...")
+        else:
+            segment_seconds = cls._chunk_duration(os.path.getsize(input_path), duration_seconds)
+            expected_chunks = max(1, math.ceil(duration_seconds / segment_seconds))
+            segment_args = ["-segment_time", str(segment_seconds)]
+            print(f"⚡ Splitting into {expected_chunks} chunks × {segment_seconds / 60:.1f}min each...")
+        
+        suffix = Path(input_path).suffix
+        process = await asyncio.create_subprocess_exec(
+            "ffmpeg",
+            "-threads", str(cls._ffmpeg_threads()),
+            "-i", input_path,
+            "-vn",  # Drop cover art and other non-audio streams
+            "-f", "segment",
+            *segment_args,
+            "-reset_timestamps", "1",
+            "-c", "copy",  # Copy codec (fast, no re-encoding)
+            "-loglevel", "error",  # Only show errors
+            os.path.join(chunk_dir, f"chunk_%04d{suffix}"),
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        # Drain stderr concurrently so a chatty FFmpeg can never block on the pipe
+        communicate = asyncio.ensure_future(process.communicate())
+        deadline = asyncio.get_running_loop().time() + 60 * expected_chunks
+        emitted = 0
+        
+        try:
+            while True:
+                done, _ = await asyncio.wait({communicate}, timeout=cls.CHUNK_SCAN_INTERVAL_SECONDS)
+                names = sorted(os.listdir(chunk_dir))
                 
-                chunk_paths.append(chunk_path)
+                if done:
+                    _, stderr = communicate.result()
+                    if process.returncode != 0:
+                        error_msg = stderr.decode().strip() if stderr else f"exit code {process.returncode}"
+                        raise HTTPException(
+                            status_code=500,
+                            detail=f"Failed to split audio: {error_msg}"
+                        )
+                    if not names:
+                        raise HTTPException(status_code=500, detail="Failed to split audio: no chunks produced")
                 
-            except subprocess.CalledProcessError as e:
-                # Clean up on error
-                for path in chunk_paths:
-                    try:
-                        os.remove(path)
-                    except:
-                        pass
-                if os.path.exists(chunk_path):
-                    os.remove(chunk_path)
+                # While FFmpeg runs, the newest file may still be growing
+                complete = names if done else names[:-1]
+                for name in complete[emitted:]:
+                    chunk_path = os.path.join(chunk_dir, name)
+                    chunk_size = os.path.getsize(chunk_path)
+                    if chunk_size > cls.MAX_FILE_SIZE:
+                        raise HTTPException(
+                            status_code=413,
+                            detail=f"Chunk {emitted + 1} too large ({chunk_size / (1024 * 1024):.1f}MB). "
+                                   f"Re-encode at lower bitrate."
+                        )
+                    emitted += 1
+                    yield chunk_path
                 
-                error_msg = e.stderr.decode() if e.stderr else str(e)
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Failed to split audio: {error_msg}"
-                )
+                if done:
+                    break
+                if asyncio.get_running_loop().time() > deadline:
+                    raise HTTPException(status_code=500, detail="Failed to split audio: FFmpeg timed out")
+        finally:
+            if process.returncode is None:
+                process.kill()
+            await asyncio.gather(communicate, return_exceptions=True)
         
-        print(f"  ✓ Split complete ({sum(os.path.getsize(p) for p in chunk_paths) / (1024 * 1024):.1f}MB total)")
-        return chunk_paths
+        print(f"  ✓ Split complete ({emitted} chunks)")
     
     @classmethod
-    def transcribe_chunk(cls, chunk_path: str, chunk_index: int, total_chunks: int) -> Tuple[int, str]:
+    async def transcribe_chunk(
+        cls,
+        client: AsyncOpenAI,
+        semaphore: asyncio.Semaphore,
+        chunk_path: str,
+        chunk_index: int
+    ) -> str:
         """
         Transcribe a single audio chunk.
         
         Args:
+            client: OpenAI client shared by all chunks of the file
+            semaphore: Bounds concurrent uploads to MAX_PARALLEL_TRANSCRIPTIONS
             chunk_path: Path to audio chunk file
             chunk_index: Index of this chunk (0-based)
-            total_chunks: Total number of chunks
             
         Returns:
-            Tuple of (chunk_index, transcribed_text)
+            Transcribed text
         """
-        try:
-            client = OpenAI(api_key=settings.openai_api_key)
-            
-            with open(chunk_path, "rb") as audio_file:
-                transcript_response = client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=audio_file,
-                    language="en"
-                )
-            
-            transcript = transcript_response.text.strip()
-            print(f"  ✓ Chunk {chunk_index + 1}/{total_chunks}: {len(transcript)} chars")
-            
-            return (chunk_index, transcript)
-        except Exception as e:
-            print(f"  ✗ Chunk {chunk_index + 1}/{total_chunks} failed: {str(e)}")
-            raise
+        async with semaphore:
+            try:
+                transcript = await cls._transcribe_file(client, chunk_path)
+                print(f"  ✓ Chunk {chunk_index + 1}: {len(transcript)} chars")
+                return transcript
+            except Exception as e:
+                print(f"  ✗ Chunk {chunk_index + 1} failed: {str(e)}")
+                raise
     
     @classmethod
-    def transcribe_chunks_parallel(cls, chunk_paths: List[str]) -> List[str]:
+    async def transcribe_chunks_parallel(
+        cls,
+        client: AsyncOpenAI,
+        chunk_paths: AsyncIterator[str]
+    ) -> List[str]:
         """
-        Transcribe multiple chunks in parallel for speed.
+        Transcribe chunks concurrently as they become available.
+        
+        Each chunk is scheduled as soon as the iterator yields it, so
+        splitting and uploading overlap.
         
         Args:
-            chunk_paths: List of paths to chunk files
+            client: OpenAI client shared by all chunks of the file
+            chunk_paths: Async iterator of chunk file paths, in order
             
         Returns:
             List of transcripts in order
         """
-        total_chunks = len(chunk_paths)
-        print(f"⚡ Transcribing {total_chunks} chunks in parallel (max {cls.MAX_PARALLEL_TRANSCRIPTIONS} at once)...")
-        
-        # Use ThreadPoolExecutor for parallel API calls
-        transcripts = [None] * total_chunks
-        
-        with ThreadPoolExecutor(max_workers=cls.MAX_PARALLEL_TRANSCRIPTIONS) as executor:
-            # Submit all transcription tasks
-            future_to_index = {
-                executor.submit(cls.transcribe_chunk, chunk_path, i, total_chunks): i
-                for i, chunk_path in enumerate(chunk_paths)
-            }
+        print(f"⚡ Transcribing chunks as they are split (max {cls.MAX_PARALLEL_TRANSCRIPTIONS} at once)...")
+        
+        semaphore = asyncio.Semaphore(cls.MAX_PARALLEL_TRANSCRIPTIONS)
+        tasks = []
+        try:
+            async with aclosing(chunk_paths) as chunks:
+                async for chunk_path in chunks:
+                    tasks.append(asyncio.create_task(
+                        cls.transcribe_chunk(client, semaphore, chunk_path, len(tasks))
+                    ))
             
-            # Collect results as they complete
-            for future in as_completed(future_to_index):
-                try:
-                    chunk_index, transcript = future.result()
-                    transcripts[chunk_index] = transcript
-                except Exception as e:
-                    raise HTTPException(
-                        status_code=500,
-                        detail=f"Transcription failed: {str(e)}"
-                    )
+            # gather returns results in submission order
+            transcripts = await asyncio.gather(*tasks)
+        except BaseException as e:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if isinstance(e, HTTPException) or not isinstance(e, Exception):
+                raise
+            raise HTTPException(
+                status_code=500,
+                detail=f"Transcription failed: {str(e)}"
+            )
         
-        print(f"  ✓ All chunks transcribed!")
+        print(f"  ✓ All {len(transcripts)} chunks transcribed!")
         return transcripts
     
     @classmethod
-    def merge_overlapping_transcripts(cls, transcripts: List[str]) -> str:
+    async def _transcribe_file(cls, client: AsyncOpenAI, file_path: str) -> str:
         """
-        Merge transcripts from overlapping chunks.
+        Send one audio file (at most MAX_FILE_SIZE) to the transcription API.
+        
+        The model comes from settings.whisper_model; every OpenAI
+        transcription model shares the same 25 MB upload limit.
         
         Args:
-            transcripts: List of transcript strings
+            client: OpenAI client
+            file_path: Path to audio file
+            
+        Returns:
+            Transcribed text, stripped
+        """
+        content_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+        
+        with open(file_path, "rb") as audio_file:
+            # An open file (not bytes or a path) is streamed into the multipart
+            # body in 64 KB reads, so a 25 MB upload never sits in memory
+            transcript_response = await client.audio.transcriptions.create(
+                model=settings.whisper_model,
+                file=(Path(file_path).name, audio_file, content_type),
+                language="en",
+                timeout=WHISPER_TIMEOUT_SECONDS
+            )
+        return transcript_response.text.strip()
+    
+    @classmethod
+    def merge_transcripts(cls, transcripts: List[str]) -> str:
+        """
+        Merge transcripts from consecutive, non-overlapping chunks.
+        
+        Chunks that transcribed to nothing (silence) are dropped so they
+        don't leave doubled spaces.
+        
+        Args:
+            transcripts: List of transcript strings in chunk order
             
         Returns:
             Combined transcript
         """
-        return " ".join(transcripts)
+        return " ".join(filter(None, transcripts))
     
     @classmethod
-    def transcribe_audio(cls, audio_path: str) -> str:
+    async def transcribe_audio(cls, audio_path: str) -> str:
         """
         Transcribe audio file to text using OpenAI Whisper API.
-        Automatically chunks files larger than 25 MB using FFmpeg with parallel processing.
+        Automatically chunks files larger than 25 MB using FFmpeg and
+        transcribes the chunks concurrently.
+        
+        Uploads run on the event loop over the shared HTTP/2 OpenAI client
+        and start while FFmpeg is still splitting; FFprobe runs in a worker
+        thread.
         
         Args:
             audio_path: Path to audio file
@@ -315,13 +535,13 @@ class WhisperService:
         Raises:
             HTTPException: If transcription fails
         """
-        chunk_paths = []
+        chunk_dir = None
         try:
             if not settings.openai_api_key:
                 raise ValueError("OPENAI_API_KEY is required for Whisper API")
             
             # Validate audio file and get metadata
-            duration_minutes, file_size = cls.validate_audio_file(audio_path)
+            duration_minutes, file_size = await asyncio.to_thread(cls.validate_audio_file, audio_path)
             
             print(f"\n🎵 Processing: {Path(audio_path).name}")
             
@@ -329,26 +549,38 @@ class WhisperService:
             estimated_cost = duration_minutes * 0.006
             print(f"💰 Cost: ${estimated_cost:.3f}")
             
+            client = _get_client(get_openai_async_client())
+            
             # Check if chunking is needed
             if file_size > cls.MAX_FILE_SIZE:
                 print(f"⚠️  Large file - using FFmpeg chunking...")
                 
                 # Check if FFmpeg is available
-                if not cls.check_ffmpeg_available():
+                if not await asyncio.to_thread(cls.check_ffmpeg_available):
                     raise HTTPException(
                         status_code=413,
                         detail=f"File too large ({file_size / (1024 * 1024):.1f}MB). "
                                f"Install FFmpeg: sudo apt-get install ffmpeg"
                     )
                 
-                # Split into chunks using FFmpeg
-                chunk_paths = cls.split_audio_with_ffmpeg(audio_path, duration_minutes * 60)
+                # Cut in pauses so no word is split across two chunks
+                duration_seconds = duration_minutes * 60
+                cut_points = await cls.find_silence_cuts(
+                    audio_path,
+                    duration_seconds,
+                    cls._chunk_duration(file_size, duration_seconds)
+                )
                 
-                # Transcribe chunks in parallel for speed
-                transcripts = cls.transcribe_chunks_parallel(chunk_paths)
+                # Split into chunks using FFmpeg and transcribe each one in
+                # parallel as soon as it has been written
+                chunk_dir = tempfile.mkdtemp(prefix="meetmind_chunks_")
+                transcripts = await cls.transcribe_chunks_parallel(
+                    client,
+                    cls.split_audio_with_ffmpeg(audio_path, duration_seconds, chunk_dir, cut_points)
+                )
                 
                 # Merge transcripts
-                full_transcript = cls.merge_overlapping_transcripts(transcripts)
+                full_transcript = cls.merge_transcripts(transcripts)
                 
                 print(f"✅ Complete: {len(full_transcript)} characters\n")
                 
@@ -358,16 +590,7 @@ class WhisperService:
                 # File is small enough, transcribe directly
                 print(f"🎤 Transcribing...")
                 
-                client = OpenAI(api_key=settings.openai_api_key)
-                
-                with open(audio_path, "rb") as audio_file:
-                    transcript_response = client.audio.transcriptions.create(
-                        model="whisper-1",
-                        file=audio_file,
-                        language="en"
-                    )
-                
-                transcript = transcript_response.text.strip()
+                transcript = await cls._transcribe_file(client, audio_path)
                 
                 if not transcript:
                     raise ValueError("Transcription resulted in empty text")
@@ -384,12 +607,8 @@ class WhisperService:
                 detail=f"Failed to transcribe audio: {str(e)}"
             )
         finally:
-            # Clean up chunk files if they were created
-            if chunk_paths:
-                for chunk_path in chunk_paths:
-                    if os.path.exists(chunk_path):
-                        try:
-                            os.remove(chunk_path)
-                        except:
-                            pass
-                print(f"🧹 Cleaned up {len(chunk_paths)} temp files")
+            # Clean up chunk files (and their directory) if they were created,
+            # off the event loop: one directory walk instead of N unlinks
+            if chunk_dir:
+                await asyncio.to_thread(shutil.rmtree, chunk_dir, ignore_errors=True)
+                print(f"🧹 Cleaned up temp chunks")
@@ -1,10 +1,12 @@
 """Test configuration and fixtures"""
 
 import pytest
+import orjson
 import os
 import sys
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 from fastapi.testclient import TestClient
 
 # Add parent directory to path
@@ -12,50 +14,105 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from app.database import Base
 from app.main import app
-from app.database import get_db
+from app.database import get_db, get_session_factory, json_serializer
+from app.models.meeting import User
 
 
-# Test database URL
-TEST_DATABASE_URL = "sqlite:///./test_meetmind.db"
+# Test database URL: in-memory, kept alive by StaticPool's single connection
+TEST_DATABASE_URL = "sqlite://"
 
 
-@pytest.fixture(scope="function")
-def test_db():
-    """Create a test database for each test"""
-    # Create test engine
+@pytest.fixture(scope="session")
+def test_engine():
+    """Create the test engine and schema once for the whole session"""
     engine = create_engine(
         TEST_DATABASE_URL,
-        connect_args={"check_same_thread": False}
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+        json_serializer=json_serializer,
+        json_deserializer=orjson.loads
     )
     
+    # pysqlite emits its own BEGIN and ignores SAVEPOINT; let SQLAlchemy
+    # manage transactions so per-test savepoints roll back cleanly
+    @event.listens_for(engine, "connect")
+    def _configure_sqlite(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        # Test data is disposable: skip fsyncs and keep journals and temp tables
+        # in memory (no-ops for the in-memory URL, large wins for a file)
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA locking_mode=EXCLUSIVE")
+        cursor.execute("PRAGMA cache_size=-20000")  # 20 MB
+        cursor.execute("PRAGMA foreign_keys=ON")  # As in production; needed for ON DELETE CASCADE
+        cursor.close()
+    
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+    
     # Create all tables
     Base.metadata.create_all(bind=engine)
     
-    # Create session
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    db = TestingSessionLocal()
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def seed_user(test_engine):
+    """ID of a user committed once for the session, for tests that only need an owner"""
+    with Session(test_engine) as db:
+        db.add(User(id="baseline-user"))
+        db.commit()
+    return "baseline-user"
+
+
+@pytest.fixture(scope="function")
+def test_db(test_engine):
+    """
+    Session inside a transaction that is rolled back after each test.
+    
+    Commits made by the test (or by background tasks sharing the
+    connection) only release savepoints, so no rows outlive the test.
+    """
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    db = Session(bind=connection, join_transaction_mode="create_savepoint")
     
     try:
         yield db
     finally:
         db.close()
-        # Drop all tables after test
-        Base.metadata.drop_all(bind=engine)
-        # Remove test database file
-        if os.path.exists("test_meetmind.db"):
-            os.remove("test_meetmind.db")
+        transaction.rollback()
+        connection.close()
 
 
 @pytest.fixture(scope="function")
 def client(test_db):
     """Create a test client with test database"""
     def override_get_db():
+        # Requests share test_db; expire it so each one reads current rows
+        # (e.g. status written by a background task) like a fresh session would
+        test_db.expire_all()
         try:
             yield test_db
         finally:
             pass
     
+    def override_get_session_factory():
+        return sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            bind=test_db.get_bind(),
+            join_transaction_mode="create_savepoint"
+        )
+    
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = override_get_session_factory
     
     with TestClient(app) as test_client:
         yield test_client
@@ -1,9 +1,8 @@
 """Integration tests for API endpoints"""
 
 import pytest
-import json
 from io import BytesIO
-from unittest.mock import patch, Mock
+from unittest.mock import patch, Mock, AsyncMock
 
 
 class TestHealthEndpoints:
@@ -26,6 +25,40 @@ class TestHealthEndpoints:
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "healthy"
+    
+    def test_process_time_header(self, client, sample_user_id):
+        """Test timing middleware stamps X-Process-Time on responses"""
+        response = client.get(f"/meetings/user/{sample_user_id}")
+        
+        assert response.status_code == 200
+        assert float(response.headers["X-Process-Time"]) >= 0
+    
+    def test_cors_headers_only_for_browser_requests(self, client):
+        """Test CORS headers are added only when an Origin header is sent"""
+        response = client.get("/health", headers={"Origin": "http://localhost:3000"})
+        assert "access-control-allow-origin" in response.headers
+        
+        response = client.get("/health")
+        assert "access-control-allow-origin" not in response.headers
+    
+    def test_health_check_skips_timing(self, client):
+        """Test probe endpoints bypass the timing middleware"""
+        response = client.get("/health")
+        
+        assert response.status_code == 200
+        assert "X-Process-Time" not in response.headers
+    
+    def test_startup_preloads_tokenizer(self):
+        """Test the RAG tokenizer is loaded at startup instead of by the first query"""
+        from fastapi.testclient import TestClient
+        from app.main import app
+        
+        with patch('app.config.settings.chroma_api_key', 'test-key'), \
+                patch("app.services.rag_service._get_encoding") as get_encoding:
+            with TestClient(app):
+                pass
+        
+        get_encoding.assert_called_once_with()
 
 
 class TestMeetingEndpoints:
@@ -61,6 +94,137 @@ class TestMeetingEndpoints:
         assert response.status_code == 400
         assert "Invalid file type" in response.json()["detail"]
     
+    def test_upload_meeting_processes_in_background(self, client, sample_user_id):
+        """Test upload returns 202 and the background task completes the meeting"""
+        analysis = {
+            "summary": "Weekly sync",
+            "decisions": ["Ship v2"],
+            "action_items": ["Write notes"],
+            "key_points": ["Budget"]
+        }
+        files = {
+            "audio_file": ("meeting.mp3", BytesIO(b"ID3\x04\x00fake audio"), "audio/mpeg")
+        }
+        data = {"user_id": sample_user_id}
+        
+        with patch(
+            "app.services.whisper_service.WhisperService.transcribe_audio",
+            return_value="Hello team"
+        ), patch(
+            "app.services.langgraph_service.LangGraphService.process_transcript",
+            new=AsyncMock(return_value=analysis)
+        ):
+            response = client.post("/meetings/upload", files=files, data=data)
+        
+        assert response.status_code == 202
+        body = response.json()
+        assert body["status"] == "pending"
+        assert body["user_id"] == sample_user_id
+        
+        # TestClient runs background tasks before returning the response
+        response = client.get(
+            f"/meetings/{body['meeting_id']}?user_id={sample_user_id}&include_transcript=true"
+        )
+        
+        assert response.status_code == 200
+        detail = response.json()
+        assert detail["status"] == "completed"
+        assert detail["error"] is None
+        assert detail["transcript"] == "Hello team"
+        assert detail["decisions"] == ["Ship v2"]
+    
+    def test_upload_meeting_duplicate_audio_reuses_meeting(self, client, sample_user_id):
+        """Test re-uploading identical audio returns the existing meeting without reprocessing"""
+        data = {"user_id": sample_user_id}
+        
+        with patch(
+            "app.services.whisper_service.WhisperService.transcribe_audio",
+            return_value="Hello team"
+        ) as transcribe, patch(
+            "app.services.langgraph_service.LangGraphService.process_transcript",
+            new=AsyncMock(return_value={
+                "summary": "Sync", "decisions": [], "action_items": [], "key_points": []
+            })
+        ):
+            first = client.post(
+                "/meetings/upload",
+                files={"audio_file": ("a.mp3", BytesIO(b"ID3\x04\x00same audio"), "audio/mpeg")},
+                data=data
+            )
+            second = client.post(
+                "/meetings/upload",
+                files={"audio_file": ("b.mp3", BytesIO(b"ID3\x04\x00same audio"), "audio/mpeg")},
+                data=data
+            )
+        
+        assert second.status_code == 202
+        assert second.json()["meeting_id"] == first.json()["meeting_id"]
+        assert second.json()["status"] == "completed"
+        assert transcribe.call_count == 1
+    
+    def test_upload_meeting_reprocesses_abandoned_duplicate(self, client, test_db, sample_user_id):
+        """Test a meeting stuck in processing past the timeout does not swallow a re-upload"""
+        import hashlib
+        from datetime import datetime, timedelta, timezone
+        from app.models.meeting import User, Meeting
+        
+        audio = b"ID3\x04\x00lost audio"
+        test_db.add(User(id=sample_user_id))
+        test_db.flush()
+        stuck = Meeting(
+            user_id=sample_user_id,
+            audio_filename="lost.mp3",
+            status="transcribing",
+            audio_hash=hashlib.blake2b(audio, digest_size=16).hexdigest(),
+            created_at=datetime.now(timezone.utc) - timedelta(hours=2)
+        )
+        test_db.add(stuck)
+        test_db.commit()
+        
+        with patch(
+            "app.services.whisper_service.WhisperService.transcribe_audio",
+            return_value="Hello team"
+        ) as transcribe, patch(
+            "app.services.langgraph_service.LangGraphService.process_transcript",
+            new=AsyncMock(return_value={
+                "summary": "Sync", "decisions": [], "action_items": [], "key_points": []
+            })
+        ):
+            response = client.post(
+                "/meetings/upload",
+                files={"audio_file": ("lost.mp3", BytesIO(audio), "audio/mpeg")},
+                data={"user_id": sample_user_id}
+            )
+        
+        assert response.status_code == 202
+        assert response.json()["meeting_id"] != stuck.id
+        assert transcribe.call_count == 1
+    
+    def test_upload_meeting_background_failure(self, client, sample_user_id):
+        """Test a failed background step is recorded on the meeting"""
+        files = {
+            "audio_file": ("meeting.mp3", BytesIO(b"ID3\x04\x00fake audio"), "audio/mpeg")
+        }
+        data = {"user_id": sample_user_id}
+        
+        with patch(
+            "app.services.whisper_service.WhisperService.transcribe_audio",
+            side_effect=RuntimeError("Whisper unavailable")
+        ):
+            response = client.post("/meetings/upload", files=files, data=data)
+        
+        assert response.status_code == 202
+        meeting_id = response.json()["meeting_id"]
+        
+        response = client.get(f"/meetings/{meeting_id}?user_id={sample_user_id}")
+        
+        detail = response.json()
+        assert detail["status"] == "failed"
+        assert "Whisper unavailable" in detail["error"]
+        
+        response = client.get(f"/meetings/user/{sample_user_id}")
+        assert response.json()["meetings"][0]["status"] == "failed"
+    
     def test_get_user_meetings_empty(self, client, sample_user_id):
         """Test getting meetings for user with no meetings"""
         response = client.get(f"/meetings/user/{sample_user_id}")
@@ -85,18 +249,18 @@ class TestMeetingEndpoints:
             audio_filename="meeting1.mp3",
             transcript="Transcript 1",
             summary="Summary 1",
-            decisions=json.dumps(["Decision 1"]),
-            action_items=json.dumps(["Action 1"]),
-            key_points=json.dumps(["Point 1"])
+            decisions=["Decision 1"],
+            action_items=["Action 1"],
+            key_points=["Point 1"]
         )
         meeting2 = Meeting(
             user_id=sample_user_id,
             audio_filename="meeting2.mp3",
             transcript="Transcript 2",
             summary="Summary 2",
-            decisions=json.dumps([]),
-            action_items=json.dumps([]),
-            key_points=json.dumps([])
+            decisions=[],
+            action_items=[],
+            key_points=[]
         )
         test_db.add_all([meeting1, meeting2])
         test_db.commit()
@@ -108,6 +272,9 @@ class TestMeetingEndpoints:
         assert data["user_id"] == sample_user_id
         assert data["total"] == 2
         assert len(data["meetings"]) == 2
+        # Same created_at second; the time-ordered ID breaks the tie, newest first
+        assert [m["audio_filename"] for m in data["meetings"]] == ["meeting2.mp3", "meeting1.mp3"]
+        assert [m["summary"] for m in data["meetings"]] == ["Summary 2", "Summary 1"]
     
     def test_get_meeting_detail_success(self, client, test_db, sample_user_id):
         """Test getting meeting details"""
@@ -123,14 +290,16 @@ class TestMeetingEndpoints:
             audio_filename="test.mp3",
             transcript="Full transcript",
             summary="Full summary",
-            decisions=json.dumps(["Decision 1", "Decision 2"]),
-            action_items=json.dumps(["Action 1"]),
-            key_points=json.dumps(["Point 1", "Point 2", "Point 3"])
+            decisions=["Decision 1", "Decision 2"],
+            action_items=["Action 1"],
+            key_points=["Point 1", "Point 2", "Point 3"]
         )
         test_db.add(meeting)
         test_db.commit()
         
-        response = client.get(f"/meetings/{meeting.id}?user_id={sample_user_id}")
+        response = client.get(
+            f"/meetings/{meeting.id}?user_id={sample_user_id}&include_transcript=true"
+        )
         
         assert response.status_code == 200
         data = response.json()
@@ -140,6 +309,41 @@ class TestMeetingEndpoints:
         assert len(data["decisions"]) == 2
         assert len(data["action_items"]) == 1
         assert len(data["key_points"]) == 3
+        
+        # Transcript is omitted by default
+        response = client.get(f"/meetings/{meeting.id}?user_id={sample_user_id}")
+        
+        assert response.status_code == 200
+        assert response.json()["transcript"] is None
+    
+    def test_get_meeting_transcript(self, client, test_db, sample_user_id):
+        """Test streaming a meeting transcript"""
+        from app.models.meeting import User, Meeting
+        from app.routers.meetings import TRANSCRIPT_CHUNK_SIZE
+        
+        user = User(id=sample_user_id)
+        test_db.add(user)
+        test_db.commit()
+        
+        transcript = "word " * TRANSCRIPT_CHUNK_SIZE
+        meeting = Meeting(
+            user_id=sample_user_id,
+            audio_filename="test.mp3",
+            transcript=transcript
+        )
+        test_db.add(meeting)
+        test_db.commit()
+        
+        response = client.get(f"/meetings/{meeting.id}/transcript?user_id={sample_user_id}")
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert response.text == transcript
+        
+        # Ownership is enforced
+        response = client.get(f"/meetings/{meeting.id}/transcript?user_id=someone-else")
+        
+        assert response.status_code == 403
     
     def test_get_meeting_detail_not_found(self, client, sample_user_id):
         """Test getting non-existent meeting"""
@@ -193,3 +397,85 @@ class TestMeetingEndpoints:
         response = client.get(f"/meetings/{meeting.id}")
         
         assert response.status_code == 422  # Validation error
+
+
+class TestQueryEndpoints:
+    """Tests for RAG query endpoints"""
+    
+    def test_query_rag_service_unavailable(self, client, sample_user_id):
+        """Test query when the RAG service could not be initialized"""
+        client.app.state.rag_service = None
+        
+        response = client.post(
+            "/query/",
+            json={"user_id": sample_user_id, "query": "What was decided?"}
+        )
+        
+        assert response.status_code == 503
+        assert "unavailable" in response.json()["detail"].lower()
+    
+    def test_query_embedding_error(self, client, sample_user_id):
+        """Test embedding failures map to 503"""
+        from app.exceptions import EmbeddingError
+        
+        rag_service = Mock()
+        rag_service.query_meetings.side_effect = EmbeddingError("boom")
+        client.app.state.rag_service = rag_service
+        
+        response = client.post(
+            "/query/",
+            json={"user_id": sample_user_id, "query": "What was decided?"}
+        )
+        
+        assert response.status_code == 503
+        assert "embedding service unavailable" in response.json()["detail"].lower()
+    
+    def test_query_unexpected_error_keeps_cors(self, client, sample_user_id):
+        """Test unexpected failures become a JSON 500 that still carries CORS headers"""
+        rag_service = Mock()
+        rag_service.query_meetings.side_effect = RuntimeError("Answer generation failed")
+        client.app.state.rag_service = rag_service
+        
+        response = client.post(
+            "/query/",
+            json={"user_id": sample_user_id, "query": "What was decided?"},
+            headers={"Origin": "http://localhost:3000"}
+        )
+        
+        assert response.status_code == 500
+        assert response.json()["detail"] == "Internal server error. Please try again later."
+        assert "access-control-allow-origin" in response.headers
+        assert "x-process-time" in response.headers
+    
+    def test_query_service_error_subclass(self, client, sample_user_id):
+        """Test subclasses of a mapped service error get their base class's response"""
+        from app.exceptions import EmbeddingError
+        
+        class RateLimitedEmbeddingError(EmbeddingError):
+            pass
+        
+        rag_service = Mock()
+        rag_service.query_meetings.side_effect = RateLimitedEmbeddingError("slow down")
+        client.app.state.rag_service = rag_service
+        
+        response = client.post(
+            "/query/",
+            json={"user_id": sample_user_id, "query": "What was decided?"}
+        )
+        
+        assert response.status_code == 503
+        assert "embedding service unavailable" in response.json()["detail"].lower()
+    
+    def test_query_invalid_input(self, client, sample_user_id):
+        """Test invalid input maps to 400"""
+        rag_service = Mock()
+        rag_service.query_meetings.side_effect = ValueError("query is required")
+        client.app.state.rag_service = rag_service
+        
+        response = client.post(
+            "/query/",
+            json={"user_id": sample_user_id, "query": " "}
+        )
+        
+        assert response.status_code == 400
+        assert "invalid request" in response.json()["detail"].lower()
@@ -1,10 +1,14 @@
 """Unit tests for audio service"""
 
 import pytest
+import asyncio
+import hashlib
 import os
 import tempfile
+import threading
 from io import BytesIO
 from fastapi import UploadFile, HTTPException
+from app.config import settings
 from app.services.audio_service import AudioService
 
 
@@ -15,7 +19,7 @@ class TestAudioService:
         """Test validation with valid WAV file"""
         file = UploadFile(
             filename="test.wav",
-            file=BytesIO(b"fake audio data"),
+            file=BytesIO(b"RIFF\x24\x00\x00\x00WAVEfmt fake audio data"),
             headers={"content-type": "audio/wav"}
         )
         
@@ -26,11 +30,13 @@ class TestAudioService:
         """Test validation with valid MP3 file"""
         file = UploadFile(
             filename="test.mp3",
-            file=BytesIO(b"fake audio data"),
+            file=BytesIO(b"ID3\x04\x00fake audio data"),
             headers={"content-type": "audio/mpeg"}
         )
         
         AudioService.validate_audio_file(file)
+        # Upload is rewound so the whole file is saved
+        assert file.file.tell() == 0
     
     def test_validate_audio_file_invalid_extension(self):
         """Test validation with invalid file extension"""
@@ -60,6 +66,34 @@ class TestAudioService:
         assert exc_info.value.status_code == 400
         assert "Invalid content type" in exc_info.value.detail
     
+    def test_validate_audio_file_wrong_signature(self):
+        """Test validation rejects content that doesn't match the extension"""
+        file = UploadFile(
+            filename="test.mp3",
+            file=BytesIO(b"%PDF-1.7 not audio"),
+            headers={"content-type": "audio/mpeg"}
+        )
+        
+        with pytest.raises(HTTPException) as exc_info:
+            AudioService.validate_audio_file(file)
+        
+        assert exc_info.value.status_code == 400
+        assert "not valid mp3" in exc_info.value.detail
+    
+    def test_validate_audio_file_declared_size_too_large(self):
+        """Test validation rejects a known oversize upload before it is saved"""
+        file = UploadFile(
+            filename="test.ogg",
+            file=BytesIO(b"OggS"),
+            size=(settings.max_upload_size_mb + 1) * 1024 * 1024,
+            headers={"content-type": "audio/ogg"}
+        )
+        
+        with pytest.raises(HTTPException) as exc_info:
+            AudioService.validate_audio_file(file)
+        
+        assert exc_info.value.status_code == 413
+    
     @pytest.mark.asyncio
     async def test_save_audio_file(self):
         """Test saving audio file"""
@@ -88,10 +122,42 @@ class TestAudioService:
                 os.remove(file_path)
     
     @pytest.mark.asyncio
-    async def test_save_audio_file_too_large(self):
+    async def test_save_audio_file_writes_off_the_event_loop(self, monkeypatch, tmp_path):
+        """Test opening, writing and hashing run in worker threads, not on the event loop"""
+        monkeypatch.setattr(settings, "upload_dir", str(tmp_path))
+        loop_thread = threading.get_ident()
+        write_threads = []
+        real_to_thread = asyncio.to_thread
+        
+        async def recording_to_thread(func, *args):
+            def run():
+                write_threads.append(threading.get_ident())
+                return func(*args)
+            return await real_to_thread(run)
+        
+        monkeypatch.setattr("app.services.audio_service.asyncio.to_thread", recording_to_thread)
+        content = b"fake audio content" * 100
+        digest = hashlib.blake2b(digest_size=16)
+        
+        file_path, _ = await AudioService.save_audio_file(
+            UploadFile(filename="test_audio.mp3", file=BytesIO(content)), ".mp3", digest
+        )
+        
+        with open(file_path, "rb") as f:
+            assert f.read() == content
+        assert digest.hexdigest() == hashlib.blake2b(content, digest_size=16).hexdigest()
+        # open, one chunk write, close
+        assert len(write_threads) == 3
+        assert loop_thread not in write_threads
+    
+    @pytest.mark.asyncio
+    async def test_save_audio_file_too_large(self, monkeypatch, tmp_path):
         """Test saving file that exceeds size limit"""
-        # Create file larger than max size (100MB default)
-        large_content = b"x" * (101 * 1024 * 1024)  # 101 MB
+        # Lower the limit to 1 MB so the oversize upload stays small, and use
+        # a private upload dir so parallel workers' files don't show up
+        monkeypatch.setattr(settings, "max_upload_size_mb", 1)
+        monkeypatch.setattr(settings, "upload_dir", str(tmp_path))
+        large_content = b"x" * (1024 * 1024 + 1)
         file = UploadFile(
             filename="large.mp3",
             file=BytesIO(large_content)
@@ -102,6 +168,8 @@ class TestAudioService:
         
         assert exc_info.value.status_code == 413
         assert "too large" in exc_info.value.detail.lower()
+        # Partially written file is removed
+        assert os.listdir(tmp_path) == []
     
     def test_delete_audio_file(self):
         """Test deleting audio file"""
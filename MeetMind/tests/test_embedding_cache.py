@@ -0,0 +1,109 @@
+"""Unit tests for the embedding cache"""
+
+import threading
+from array import array
+from unittest.mock import patch
+
+import pytest
+
+from app.services.embedding_cache import EmbeddingCache
+
+
+class TestEmbeddingCache:
+    """Tests for EmbeddingCache"""
+    
+    def test_miss_then_hit(self):
+        """Test stored embeddings are returned in request order"""
+        cache = EmbeddingCache("model-a")
+        cache.set_many(["hello"], [[0.5, 0.25]])
+        
+        assert cache.get_many(["hello", "unknown", "hello"]) == [[0.5, 0.25], None, [0.5, 0.25]]
+    
+    def test_keys_include_model(self):
+        """Test the same text under another model is a miss"""
+        cache = EmbeddingCache("model-a")
+        cache.set_many(["hello"], [[0.5]])
+        cache.model = "model-b"
+        
+        assert cache.get_many(["hello"]) == [None]
+    
+    def test_memory_lru_evicts_oldest(self):
+        """Test the in-memory tier keeps only the most recent entries"""
+        cache = EmbeddingCache("model-a", max_memory_items=2)
+        cache.set_many(["a", "b"], [[1.0], [2.0]])
+        cache.get_many(["a"])
+        cache.set_many(["c"], [[3.0]])
+        
+        assert cache.get_many(["a", "b", "c"]) == [[1.0], None, [3.0]]
+    
+    def test_persists_float32_vectors(self, tmp_path):
+        """Test embeddings survive a new cache instance via SQLite"""
+        path = str(tmp_path / "cache" / "embeddings.db")
+        EmbeddingCache("model-a", path).set_many(["hello"], [[0.5, -1.25]])
+        
+        reopened = EmbeddingCache("model-a", path)
+        
+        assert reopened.get_many(["hello"]) == [[0.5, -1.25]]
+    
+    def test_returned_vectors_are_copies(self):
+        """Test callers can't mutate cached entries"""
+        cache = EmbeddingCache("model-a")
+        cache.set_many(["hello"], [[0.5]])
+        
+        cache.get_many(["hello"])[0].append(1.0)
+        
+        assert cache.get_many(["hello"]) == [[0.5]]
+    
+    def test_memory_tier_holds_float32_arrays(self):
+        """Test cached vectors are compact float32 arrays returned as lists"""
+        cache = EmbeddingCache("model-a")
+        cache.set_many(["hello"], [[0.1, 0.2]])
+        
+        assert all(isinstance(vector, array) and vector.typecode == "f" for vector in cache._memory.values())
+        assert cache.get_many(["hello"]) == [array("f", [0.1, 0.2]).tolist()]
+    
+    def test_get_many_arrays_returns_float32_copies(self):
+        """Test array lookups hand out copies callers may change freely"""
+        cache = EmbeddingCache("model-a")
+        cache.set_many(["hello"], [[0.5, 0.25]])
+        
+        first, missing = cache.get_many_arrays(["hello", "unknown"])
+        first[0] = 9.0
+        
+        assert missing is None
+        assert cache.get_many_arrays(["hello"]) == [array("f", [0.5, 0.25])]
+    
+    @pytest.mark.asyncio
+    async def test_async_persistence_runs_off_the_event_loop(self, tmp_path):
+        """Test async lookups and writes reach SQLite from a worker thread"""
+        path = str(tmp_path / "embeddings.db")
+        loop_thread = threading.get_ident()
+        sqlite_threads = []
+        
+        cache = EmbeddingCache("model-a", path)
+        for name in ("_load_persisted", "_persist"):
+            method = getattr(cache, name)
+            
+            def record(*args, method=method):
+                sqlite_threads.append(threading.get_ident())
+                return method(*args)
+            
+            setattr(cache, name, record)
+        
+        await cache.aset_many(["hello"], [[0.5, -1.25]])
+        reopened = EmbeddingCache("model-a", path)
+        
+        assert await reopened.aget_many(["hello"]) == [[0.5, -1.25]]
+        assert await cache.aget_many_arrays(["hello"]) == [array("f", [0.5, -1.25])]
+        assert sqlite_threads and loop_thread not in sqlite_threads
+    
+    @pytest.mark.asyncio
+    async def test_async_memory_hits_skip_the_worker_thread(self):
+        """Test memory-only caches never hop to a thread"""
+        cache = EmbeddingCache("model-a")
+        await cache.aset_many(["hello"], [[0.5]])
+        
+        with patch("app.services.embedding_cache.asyncio.to_thread") as to_thread:
+            assert await cache.aget_many(["hello", "unknown"]) == [[0.5], None]
+        
+        to_thread.assert_not_called()
@@ -2,30 +2,187 @@
 
 import pytest
 from unittest.mock import patch
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+from fastapi import HTTPException
+from app.config import settings
 from app.services.langgraph_service import LangGraphService
 
 
+def fake_llm_response(prompt_value, **kwargs):
+    """Return a canned reply chosen from the system and task messages"""
+    messages = prompt_value.to_messages()
+    if "transcript editor" in messages[0].content:
+        reply = "Cleaned transcript"
+    elif "Identify the main topics" in messages[-1].content:
+        reply = '{"topics": ["Budget"]}'
+    else:
+        reply = (
+            '{"summary": "A short summary.", "decisions": ["Approve budget"], '
+            '"action_items": ["Send report"], "key_points": ["Costs are up"]}'
+        )
+    return AIMessage(content=reply)
+
+
+@pytest.fixture(autouse=True)
+def openai_api_key(monkeypatch):
+    """Give every test a dummy OpenAI key"""
+    monkeypatch.setattr(settings, "openai_api_key", "test-key")
+
+
+@pytest.fixture(scope="module")
+def langgraph_service():
+    """One service shared by the tests that only inspect it"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(settings, "openai_api_key", "test-key")
+        return LangGraphService()
+
+
 class TestLangGraphService:
     """Tests for LangGraphService"""
     
-    def test_service_requires_api_key(self):
+    def test_service_requires_api_key(self, monkeypatch):
         """Test that service requires OpenAI API key"""
-        with patch('app.config.settings.openai_api_key', None):
-            with pytest.raises(ValueError, match="OPENAI_API_KEY is required"):
-                LangGraphService()
+        monkeypatch.setattr(settings, "openai_api_key", None)
+        
+        with pytest.raises(ValueError, match="OPENAI_API_KEY is required"):
+            LangGraphService()
     
-    def test_service_initialization(self):
+    def test_service_initialization(self, langgraph_service):
         """Test service initializes with API key"""
-        with patch('app.config.settings.openai_api_key', 'test-key'):
-            service = LangGraphService()
-            assert service.llm is not None
+        assert langgraph_service.llm is not None
+        assert langgraph_service.llm.service_tier is None
+    
+    def test_llm_uses_shared_http_client(self):
+        """Test every service instance reuses the pooled HTTP/2 client"""
+        from app.http_client import get_openai_async_client
+        
+        first = LangGraphService()
+        second = LangGraphService()
+        
+        assert first.llm.http_async_client is get_openai_async_client()
+        assert second.llm.http_async_client is first.llm.http_async_client
+    
+    def test_latency_optimized_uses_priority_tier(self, monkeypatch):
+        """Test the priority service tier is requested when enabled"""
+        monkeypatch.setattr(settings, "openai_latency_optimized", True)
+        
+        service = LangGraphService()
+        assert service.llm.service_tier == "priority"
     
-    def test_build_graph(self):
+    def test_build_graph(self, langgraph_service):
         """Test graph building"""
-        with patch('app.config.settings.openai_api_key', 'test-key'):
-            service = LangGraphService()
-            graph = service.build_graph()
-            
-            assert graph is not None
-            # Graph should be compiled and ready to use
-
+        graph = langgraph_service.build_graph()
+        
+        assert graph is not None
+        # Graph should be compiled and ready to use
+        assert langgraph_service.graph is langgraph_service.graph
+        assert langgraph_service.graph is not graph
+    
+    @pytest.mark.asyncio
+    async def test_process_transcript_runs_without_graph(self):
+        """Test processing awaits the steps directly instead of building a graph"""
+        service = LangGraphService()
+        service.llm = RunnableLambda(fake_llm_response)
+        
+        with patch.object(LangGraphService, 'build_graph') as build_graph:
+            await service.process_transcript("first meeting")
+        
+        build_graph.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_graph_matches_direct_pipeline(self):
+        """Test the tracing graph produces the same analysis as process_transcript"""
+        service = LangGraphService()
+        service.llm = RunnableLambda(fake_llm_response)
+        transcript = "long meeting " * 200
+        
+        expected = await service.process_transcript(transcript)
+        final_state = await service.build_graph().ainvoke({
+            "transcript": transcript,
+            "cleaned_transcript": transcript,
+            "topics": [],
+            "summary": "",
+            "decisions": [],
+            "action_items": [],
+            "key_points": []
+        })
+        
+        assert final_state["cleaned_transcript"] == "Cleaned transcript"
+        assert {k: final_state[k] for k in expected} == expected
+    
+    @pytest.mark.asyncio
+    async def test_process_transcript_extracts_all_fields(self):
+        """Test the combined extraction call fills every field"""
+        service = LangGraphService()
+        service.llm = RunnableLambda(fake_llm_response)
+        
+        result = await service.process_transcript("um so the budget uh")
+        
+        assert result == {
+            "summary": "A short summary.",
+            "decisions": ["Approve budget"],
+            "action_items": ["Send report"],
+            "key_points": ["Costs are up"],
+        }
+    
+    @pytest.mark.asyncio
+    async def test_non_string_items_are_coerced_to_strings(self):
+        """Test object, numeric and null items from the model become plain strings"""
+        def object_llm(prompt_value, **kwargs):
+            if "Identify the main topics" in prompt_value.to_messages()[-1].content:
+                return AIMessage(content='{"topics": [{"name": "Budget"}, 2026, null]}')
+            return AIMessage(content=(
+                '{"summary": "S", "decisions": [" Approve ", ""], '
+                '"action_items": [{"task": "Send report", "owner": "Ana"}], '
+                '"key_points": "not a list"}'
+            ))
+        
+        service = LangGraphService()
+        service.llm = RunnableLambda(object_llm)
+        
+        topics = await service.detect_topics("text")
+        analysis = await service.extract_all("text", topics)
+        
+        assert topics == ["Budget", "2026"]
+        assert analysis["decisions"] == ["Approve"]
+        assert analysis["action_items"] == ["Send report - Ana"]
+        assert analysis["key_points"] == []
+    
+    @pytest.mark.asyncio
+    async def test_short_transcript_skips_cleaning(self, monkeypatch):
+        """Test transcripts under the threshold go straight to topic detection"""
+        service = LangGraphService()
+        
+        prompts = []
+        
+        def recording_llm(prompt_value, **kwargs):
+            prompts.append(prompt_value.to_messages()[0].content)
+            return fake_llm_response(prompt_value, **kwargs)
+        
+        service.llm = RunnableLambda(recording_llm)
+        monkeypatch.setattr(settings, "skip_cleaning_threshold", 100)
+        
+        await service.process_transcript("short stand-up")
+        assert not any("transcript editor" in p for p in prompts)
+        
+        await service.process_transcript("long meeting " * 20)
+        assert any("transcript editor" in p for p in prompts)
+    
+    def test_analysis_prompts_share_transcript_prefix(self):
+        """Test topic and extraction prompts differ only after the transcript"""
+        topics = LangGraphService.TOPICS_PROMPT.format_messages(transcript="T")
+        extract = LangGraphService.EXTRACT_PROMPT.format_messages(transcript="T", topics="A")
+        
+        assert [m.content for m in topics[:2]] == [m.content for m in extract[:2]]
+    
+    @pytest.mark.asyncio
+    async def test_process_transcript_rejects_invalid_json(self):
+        """Test a non-JSON reply fails processing instead of being guessed at"""
+        service = LangGraphService()
+        service.llm = RunnableLambda(lambda _, **kwargs: AIMessage(content="Plain text summary"))
+        
+        with pytest.raises(HTTPException) as exc_info:
+            await service.process_transcript("text")
+        
+        assert exc_info.value.status_code == 500
@@ -0,0 +1,59 @@
+"""Unit tests for the LLM request limiter"""
+
+import asyncio
+import pytest
+from unittest.mock import patch
+from app.llm_limiter import LLMRequestLimiter
+
+
+class TestLLMRequestLimiter:
+    """Tests for LLMRequestLimiter"""
+    
+    @pytest.mark.asyncio
+    async def test_caps_concurrent_requests(self):
+        """Test no more than max_concurrency calls run at once"""
+        limiter = LLMRequestLimiter(max_concurrency=2)
+        active = 0
+        peak = 0
+        
+        async def call():
+            nonlocal active, peak
+            async with limiter:
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+        
+        await asyncio.gather(*(call() for _ in range(6)))
+        
+        assert peak == 2
+    
+    @pytest.mark.asyncio
+    async def test_waits_when_rate_budget_is_spent(self):
+        """Test requests past the per-minute budget sleep for the refill"""
+        limiter = LLMRequestLimiter(max_concurrency=10, requests_per_minute=2)
+        sleeps = []
+        
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+        
+        with patch("app.llm_limiter.asyncio.sleep", new=fake_sleep):
+            for _ in range(3):
+                async with limiter:
+                    pass
+        
+        # Two requests fit the bucket; the third waits about 30 seconds
+        assert len(sleeps) == 1
+        assert 29 < sleeps[0] <= 30
+    
+    @pytest.mark.asyncio
+    async def test_slot_released_on_error(self):
+        """Test a failing call gives its slot back"""
+        limiter = LLMRequestLimiter(max_concurrency=1)
+        
+        with pytest.raises(RuntimeError):
+            async with limiter:
+                raise RuntimeError("429")
+        
+        async with limiter:
+            pass
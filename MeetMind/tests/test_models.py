@@ -1,9 +1,37 @@
 """Unit tests for database models"""
 
 import pytest
+from contextlib import contextmanager
 from datetime import datetime
-from app.models.meeting import User, Meeting
-import json
+from sqlalchemy import create_engine, delete, event, insert, inspect, select, text
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
+from sqlalchemy.pool import StaticPool
+from app.database import init_db
+from app.models.meeting import User, Meeting, generate_uuid
+
+
+@contextmanager
+def count_queries(connection):
+    """Collect the SQL statements executed on a connection"""
+    statements = []
+    
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    event.listen(connection, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(connection, "before_cursor_execute", record)
+
+
+def test_generate_uuid_is_time_ordered():
+    """Test generated IDs are 32-char hex strings in creation order"""
+    ids = [generate_uuid() for _ in range(100)]
+    
+    assert all(len(i) == 32 for i in ids)
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
 
 
 class TestUserModel:
@@ -13,7 +41,7 @@ class TestUserModel:
         """Test creating a user"""
         user = User(id="user-123")
         test_db.add(user)
-        test_db.commit()
+        test_db.flush()
         
         assert user.id == "user-123"
         assert user.created_at is not None
@@ -23,7 +51,7 @@ class TestUserModel:
         """Test user-meetings relationship"""
         user = User(id="user-456")
         test_db.add(user)
-        test_db.commit()
+        test_db.flush()
         
         meeting = Meeting(
             user_id=user.id,
@@ -31,73 +59,184 @@ class TestUserModel:
             transcript="Test transcript"
         )
         test_db.add(meeting)
-        test_db.commit()
+        test_db.flush()
+        test_db.expunge_all()
         
-        assert len(user.meetings) == 1
-        assert user.meetings[0].audio_filename == "test.mp3"
+        stmt = (
+            select(User)
+            .options(selectinload(User.meetings), raiseload("*"))
+            .where(User.id == "user-456")
+        )
+        with count_queries(test_db.connection()) as queries:
+            user = test_db.execute(stmt).scalar_one()
+            assert len(user.meetings) == 1
+            assert user.meetings[0].audio_filename == "test.mp3"
+        
+        assert len(queries) == 2
+
+
+def insert_meetings(connection, rows):
+    """Insert meeting rows with one Core executemany, bypassing the unit of work"""
+    connection.execute(insert(Meeting), rows)
+
+
+@pytest.fixture(scope="class")
+def sample_meeting(test_engine, seed_user):
+    """Meeting written once, read back from the database and shared by the field checks"""
+    meeting_id = generate_uuid()
+    with test_engine.begin() as connection:
+        insert_meetings(connection, [{
+            "id": meeting_id,
+            "user_id": seed_user,
+            "audio_filename": "meeting.wav",
+            "transcript": "Hello world",
+            "summary": "Test summary",
+            "decisions": ["Decision 1", "Decision 2"],
+            "action_items": ["Action 1"],
+            "key_points": ["Point 1", "Point 2"],
+        }])
+    
+    with Session(test_engine) as db:
+        meeting = db.get(Meeting, meeting_id)
+    
+    try:
+        yield meeting
+    finally:
+        with test_engine.begin() as connection:
+            connection.execute(delete(Meeting).where(Meeting.id == meeting_id))
 
 
 class TestMeetingModel:
     """Tests for Meeting model"""
     
-    def test_create_meeting(self, test_db):
+    def test_create_meeting(self, sample_meeting, seed_user):
         """Test creating a meeting"""
-        user = User(id="user-789")
-        test_db.add(user)
-        test_db.commit()
+        fields = ("user_id", "audio_filename", "transcript", "summary")
+        
+        assert sample_meeting.id is not None
+        assert {f: getattr(sample_meeting, f) for f in fields} == {
+            "user_id": seed_user,
+            "audio_filename": "meeting.wav",
+            "transcript": "Hello world",
+            "summary": "Test summary",
+        }
+    
+    @pytest.mark.parametrize("field,expected", [
+        ("decisions", ["Decision 1", "Decision 2"]),
+        ("action_items", ["Action 1"]),
+        ("key_points", ["Point 1", "Point 2"]),
+    ])
+    def test_json_list_columns_round_trip(self, sample_meeting, field, expected):
+        """Test JSON list columns come back from the database as native lists"""
+        assert getattr(sample_meeting, field) == expected
+    
+    def test_insert_meetings_is_one_statement(self, test_db, seed_user):
+        """Test the Core helper writes every row with a single INSERT"""
+        rows = [
+            {"user_id": seed_user, "audio_filename": f"bulk{i}.mp3", "decisions": [f"D{i}"]}
+            for i in range(3)
+        ]
+        
+        with count_queries(test_db.connection()) as queries:
+            insert_meetings(test_db.connection(), rows)
         
+        assert len(queries) == 1
+        stored = test_db.execute(
+            select(Meeting.decisions).where(Meeting.audio_filename.like("bulk%"))
+        ).scalars().all()
+        assert sorted(stored) == [["D0"], ["D1"], ["D2"]]
+    
+    def test_json_list_accessors(self):
+        """Test list accessors return native lists and default to empty"""
         meeting = Meeting(
-            user_id=user.id,
+            user_id="user-json",
             audio_filename="meeting.wav",
-            transcript="Hello world",
-            summary="Test summary",
-            decisions=json.dumps(["Decision 1", "Decision 2"]),
-            action_items=json.dumps(["Action 1"]),
-            key_points=json.dumps(["Point 1", "Point 2"])
+            decisions=["Decision 1"]
         )
-        test_db.add(meeting)
-        test_db.commit()
-        
-        assert meeting.id is not None
-        assert meeting.user_id == "user-789"
-        assert meeting.audio_filename == "meeting.wav"
-        assert meeting.transcript == "Hello world"
-        assert meeting.summary == "Test summary"
-        assert json.loads(meeting.decisions) == ["Decision 1", "Decision 2"]
-        assert json.loads(meeting.action_items) == ["Action 1"]
-        assert json.loads(meeting.key_points) == ["Point 1", "Point 2"]
+        
+        assert meeting.decisions_list == ["Decision 1"]
+        assert meeting.action_items_list == []
+        
+        meeting.decisions = ["Decision 2"]
+        assert meeting.decisions_list == ["Decision 2"]
     
-    def test_meeting_user_relationship(self, test_db):
+    def test_meeting_user_relationship(self, test_db, seed_user):
         """Test meeting-user relationship"""
-        user = User(id="user-999")
-        test_db.add(user)
-        test_db.commit()
-        
         meeting = Meeting(
-            user_id=user.id,
+            user_id=seed_user,
             audio_filename="test.mp3",
             transcript="Test"
         )
         test_db.add(meeting)
-        test_db.commit()
+        test_db.flush()
+        meeting_id = meeting.id
+        test_db.expunge_all()
+        
+        stmt = (
+            select(Meeting)
+            .options(joinedload(Meeting.user), raiseload("*"))
+            .where(Meeting.id == meeting_id)
+        )
+        with count_queries(test_db.connection()) as queries:
+            meeting = test_db.execute(stmt).scalar_one()
+            assert meeting.user.id == seed_user
         
-        assert meeting.user.id == "user-999"
+        assert len(queries) == 1
     
     def test_cascade_delete(self, test_db):
         """Test that deleting user deletes meetings"""
         user = User(id="user-cascade")
-        test_db.add(user)
-        test_db.commit()
-        
         meeting1 = Meeting(user_id=user.id, audio_filename="m1.mp3", transcript="T1")
         meeting2 = Meeting(user_id=user.id, audio_filename="m2.mp3", transcript="T2")
-        test_db.add_all([meeting1, meeting2])
-        test_db.commit()
         
-        # Delete user
-        test_db.delete(user)
-        test_db.commit()
+        # One flush: the user row, then both meetings in one multi-row INSERT
+        test_db.add_all([user, meeting1, meeting2])
+        test_db.flush()
+        
+        # Delete user with one statement; SQLite removes the meetings itself
+        stmt = (
+            delete(User)
+            .where(User.id == "user-cascade")
+            .execution_options(synchronize_session=False)
+        )
+        with count_queries(test_db.connection()) as queries:
+            test_db.execute(stmt)
+        
+        assert len(queries) == 1
         
         # Check meetings are deleted
-        meetings = test_db.query(Meeting).filter(Meeting.user_id == "user-cascade").all()
-        assert len(meetings) == 0
+        remaining = test_db.scalars(select(Meeting).where(Meeting.user_id == "user-cascade")).all()
+        assert remaining == []
+
+
+class TestInitDb:
+    """Tests for upgrading an existing database in init_db"""
+    
+    def test_adds_missing_meeting_columns_and_indexes(self):
+        """Test a pre-status meetings table gains the new columns, backfilled as completed"""
+        engine = create_engine("sqlite://", poolclass=StaticPool)
+        with engine.begin() as connection:
+            connection.execute(text(
+                "CREATE TABLE users (id VARCHAR(36) PRIMARY KEY, created_at DATETIME)"
+            ))
+            connection.execute(text(
+                "CREATE TABLE meetings (id VARCHAR(36) PRIMARY KEY, user_id VARCHAR(36) NOT NULL, "
+                "audio_filename VARCHAR(255) NOT NULL, transcript TEXT, summary TEXT, decisions TEXT, "
+                "action_items TEXT, key_points TEXT, created_at DATETIME)"
+            ))
+            connection.execute(text(
+                "INSERT INTO meetings (id, user_id, audio_filename) VALUES ('old', 'u1', 'old.mp3')"
+            ))
+        
+        init_db(engine)
+        init_db(engine)  # Idempotent once upgraded
+        
+        inspector = inspect(engine)
+        columns = {column["name"] for column in inspector.get_columns("meetings")}
+        assert {"status", "error", "audio_hash"} <= columns
+        indexes = {index["name"] for index in inspector.get_indexes("meetings")}
+        assert {"idx_meetings_user_created", "idx_meetings_user_audio_hash"} <= indexes
+        with engine.connect() as connection:
+            status = connection.execute(text("SELECT status FROM meetings WHERE id = 'old'")).scalar_one()
+        assert status == "completed"
+        engine.dispose()
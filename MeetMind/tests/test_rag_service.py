@@ -0,0 +1,199 @@
+"""Unit tests for RAG service"""
+
+import json
+import pytest
+from unittest.mock import Mock, AsyncMock, patch
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from app.services.rag_service import RAGService
+
+
+class ByteEncoding:
+    """Stand-in tokenizer with one token per UTF-8 byte (no BPE download needed)"""
+    
+    def encode(self, text):
+        return list(text.encode("utf-8"))
+    
+    def decode(self, tokens):
+        return bytes(tokens).decode("utf-8", errors="replace")
+
+
+@pytest.fixture(autouse=True)
+def byte_encoding():
+    """Replace the tiktoken encoding used for context budgeting"""
+    with patch('app.services.rag_service._get_encoding', return_value=ByteEncoding()):
+        yield
+
+
+@pytest.fixture
+def rag_service():
+    """RAGService with mocked vector store, cache and answer generation"""
+    with patch('app.config.settings.openai_api_key', 'test-key'), \
+            patch('app.config.settings.chroma_api_key', 'test-key'):
+        service = RAGService()
+    
+    service.vector_store = AsyncMock()
+    service.vector_store.embed_query.return_value = [0.1, 0.2, 0.3]
+    service.vector_store.get_collection_id.return_value = "col-1"
+    service.vector_store.search_by_embedding.return_value = [
+        {
+            "content": "We decided to ship on Friday",
+            "metadata": {"meeting_id": "m1", "type": "decision"},
+            "distance": 0.2
+        }
+    ]
+    service.cache = AsyncMock()
+    service._generate_answer = AsyncMock(return_value="Ship on Friday.")
+    return service
+
+
+class TestSemanticCache:
+    """Tests for the semantic answer cache in RAGService"""
+    
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_search_and_llm(self, rag_service):
+        """Test a cached answer is returned without retrieval or generation"""
+        cached = {"answer": "Cached", "sources": ["m1"], "context_used": []}
+        rag_service.cache.lookup.return_value = cached
+        
+        result = await rag_service.query_meetings("user-1", "What did we decide?")
+        
+        assert result == cached
+        rag_service.vector_store.search_by_embedding.assert_not_called()
+        rag_service._generate_answer.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_cache_miss_stores_answer_with_shared_embedding(self, rag_service):
+        """Test a miss embeds once, searches with that embedding and stores the answer"""
+        rag_service.cache.lookup.return_value = None
+        
+        result = await rag_service.query_meetings("user-1", "What did we decide?")
+        
+        assert result["answer"] == "Ship on Friday."
+        assert result["sources"] == ["m1"]
+        rag_service.vector_store.embed_query.assert_called_once_with("What did we decide?")
+        rag_service.vector_store.search_by_embedding.assert_called_once_with(
+            "user-1", [0.1, 0.2, 0.3], None, "col-1"
+        )
+        rag_service.cache.store.assert_called_once_with(
+            "user-1", "What did we decide?", [0.1, 0.2, 0.3], result, None
+        )
+    
+    @pytest.mark.asyncio
+    async def test_missing_collection_skips_search(self, rag_service):
+        """Test a user without a collection gets the no-context answer without a search"""
+        rag_service.cache.lookup.return_value = None
+        rag_service.vector_store.get_collection_id.return_value = None
+        
+        result = await rag_service.query_meetings("user-1", "What did we decide?")
+        
+        assert result["sources"] == []
+        rag_service.vector_store.search_by_embedding.assert_not_called()
+        rag_service._generate_answer.assert_not_called()
+
+
+class TestQueryStreaming:
+    """Tests for streaming RAG answers"""
+    
+    @pytest.mark.asyncio
+    async def test_stream_emits_tokens_then_sources(self, rag_service):
+        """Test tokens arrive as separate events followed by the sources event"""
+        rag_service.cache.lookup.return_value = None
+        rag_service.llm = GenericFakeChatModel(messages=iter([AIMessage(content="Ship on Friday.")]))
+        
+        events = [
+            event async for event in rag_service.query_meetings_stream("user-1", "What did we decide?")
+        ]
+        
+        token_events = [e for e in events if e.startswith("event: token")]
+        assert len(token_events) > 1
+        answer = "".join(
+            json.loads(e.split("data: ", 1)[1])["content"] for e in token_events
+        )
+        assert answer == "Ship on Friday."
+        
+        assert events[-1].startswith("event: sources")
+        assert json.loads(events[-1].split("data: ", 1)[1])["sources"] == ["m1"]
+        rag_service.cache.store.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_stream_validates_before_first_event(self, rag_service):
+        """Test invalid input raises before anything is streamed"""
+        events = rag_service.query_meetings_stream("user-1", "  ")
+        
+        with pytest.raises(ValueError, match="query is required"):
+            await events.__anext__()
+
+
+class TestPrepareContext:
+    """Tests for building context, sources and snippets from retrieved documents"""
+    
+    def test_context_within_budget_is_unchanged(self, rag_service):
+        """Test small contexts keep every document, most relevant first"""
+        docs = [
+            {"content": "second", "metadata": {"type": "summary", "meeting_id": "m1"}, "distance": 0.5},
+            {"content": "first", "metadata": {"type": "decision", "meeting_id": "m1"}, "distance": 0.1},
+        ]
+        
+        context, _, _ = rag_service._prepare_context(docs)
+        
+        assert context == "[decision] first\n\n[summary] second"
+    
+    def test_context_truncated_at_token_budget(self, rag_service):
+        """Test documents past the budget are cut on a token boundary and dropped"""
+        docs = [
+            {"content": "a" * 20, "metadata": {"type": "transcript", "meeting_id": "m1"}, "distance": 0.1},
+            {"content": "é" * 20, "metadata": {"type": "transcript", "meeting_id": "m1"}, "distance": 0.2},
+            {"content": "never", "metadata": {"type": "summary", "meeting_id": "m1"}, "distance": 0.3},
+        ]
+        
+        with patch('app.services.rag_service.MAX_CONTEXT_TOKENS', 50):
+            context, sources, context_used = rag_service._prepare_context(docs)
+        
+        first, second = context.split("\n\n")
+        assert first == "[transcript] " + "a" * 20
+        assert second.startswith("[transcript] é")
+        assert "\ufffd" not in second
+        assert "never" not in context
+        assert len(context.encode("utf-8")) <= 50
+        
+        # Documents past the budget still count as sources and snippets
+        assert sources == ["m1"]
+        assert len(context_used) == 3
+    
+    def test_sources_deduplicated_in_relevance_order(self, rag_service):
+        """Test duplicate meeting IDs collapse while keeping the first-seen order"""
+        docs = [
+            {"content": "x" * 600, "metadata": {"meeting_id": meeting_id}}
+            for meeting_id in ["m3", "m1", "m3", "m2", "m1"]
+        ]
+        
+        _, sources, context_used = rag_service._prepare_context(docs)
+        
+        assert sources == ["m3", "m1", "m2"]
+        assert [c["meeting_id"] for c in context_used] == ["m3", "m1", "m3"]
+        assert context_used[0]["snippet"].endswith("...")
+
+
+class TestQueryEmbedding:
+    """Tests for query embedding reuse in VectorStoreService"""
+    
+    @pytest.mark.asyncio
+    async def test_embed_query_is_memoized(self):
+        """Test repeated queries call the embeddings API once"""
+        from app.services.vector_store_service import VectorStoreService
+        from app.services.embedding_cache import EmbeddingCache
+        from app.services.search_result_cache import SearchResultCache
+        
+        with patch('app.config.settings.chroma_api_key', 'test-key'):
+            vector_store = VectorStoreService()
+        vector_store.embedding_cache = EmbeddingCache("test-model")
+        vector_store.search_cache = SearchResultCache()
+        vector_store.embeddings = Mock()
+        vector_store.embeddings.aembed_query = AsyncMock(return_value=[0.5, 0.25])
+        
+        first = await vector_store.embed_query("What did we decide?")
+        second = await vector_store.embed_query("What did we decide?")
+        
+        assert first == second == [0.5, 0.25]
+        vector_store.embeddings.aembed_query.assert_called_once_with("What did we decide?")
@@ -0,0 +1,136 @@
+"""Unit tests for the semantic answer cache"""
+
+import json
+import time
+import orjson
+import pytest
+from unittest.mock import Mock, AsyncMock, patch
+from app.services.vector_store_service import VectorStoreService
+from app.services.semantic_cache import SemanticCache
+
+
+CACHED = {"answer": "Ship on Friday.", "sources": ["m1"], "context_used": []}
+
+
+@pytest.fixture
+def vector_store():
+    """VectorStoreService whose HTTP client finds the cache collection"""
+    with patch('app.config.settings.chroma_api_key', 'test-key'):
+        service = VectorStoreService()
+    
+    service._collection_id_cache = {}
+    service.http_client = AsyncMock()
+    service.http_client.get.return_value = Mock(status_code=200, content=orjson.dumps({"id": "qa-1"}))
+    service.http_client.post.return_value = Mock(status_code=200)
+    return service
+
+
+@pytest.fixture
+def cache(vector_store):
+    """SemanticCache with a one hour TTL"""
+    return SemanticCache(vector_store, ttl_seconds=3600, max_distance=0.05)
+
+
+def query_response(distance: float, ts: float, top_k: int = 5) -> Mock:
+    """Chroma query response holding a single cached answer"""
+    return Mock(status_code=200, content=orjson.dumps({
+        "ids": [["entry-1"]],
+        "metadatas": [[{"ts": ts, "top_k": top_k, "payload": json.dumps(CACHED)}]],
+        "distances": [[distance]]
+    }))
+
+
+class TestLookup:
+    """Tests for SemanticCache.lookup"""
+    
+    @pytest.mark.asyncio
+    async def test_close_fresh_entry_is_a_hit(self, cache, vector_store):
+        """Test an entry within the distance threshold returns its answer"""
+        vector_store.http_client.post.return_value = query_response(0.01, time.time())
+        
+        result = await cache.lookup("user-1", [1.0, 0.0], top_k=5)
+        
+        assert result == CACHED
+        query_call = vector_store.http_client.post.call_args
+        assert query_call.args[0].endswith("/collections/qa-1/query")
+        assert orjson.loads(query_call.kwargs["content"])["where"] == {"top_k": 5}
+    
+    @pytest.mark.asyncio
+    async def test_distant_entry_is_a_miss(self, cache, vector_store):
+        """Test an entry at or beyond the distance threshold is ignored"""
+        vector_store.http_client.post.return_value = query_response(0.05, time.time())
+        
+        assert await cache.lookup("user-1", [1.0, 0.0], top_k=5) is None
+    
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_evicted(self, cache, vector_store):
+        """Test an entry older than the TTL is a miss and triggers eviction"""
+        vector_store.http_client.post.return_value = query_response(0.01, time.time() - 7200)
+        
+        assert await cache.lookup("user-1", [1.0, 0.0], top_k=5) is None
+        
+        evict_call = vector_store.http_client.post.call_args
+        assert evict_call.args[0].endswith("/collections/qa-1/delete")
+        assert "$lt" in orjson.loads(evict_call.kwargs["content"])["where"]["ts"]
+    
+    @pytest.mark.asyncio
+    async def test_eviction_retries_throttled_delete(self, cache, vector_store):
+        """Test eviction goes through the vector store's backoff on 429"""
+        vector_store.http_client.post.side_effect = [
+            query_response(0.01, time.time() - 7200),
+            Mock(status_code=429, headers={"Retry-After": "0"}),
+            Mock(status_code=200)
+        ]
+        
+        assert await cache.lookup("user-1", [1.0, 0.0], top_k=5) is None
+        
+        assert vector_store.http_client.post.call_count == 3
+        assert vector_store.http_client.post.call_args.args[0].endswith("/collections/qa-1/delete")
+    
+    @pytest.mark.asyncio
+    async def test_missing_collection_is_a_miss(self, cache, vector_store):
+        """Test a user without a cache collection misses without a query"""
+        vector_store.http_client.get.return_value = Mock(status_code=404)
+        
+        assert await cache.lookup("user-1", [1.0, 0.0]) is None
+        vector_store.http_client.post.assert_not_called()
+
+
+class TestStore:
+    """Tests for SemanticCache.store"""
+    
+    @pytest.mark.asyncio
+    async def test_store_records_timestamp_and_top_k(self, cache, vector_store):
+        """Test stored entries carry the data lookup filters on"""
+        await cache.store("user-1", "What did we decide?", [1.0, 0.0], CACHED, top_k=3)
+        
+        add_call = vector_store.http_client.post.call_args
+        assert add_call.args[0].endswith("/collections/qa-1/add")
+        metadata = orjson.loads(add_call.kwargs["content"])["metadatas"][0]
+        assert metadata["top_k"] == 3
+        assert metadata["ts"] <= time.time()
+        assert json.loads(metadata["payload"]) == CACHED
+
+
+class TestInvalidate:
+    """Tests for SemanticCache.invalidate"""
+    
+    @pytest.mark.asyncio
+    async def test_invalidate_deletes_every_entry(self, cache, vector_store):
+        """Test invalidation deletes all of the user's cached answers"""
+        await cache.invalidate("user-1")
+        
+        vector_store.http_client.get.assert_called_once()
+        assert vector_store.http_client.get.call_args.args[0].endswith("/collections/user_user-1_qa_cache")
+        delete_call = vector_store.http_client.post.call_args
+        assert delete_call.args[0].endswith("/collections/qa-1/delete")
+        assert orjson.loads(delete_call.kwargs["content"]) == {"where": {"ts": {"$gte": 0}}}
+    
+    @pytest.mark.asyncio
+    async def test_invalidate_without_collection_is_a_no_op(self, cache, vector_store):
+        """Test a user who never cached an answer needs no delete"""
+        vector_store.http_client.get.return_value = Mock(status_code=404)
+        
+        await cache.invalidate("user-1")
+        
+        vector_store.http_client.post.assert_not_called()
@@ -0,0 +1,388 @@
+"""Unit tests for vector store service"""
+
+import asyncio
+import orjson
+import pytest
+from unittest.mock import Mock, AsyncMock, patch
+from app.services.vector_store_service import VectorStoreService
+from app.constants import EMBEDDING_BATCH_SIZE
+from app.services.embedding_cache import EmbeddingCache
+from app.services.search_result_cache import SearchResultCache
+from app.exceptions import VectorStoreError
+from app.config import settings
+
+
+@pytest.fixture
+def vector_store(monkeypatch):
+    """VectorStoreService with mocked embeddings and HTTP client"""
+    monkeypatch.setattr(settings, "rag_cache_enabled", False)
+    with patch('app.config.settings.chroma_api_key', 'test-key'):
+        service = VectorStoreService()
+    
+    service.embedding_cache = EmbeddingCache("test-model")
+    service.search_cache = SearchResultCache()
+    service._collection_id_cache = {}
+    service.embeddings = Mock()
+    service.embeddings.aembed_documents = AsyncMock(
+        side_effect=lambda texts, chunk_size=None: [[float(i)] for i in range(len(texts))]
+    )
+    service.http_client = AsyncMock()
+    service.http_client.get.return_value = Mock(status_code=200, content=orjson.dumps({"id": "col-1"}))
+    service.http_client.post.return_value = Mock(status_code=201)
+    return service
+
+
+class TestIndexMeeting:
+    """Tests for VectorStoreService.index_meeting"""
+    
+    @pytest.mark.asyncio
+    async def test_index_meeting_batches_all_documents(self, vector_store):
+        """Test every document is embedded in one batched call and added in one request"""
+        await vector_store.index_meeting(
+            user_id="user-1",
+            meeting_id="m1",
+            transcript="Short transcript",
+            summary="Summary",
+            decisions=["Decision 1"],
+            action_items=["Action 1"],
+            key_points=["Point 1"],
+            batch_size=16
+        )
+        
+        vector_store.embeddings.aembed_documents.assert_called_once_with(
+            ["Short transcript", "Summary", "Decision 1", "Action 1", "Point 1"],
+            chunk_size=16
+        )
+        
+        add_call = vector_store.http_client.post.call_args
+        assert add_call.args[0].endswith("/collections/col-1/add")
+        payload = orjson.loads(add_call.kwargs["content"])
+        assert payload["ids"] == [
+            "m1_transcript_0", "m1_summary", "m1_decision_0", "m1_action_item_0", "m1_key_point_0"
+        ]
+        assert payload["embeddings"] == [[0.0], [1.0], [2.0], [3.0], [4.0]]
+
+    
+    @pytest.mark.asyncio
+    async def test_index_meeting_embeds_batches_concurrently_in_order(self, vector_store):
+        """Test batches run in parallel up to the cap and embeddings keep document order"""
+        active = 0
+        peak = 0
+        
+        async def embed(texts, chunk_size=None):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return [[float(text.split()[-1])] for text in texts]
+        
+        vector_store.embeddings.aembed_documents = AsyncMock(side_effect=embed)
+        decisions = [f"Decision {i}" for i in range(1, 12)]
+        
+        with patch('app.services.vector_store_service.EMBEDDING_MAX_CONCURRENCY', 2):
+            await vector_store.index_meeting(
+                user_id="user-1",
+                meeting_id="m1",
+                transcript="Transcript 0",
+                summary="Summary 0",
+                decisions=decisions,
+                action_items=[],
+                key_points=[],
+                batch_size=3
+            )
+        
+        assert vector_store.embeddings.aembed_documents.call_count == 5
+        assert peak == 2
+        payload = orjson.loads(vector_store.http_client.post.call_args.kwargs["content"])
+        assert payload["embeddings"] == [[0.0], [0.0]] + [[float(i)] for i in range(1, 12)]
+
+    
+    @pytest.mark.asyncio
+    async def test_index_meeting_adds_in_batches(self, vector_store):
+        """Test records are split across /add requests without losing any"""
+        with patch('app.services.vector_store_service.CHROMA_ADD_BATCH_SIZE', 2):
+            await vector_store.index_meeting(
+                user_id="user-1",
+                meeting_id="m1",
+                transcript="Short transcript",
+                summary="Summary",
+                decisions=["Decision 1"],
+                action_items=["Action 1"],
+                key_points=["Point 1"]
+            )
+        
+        payloads = [orjson.loads(c.kwargs["content"]) for c in vector_store.http_client.post.call_args_list]
+        assert [len(p["ids"]) for p in payloads] == [2, 2, 1]
+        assert [i for p in payloads for i in p["ids"]] == [
+            "m1_transcript_0", "m1_summary", "m1_decision_0", "m1_action_item_0", "m1_key_point_0"
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_index_meeting_reports_failed_batch(self, vector_store):
+        """Test a rejected batch raises with its index"""
+        vector_store.http_client.post.side_effect = [
+            Mock(status_code=201),
+            Mock(status_code=413, text="Payload too large")
+        ]
+        
+        with patch('app.services.vector_store_service.CHROMA_ADD_BATCH_SIZE', 3):
+            with pytest.raises(VectorStoreError, match="batch 1"):
+                await vector_store.index_meeting(
+                    user_id="user-1",
+                    meeting_id="m1",
+                    transcript="Short transcript",
+                    summary="Summary",
+                    decisions=["Decision 1"],
+                    action_items=["Action 1"],
+                    key_points=["Point 1"]
+                )
+    
+    @pytest.mark.asyncio
+    async def test_failed_batch_cancels_pending_batches_and_cleans_up(self, vector_store):
+        """Test a rejected batch stops the other batches and removes the partial meeting"""
+        cancelled = []
+        
+        async def post(url, **kwargs):
+            payload = orjson.loads(kwargs["content"])
+            if url.endswith("/delete"):
+                return Mock(status_code=200)
+            if "m1_transcript_0" in payload["ids"]:
+                return Mock(status_code=413, text="Payload too large")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(payload["ids"][0])
+                raise
+            return Mock(status_code=201)
+        
+        vector_store.http_client.post.side_effect = post
+        
+        with patch('app.services.vector_store_service.CHROMA_ADD_BATCH_SIZE', 3):
+            with pytest.raises(VectorStoreError, match="batch 0"):
+                await asyncio.wait_for(vector_store.index_meeting(
+                    user_id="user-1",
+                    meeting_id="m1",
+                    transcript="Short transcript",
+                    summary="Summary",
+                    decisions=["Decision 1"],
+                    action_items=["Action 1"],
+                    key_points=["Point 1"]
+                ), timeout=5)
+        
+        assert cancelled == ["m1_action_item_0"]
+        delete_call = vector_store.http_client.post.call_args
+        assert delete_call.args[0].endswith("/collections/col-1/delete")
+        assert orjson.loads(delete_call.kwargs["content"]) == {"where": {"meeting_id": "m1"}}
+
+    
+    @pytest.mark.asyncio
+    async def test_index_meeting_embeds_only_uncached_unique_texts(self, vector_store):
+        """Test cached texts and repeats are not sent to the embeddings API"""
+        vector_store.embedding_cache.set_many(["Summary"], [[9.0]])
+        
+        await vector_store.index_meeting(
+            user_id="user-1",
+            meeting_id="m1",
+            transcript="Short transcript",
+            summary="Summary",
+            decisions=["Follow up"],
+            action_items=["Follow up"],
+            key_points=[]
+        )
+        
+        vector_store.embeddings.aembed_documents.assert_called_once_with(
+            ["Short transcript", "Follow up"], chunk_size=EMBEDDING_BATCH_SIZE
+        )
+        payload = orjson.loads(vector_store.http_client.post.call_args.kwargs["content"])
+        assert payload["embeddings"] == [[0.0], [9.0], [1.0], [1.0]]
+
+
+class TestPrepareDocuments:
+    """Tests for VectorStoreService._prepare_documents"""
+    
+    def test_prepare_documents_ids_and_metadata(self, vector_store):
+        """Test documents, ids and metadata stay aligned in section order"""
+        vector_store.text_splitter = Mock()
+        vector_store.text_splitter.split_text.return_value = ["c0", "c1"]
+        
+        documents, metadatas, ids = vector_store._prepare_documents(
+            "m1", "transcript", "Summary", ["d0"], ["a0", "a1"], []
+        )
+        
+        assert documents == ["c0", "c1", "Summary", "d0", "a0", "a1"]
+        assert ids == [
+            "m1_transcript_0", "m1_transcript_1", "m1_summary",
+            "m1_decision_0", "m1_action_item_0", "m1_action_item_1"
+        ]
+        assert metadatas[1] == {"meeting_id": "m1", "type": "transcript", "chunk_index": "1"}
+        assert metadatas[2] == {"meeting_id": "m1", "type": "summary"}
+        assert metadatas[5] == {"meeting_id": "m1", "type": "action_item", "chunk_index": "1"}
+    
+    def test_prepare_documents_skips_blank_and_duplicate_items(self, vector_store):
+        """Test blank entries and repeats are not indexed"""
+        vector_store.text_splitter = Mock()
+        vector_store.text_splitter.split_text.return_value = ["c0"]
+        
+        documents, metadatas, ids = vector_store._prepare_documents(
+            "m1", "transcript", " ", ["Ship it", " Ship it ", ""], ["Ship it"], ["  "]
+        )
+        
+        assert documents == ["c0", "Ship it", "Ship it"]
+        assert ids == ["m1_transcript_0", "m1_decision_0", "m1_action_item_0"]
+        assert len(metadatas) == 3
+
+
+class TestSearch:
+    """Tests for VectorStoreService.search"""
+    
+    @pytest.mark.asyncio
+    async def test_search_uses_looked_up_collection(self, vector_store):
+        """Test search embeds the query and queries the user's collection"""
+        vector_store.embeddings.aembed_query = AsyncMock(return_value=[0.5])
+        vector_store.http_client.post.return_value = Mock(
+            status_code=200,
+            content=orjson.dumps({
+                "ids": [["m1_summary"]],
+                "documents": [["Summary"]],
+                "metadatas": [[{"meeting_id": "m1", "type": "summary"}]],
+                "distances": [[0.1]]
+            })
+        )
+        
+        results = await vector_store.search("user-1", "What happened?", top_k=3)
+        
+        assert results == [{
+            "content": "Summary",
+            "metadata": {"meeting_id": "m1", "type": "summary"},
+            "distance": 0.1
+        }]
+        query_call = vector_store.http_client.post.call_args
+        assert query_call.args[0].endswith("/collections/col-1/query")
+        assert orjson.loads(query_call.kwargs["content"]) == {
+            "query_embeddings": [[0.5]],
+            "n_results": 3,
+            "include": ["documents", "metadatas", "distances"]
+        }
+    
+    @pytest.mark.asyncio
+    async def test_search_without_collection_returns_empty(self, vector_store):
+        """Test users without a collection get no results and no query request"""
+        vector_store.embeddings.aembed_query = AsyncMock(return_value=[0.5])
+        vector_store.http_client.get.return_value = Mock(status_code=404)
+        
+        assert await vector_store.search("user-1", "What happened?") == []
+        vector_store.http_client.post.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_near_duplicate_query_reuses_results(self, vector_store):
+        """Test a near-identical query embedding skips the Chroma query"""
+        vector_store.http_client.post.return_value = Mock(
+            status_code=200,
+            content=orjson.dumps({
+                "ids": [["m1_summary"]],
+                "documents": [["Summary"]],
+                "metadatas": [[{"meeting_id": "m1"}]],
+                "distances": [[0.1]]
+            })
+        )
+        
+        first = await vector_store.search_by_embedding("user-1", [1.0, 0.0], top_k=3)
+        second = await vector_store.search_by_embedding("user-1", [0.99, 0.01], top_k=3)
+        
+        assert first == second
+        assert vector_store.http_client.post.call_count == 1
+        
+        await vector_store.search_by_embedding("user-1", [0.0, 1.0], top_k=3)
+        await vector_store.search_by_embedding("user-1", [1.0, 0.0], top_k=5)
+        assert vector_store.http_client.post.call_count == 3
+    
+    @pytest.mark.asyncio
+    async def test_indexing_invalidates_cached_results(self, vector_store):
+        """Test new meetings are visible to the next search"""
+        vector_store.search_cache.put("user-1", [1.0, 0.0], 3, [{"content": "old"}])
+        
+        await vector_store.index_meeting(
+            user_id="user-1",
+            meeting_id="m2",
+            transcript="Hello",
+            summary="Summary",
+            decisions=[],
+            action_items=[],
+            key_points=[]
+        )
+        
+        assert vector_store.search_cache.get("user-1", [1.0, 0.0], 3) is None
+    
+    @pytest.mark.asyncio
+    async def test_indexing_invalidates_cached_answers(self, vector_store, monkeypatch):
+        """Test indexing clears the user's semantic answer cache"""
+        monkeypatch.setattr(settings, "rag_cache_enabled", True)
+        
+        await vector_store.index_meeting(
+            user_id="user-1",
+            meeting_id="m2",
+            transcript="Hello",
+            summary="Summary",
+            decisions=[],
+            action_items=[],
+            key_points=[]
+        )
+        
+        cache_lookup = vector_store.http_client.get.call_args_list[-1]
+        assert cache_lookup.args[0].endswith("/collections/user_user-1_qa_cache")
+        delete_call = vector_store.http_client.post.call_args
+        assert delete_call.args[0].endswith("/collections/col-1/delete")
+        assert orjson.loads(delete_call.kwargs["content"]) == {"where": {"ts": {"$gte": 0}}}
+    
+    @pytest.mark.asyncio
+    async def test_collection_id_is_looked_up_once(self, vector_store):
+        """Test repeated searches reuse the cached collection ID"""
+        vector_store.embeddings.aembed_query = AsyncMock(side_effect=[[1.0, 0.0], [0.0, 1.0]])
+        vector_store.http_client.post.return_value = Mock(
+            status_code=200,
+            content=orjson.dumps({"ids": [[]]})
+        )
+        
+        await vector_store.search("user-1", "First question")
+        await vector_store.search("user-1", "Second question")
+        
+        vector_store.http_client.get.assert_called_once()
+        assert vector_store.http_client.post.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_stale_collection_id_is_resolved_again(self, vector_store):
+        """Test a 404 for a cached ID refreshes the ID and retries once"""
+        vector_store._collection_id_cache["user_user-1_meetings"] = "col-old"
+        vector_store.http_client.post.side_effect = [
+            Mock(status_code=404, text="Collection not found"),
+            Mock(status_code=200, content=orjson.dumps({
+                "ids": [["m1_summary"]],
+                "documents": [["Summary"]],
+                "metadatas": [[{"meeting_id": "m1"}]],
+                "distances": [[0.1]]
+            }))
+        ]
+        
+        results = await vector_store.search_by_embedding("user-1", [1.0, 0.0], top_k=3)
+        
+        assert [r["content"] for r in results] == ["Summary"]
+        retry_call = vector_store.http_client.post.call_args
+        assert retry_call.args[0].endswith("/collections/col-1/query")
+        assert vector_store._collection_id_cache["user_user-1_meetings"] == "col-1"
+    
+    @pytest.mark.asyncio
+    async def test_throttled_request_honors_retry_after(self, vector_store):
+        """Test a 429 is retried after the server's Retry-After delay"""
+        vector_store._collection_id_cache["user_user-1_meetings"] = "col-1"
+        vector_store.http_client.post.side_effect = [
+            Mock(status_code=429, headers={"Retry-After": "2"}),
+            Mock(status_code=200, content=orjson.dumps({"ids": [[]]}))
+        ]
+        
+        with patch("app.services.vector_store_service.asyncio.sleep", new=AsyncMock()) as sleep:
+            results = await vector_store.search_by_embedding("user-1", [1.0, 0.0], top_k=3)
+        
+        assert results == []
+        sleep.assert_awaited_once_with(2.0)
+        assert vector_store.http_client.post.call_count == 2
@@ -0,0 +1,279 @@
+"""Unit tests for Whisper service"""
+
+import asyncio
+import sys
+import pytest
+from unittest.mock import Mock, AsyncMock, patch
+from fastapi import HTTPException
+from app.services.whisper_service import WhisperService
+
+
+def _fake_client(transcribe):
+    """OpenAI client whose transcription endpoint runs transcribe(file_name)"""
+    async def create(model, file, language, timeout):
+        _, audio_file, _ = file
+        return Mock(text=await transcribe(audio_file.name))
+    
+    client = Mock()
+    client.audio.transcriptions.create = AsyncMock(side_effect=create)
+    return client
+
+
+def _write_chunks(tmp_path, count):
+    """Create numbered chunk files"""
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"chunk_{i:04d}.mp3"
+        path.write_bytes(b"ID3")
+        paths.append(str(path))
+    return paths
+
+
+async def _iterate(paths):
+    """Async iterator over paths, like split_audio_with_ffmpeg"""
+    for path in paths:
+        yield path
+
+
+# Stands in for ffmpeg's segment muxer: writes numbered chunks one at a time
+_FAKE_SEGMENTER = """
+import sys, time
+pattern, count, fail = sys.argv[1], int(sys.argv[2]), sys.argv[3] == "1"
+for i in range(count):
+    with open(pattern % i, "wb") as f:
+        f.write(b"ID3")
+    time.sleep(0.3)
+if fail:
+    sys.stderr.write("Invalid data found when processing input")
+    sys.exit(1)
+"""
+
+
+def _fake_ffmpeg(count, fail=False, calls=None):
+    """create_subprocess_exec replacement that runs _FAKE_SEGMENTER on ffmpeg's output pattern"""
+    real_exec = asyncio.create_subprocess_exec
+    
+    async def create_subprocess_exec(*args, **kwargs):
+        if calls is not None:
+            calls.append(args)
+        return await real_exec(
+            sys.executable, "-c", _FAKE_SEGMENTER, args[-1], str(count), "1" if fail else "0", **kwargs
+        )
+    
+    return patch("app.services.whisper_service.asyncio.create_subprocess_exec", new=create_subprocess_exec)
+
+
+class TestTranscribeChunksParallel:
+    """Tests for WhisperService.transcribe_chunks_parallel"""
+    
+    @pytest.mark.asyncio
+    async def test_chunks_are_returned_in_order_with_bounded_concurrency(self, tmp_path):
+        """Test out-of-order completions are reassembled and uploads are capped"""
+        paths = _write_chunks(tmp_path, 6)
+        in_flight = 0
+        peak = 0
+        
+        async def transcribe(name):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            index = paths.index(name)
+            await asyncio.sleep(0.01 * (6 - index))
+            in_flight -= 1
+            return f" text {index} "
+        
+        transcripts = await WhisperService.transcribe_chunks_parallel(_fake_client(transcribe), _iterate(paths))
+        
+        assert transcripts == [f"text {i}" for i in range(6)]
+        assert peak == WhisperService.MAX_PARALLEL_TRANSCRIPTIONS
+    
+    @pytest.mark.asyncio
+    async def test_failed_chunk_raises_http_error(self, tmp_path):
+        """Test a failing upload surfaces as a 500"""
+        paths = _write_chunks(tmp_path, 2)
+        
+        async def transcribe(name):
+            raise RuntimeError("upstream timeout")
+        
+        with pytest.raises(HTTPException) as exc_info:
+            await WhisperService.transcribe_chunks_parallel(_fake_client(transcribe), _iterate(paths))
+        
+        assert exc_info.value.status_code == 500
+        assert "upstream timeout" in exc_info.value.detail
+
+
+class TestSplitAudio:
+    """Tests for WhisperService.split_audio_with_ffmpeg"""
+    
+    @pytest.mark.asyncio
+    async def test_chunks_are_yielded_while_ffmpeg_runs(self, tmp_path):
+        """Test a finished chunk is handed out before the split completes"""
+        chunk_dir = tmp_path / "chunks"
+        chunk_dir.mkdir()
+        seen = []
+        
+        input_path = tmp_path / "in.mp3"
+        input_path.write_bytes(b"ID3")
+        
+        with _fake_ffmpeg(3):
+            async for chunk_path in WhisperService.split_audio_with_ffmpeg(str(input_path), 1800, str(chunk_dir)):
+                seen.append((chunk_path, len(list(chunk_dir.iterdir()))))
+        
+        assert [path for path, _ in seen] == [str(chunk_dir / f"chunk_{i:04d}.mp3") for i in range(3)]
+        # The first chunk was yielded before the last one existed
+        assert seen[0][1] < 3
+    
+    @pytest.mark.asyncio
+    async def test_ffmpeg_failure_raises_http_error(self, tmp_path):
+        """Test a non-zero FFmpeg exit surfaces its stderr as a 500"""
+        input_path = tmp_path / "in.mp3"
+        input_path.write_bytes(b"ID3")
+        chunk_dir = tmp_path / "chunks"
+        chunk_dir.mkdir()
+        
+        with _fake_ffmpeg(1, fail=True):
+            with pytest.raises(HTTPException) as exc_info:
+                async for _ in WhisperService.split_audio_with_ffmpeg(str(input_path), 600, str(chunk_dir)):
+                    pass
+        
+        assert exc_info.value.status_code == 500
+        assert "Invalid data found" in exc_info.value.detail
+    
+    @pytest.mark.asyncio
+    async def test_high_bitrate_input_gets_shorter_chunks(self, tmp_path):
+        """Test chunk duration shrinks so stream-copied chunks fit the API limit"""
+        input_path = tmp_path / "in.wav"
+        with open(input_path, "wb") as f:
+            f.truncate(100 * 1024 * 1024)  # Sparse: 100 MB over 20 minutes
+        chunk_dir = tmp_path / "chunks"
+        chunk_dir.mkdir()
+        calls = []
+        
+        with _fake_ffmpeg(1, calls=calls):
+            async for _ in WhisperService.split_audio_with_ffmpeg(str(input_path), 1200, str(chunk_dir)):
+                pass
+        
+        args = calls[0]
+        segment_time = int(args[args.index("-segment_time") + 1])
+        assert segment_time == 270
+        assert segment_time * (100 * 1024 * 1024 / 1200) < WhisperService.MAX_FILE_SIZE
+    
+    @pytest.mark.asyncio
+    async def test_cut_points_become_segment_times(self, tmp_path):
+        """Test explicit cut points replace the fixed segment length"""
+        input_path = tmp_path / "in.mp3"
+        input_path.write_bytes(b"ID3")
+        chunk_dir = tmp_path / "chunks"
+        chunk_dir.mkdir()
+        calls = []
+        
+        with _fake_ffmpeg(3, calls=calls):
+            chunks = [c async for c in WhisperService.split_audio_with_ffmpeg(
+                str(input_path), 1800, str(chunk_dir), [565.5, 1160.0]
+            )]
+        
+        args = calls[0]
+        assert args[args.index("-segment_times") + 1] == "565.500,1160.000"
+        assert "-segment_time" not in args
+        assert len(chunks) == 3
+
+
+class TestFindSilenceCuts:
+    """Tests for WhisperService.find_silence_cuts"""
+    
+    @staticmethod
+    def _fake_silencedetect(logs):
+        """create_subprocess_exec replacement that answers each window's -ss with a canned log"""
+        async def create_subprocess_exec(*args, **kwargs):
+            window_start = float(args[args.index("-ss") + 1])
+            process = Mock(returncode=0)
+            process.communicate = AsyncMock(return_value=(b"", logs.get(window_start, "").encode()))
+            return process
+        
+        return patch(
+            "app.services.whisper_service.asyncio.create_subprocess_exec",
+            side_effect=create_subprocess_exec
+        )
+    
+    @pytest.mark.asyncio
+    async def test_cuts_land_in_pauses_and_keep_chunks_short(self):
+        """Test each cut sits mid-pause, or at its mark when the window has no pause"""
+        logs = {
+            560.0: "[silencedetect @ 0x1] silence_start: 5\n"
+                   "[silencedetect @ 0x1] silence_end: 6 | silence_duration: 1\n",
+            1140.0: "",
+            1720.0: "[silencedetect @ 0x1] silence_start: 19.5\n",
+        }
+        
+        with self._fake_silencedetect(logs):
+            cuts = await WhisperService.find_silence_cuts("in.mp3", 1800, 600)
+        
+        assert cuts == [565.5, 1160.0, 1740.0]
+        bounds = [0.0, *cuts, 1800.0]
+        assert all(b - a <= 600 for a, b in zip(bounds, bounds[1:]))
+    
+    @pytest.mark.asyncio
+    async def test_failure_falls_back_to_fixed_chunks(self):
+        """Test a failed probe returns None instead of failing the transcription"""
+        with patch(
+            "app.services.whisper_service.asyncio.create_subprocess_exec",
+            side_effect=FileNotFoundError("ffmpeg")
+        ):
+            assert await WhisperService.find_silence_cuts("in.mp3", 1800, 600) is None
+
+
+class TestTranscribeFile:
+    """Tests for WhisperService._transcribe_file"""
+    
+    @pytest.mark.asyncio
+    async def test_upload_streams_open_file_with_content_type(self, tmp_path):
+        """Test the SDK receives a file handle to stream, not the file's bytes"""
+        path = tmp_path / "chunk_0000.mp3"
+        path.write_bytes(b"ID3")
+        
+        async def transcribe(name):
+            return " hello "
+        
+        client = _fake_client(transcribe)
+        
+        assert await WhisperService._transcribe_file(client, str(path)) == "hello"
+        name, audio_file, content_type = client.audio.transcriptions.create.call_args.kwargs["file"]
+        assert (name, content_type) == ("chunk_0000.mp3", "audio/mpeg")
+        assert hasattr(audio_file, "read")
+    
+    @pytest.mark.asyncio
+    async def test_model_comes_from_settings(self, tmp_path, monkeypatch):
+        """Test the configured transcription model is requested"""
+        path = tmp_path / "meeting.m4a"
+        path.write_bytes(b"\x00")
+        monkeypatch.setattr("app.services.whisper_service.settings.whisper_model", "gpt-4o-transcribe")
+        
+        async def transcribe(name):
+            return "hello"
+        
+        client = _fake_client(transcribe)
+        await WhisperService._transcribe_file(client, str(path))
+        
+        assert client.audio.transcriptions.create.call_args.kwargs["model"] == "gpt-4o-transcribe"
+
+
+class TestMergeTranscripts:
+    """Tests for WhisperService.merge_transcripts"""
+    
+    def test_joins_in_order_and_skips_silent_chunks(self):
+        """Test empty chunk transcripts don't leave doubled spaces"""
+        assert WhisperService.merge_transcripts(["first part.", "", "second part."]) == "first part. second part."
+
+
+class TestCheckFfmpegAvailable:
+    """Tests for WhisperService.check_ffmpeg_available"""
+    
+    def test_result_is_cached(self, monkeypatch):
+        """Test ffmpeg -version is spawned only once"""
+        monkeypatch.setattr(WhisperService, "_ffmpeg_available", None)
+        
+        with patch("app.services.whisper_service.subprocess.run", side_effect=FileNotFoundError) as run:
+            assert WhisperService.check_ffmpeg_available() is False
+            assert WhisperService.check_ffmpeg_available() is False
+        
+        run.assert_called_once()